@@ -0,0 +1,57 @@
+"""Measure first-render latency of a fresh process with and without a bytecode cache.
+
+Run from the repository root::
+
+    python benchmarks/bench_bytecode_cache.py
+"""
+
+from __future__ import annotations
+
+import statistics
+import subprocess
+import sys
+import tempfile
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+YAML_FILE = ROOT / "demo" / "user_signup.yaml"
+
+CHILD = """
+import sys, time
+import pyformatic
+cache_dir = sys.argv[2] or None
+flow = pyformatic.FormFlow.from_yaml(sys.argv[1], action="/", bytecode_cache_dir=cache_dir)
+start = time.perf_counter()
+for idx in range(flow.num_steps):
+    flow.render(idx)
+print(time.perf_counter() - start)
+"""
+
+
+def first_render(cache_dir: str, runs: int) -> list[float]:
+    """Return first-render timings (seconds) measured in fresh interpreters."""
+    timings = []
+    for _ in range(runs):
+        out = subprocess.run(
+            [sys.executable, "-c", CHILD, str(YAML_FILE), cache_dir],
+            check=True,
+            capture_output=True,
+            text=True,
+            cwd=ROOT,
+        )
+        timings.append(float(out.stdout.strip()))
+    return timings
+
+
+def main(runs: int = 10) -> None:
+    """Print median first-render latency for both configurations."""
+    cold = first_render("", runs)
+    with tempfile.TemporaryDirectory() as cache_dir:
+        first_render(cache_dir, 1)  # populate the cache
+        warm = first_render(cache_dir, runs)
+    print(f"no bytecode cache:   {statistics.median(cold) * 1000:7.2f} ms")
+    print(f"with bytecode cache: {statistics.median(warm) * 1000:7.2f} ms")
+
+
+if __name__ == "__main__":
+    main()
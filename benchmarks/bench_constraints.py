@@ -0,0 +1,71 @@
+"""Compare declarative constraints with equivalent inline validators.
+
+Run from the repository root::
+
+    PYTHONPATH=. python benchmarks/bench_constraints.py
+"""
+
+from __future__ import annotations
+
+import timeit
+
+from pyformatic.step import Step
+
+DECLARATIVE = {
+    "name": "username",
+    "label": "Username",
+    "required": True,
+    "min_length": 3,
+    "max_length": 20,
+    "pattern": r"[a-z0-9_]+",
+}
+
+INLINE = {
+    "name": "username",
+    "label": "Username",
+    "validator": "\n".join(
+        [
+            "import re",
+            "if not value.strip():",
+            "    raise ValidationError('Username required')",
+            "if len(value) < 3:",
+            "    raise ValidationError('Must be at least 3 characters')",
+            "if len(value) > 20:",
+            "    raise ValidationError('Must be at most 20 characters')",
+            "if re.fullmatch(r'[a-z0-9_]+', value) is None:",
+            "    raise ValidationError('Invalid format')",
+            "return value",
+        ]
+    ),
+}
+
+VALUES = ("john_doe", "", "ab", "Not Valid!")
+
+
+def best(stmt: str, namespace: dict, number: int) -> float:
+    """Return the fastest per-call time of ``stmt`` in microseconds."""
+    timer = timeit.Timer(stmt, globals=namespace)
+    return min(timer.repeat(5, number)) / number * 1e6
+
+
+def main() -> None:
+    """Print per-call validation timings for both variants."""
+    runs = 20000
+    for label, field in (("inline validator", INLINE), ("constraints", DECLARATIVE)):
+        step = Step({"name": "s", "fields": [field]}, None, action="/")
+        ref = step.fields["username"]
+        namespace = {"step": step, "values": VALUES, "check": ref.check, "func": ref.validator}
+        full = best(
+            "for v in values: step.validate_field('username', v, {})", namespace, runs
+        ) / len(VALUES)
+        bare = best(
+            "check('john_doe')" if ref.check else "func('john_doe', {})", namespace, runs
+        )
+        print(
+            f"{label:17s}: {full:6.3f} us per validate_field(), "
+            f"{bare:6.3f} us per passing check"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,68 @@
+"""Measure AJAX validation latency as a flow grows.
+
+Run from the repository root::
+
+    PYTHONPATH=. python benchmarks/bench_field_index.py
+"""
+
+from __future__ import annotations
+
+import asyncio
+import timeit
+
+from pyformatic.formflow import FormFlow
+
+NUM_FIELDS = 40
+
+
+class JsonRequest:  # pylint: disable=too-few-public-methods  # mimics a validation request
+    """Minimal request carrying a JSON validation payload."""
+
+    method = "POST"
+    headers = {"content-type": "application/json"}
+
+    def __init__(self, payload: dict) -> None:
+        self.payload = payload
+
+    async def json(self) -> dict:
+        """Return the payload."""
+        return self.payload
+
+
+def make_flow(num_steps: int) -> FormFlow:
+    """Return a flow with ``num_steps`` steps of ``NUM_FIELDS`` fields each."""
+    validator = "if not value:\n    raise ValidationError('Required')\nreturn value"
+    cfg = {
+        "module": None,
+        "steps": [
+            {
+                "name": f"step{s}",
+                "fields": [
+                    {"name": f"s{s}_f{f}", "label": f"Field {f}", "validator": validator}
+                    for f in range(NUM_FIELDS)
+                ],
+            }
+            for s in range(num_steps)
+        ],
+    }
+    return FormFlow.from_config(cfg, action="/")
+
+
+def main() -> None:
+    """Print per-request validation timings for growing flows."""
+    loop = asyncio.new_event_loop()
+    for num_steps in (5, 10, 25, 50):
+        flow = make_flow(num_steps)
+        request = JsonRequest({"field": f"s{num_steps - 1}_f{NUM_FIELDS - 1}", "value": "x"})
+        runs = 20000
+
+        def validate(flow=flow, request=request):
+            loop.run_until_complete(flow.handle_request(request, {}))
+
+        per_call = timeit.timeit(validate, number=runs) / runs * 1e6
+        print(f"{num_steps:3d} steps x {NUM_FIELDS} fields: {per_call:7.2f} us per validation")
+    loop.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,99 @@
+"""Compare startup time of loading flows from YAML and from bundles.
+
+Run from the repository root::
+
+    PYTHONPATH=. python benchmarks/bench_flow_loading.py
+"""
+
+from __future__ import annotations
+
+import tempfile
+from pathlib import Path
+
+import yaml
+
+from timing import best
+
+from pyformatic.bundle import build_bundle, load_bundle
+from pyformatic.codecache import CodeCache
+from pyformatic.formflow import FormFlow
+from pyformatic.loader import load_flow
+
+NUM_FLOWS = 200
+STEPS = 3
+FIELDS = 8
+
+FIELD = """\
+      - name: field_{step}_{field}
+        label: Field {field}
+        required: true
+        max_length: 40
+        validator: |
+          value = value.strip()
+          if value.lower() == "flow {flow}":
+              raise ValidationError("Reserved value")
+          return value
+"""
+
+
+def write_flows(directory: Path) -> list[Path]:
+    """Write ``NUM_FLOWS`` flow files to ``directory``."""
+    paths = []
+    for flow in range(NUM_FLOWS):
+        lines = ["module: null", "steps:"]
+        for step in range(STEPS):
+            lines += [f"  - name: step_{step}", f"    title: Step {step}", "    fields:"]
+            lines += [FIELD.format(flow=flow, step=step, field=field) for field in range(FIELDS)]
+        path = directory / f"flow_{flow}.yaml"
+        path.write_text("\n".join(lines), encoding="utf-8")
+        paths.append(path)
+    return paths
+
+
+def main() -> None:
+    """Print the time taken to parse and build all flows each way."""
+    with tempfile.TemporaryDirectory() as tmp:
+        paths = write_flows(Path(tmp))
+        bundles = [build_bundle(path) for path in paths]
+
+        def parse_safe():
+            for path in paths:
+                yaml.safe_load(path.read_bytes())
+
+        def parse_flow_loader():
+            for path in paths:
+                load_flow(path.read_bytes(), path)
+
+        def parse_bundles():
+            for path in bundles:
+                load_bundle(path)
+
+        def build_safe():
+            cache = CodeCache()
+            for path in paths:
+                FormFlow.from_config(yaml.safe_load(path.read_bytes()), "/", code_cache=cache)
+
+        def build_yaml():
+            cache = CodeCache()
+            for path in paths:
+                FormFlow.from_yaml(str(path), "/", code_cache=cache)
+
+        def build_bundles():
+            cache = CodeCache()
+            for path in bundles:
+                FormFlow.from_bundle(path, "/", code_cache=cache)
+
+        print(f"{NUM_FLOWS} flows, {STEPS * FIELDS} fields each (libyaml: {yaml.__with_libyaml__})")
+        for label, func in (
+            ("parse yaml.safe_load", parse_safe),
+            ("parse FlowLoader", parse_flow_loader),
+            ("parse bundles", parse_bundles),
+            ("build from safe_load", build_safe),
+            ("build from_yaml()", build_yaml),
+            ("build from_bundle()", build_bundles),
+        ):
+            print(f"{label:22s}: {best(func):8.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,66 @@
+"""Compare the Jinja render path with cached render plans.
+
+Run from the repository root::
+
+    PYTHONPATH=. python benchmarks/bench_render_plan.py
+"""
+
+from __future__ import annotations
+
+import sys
+import timeit
+
+import pyformatic
+from pyformatic.templating import registry
+
+
+def make_form(num_fields: int) -> pyformatic.Form:
+    """Return a form with ``num_fields`` text inputs carrying values."""
+    form = pyformatic.Form("bench", action="/submit")
+    for idx in range(num_fields):
+        item = pyformatic.TextInput(name=f"field_{idx}", label=f"Field {idx}")
+        item.value = f"value {idx}"
+        item.message = "Looks good" if idx % 3 else ""
+        item.classes_outer = ["ok"]
+        form.add_item(item)
+    form.add_button(pyformatic.Button(name="submit", label="Submit"))
+    return form
+
+
+def warm_up(display: pyformatic.Display) -> None:
+    """Render until the template and plan caches stop missing."""
+    while True:
+        misses = registry.plan_stats.misses
+        display.get_html()
+        if registry.plan_stats.misses == misses:
+            return
+
+
+def main() -> int:
+    """Print per-render timings for 10, 100 and 1000 fields.
+
+    Returns 1 if render plans are not faster than Jinja at 1000 fields.
+    """
+    speedup = 0.0
+    for num_fields in (10, 100, 1000):
+        form = make_form(num_fields)
+        runs = max(5, 5000 // num_fields)
+        results = {}
+        for label, use_plan in (("jinja", False), ("render plan", True)):
+            display = pyformatic.Display(form, render_plan=use_plan)
+            warm_up(display)
+            elapsed = timeit.timeit(display.get_html, number=runs)
+            results[label] = elapsed / runs * 1000
+        speedup = results["jinja"] / results["render plan"]
+        print(
+            f"{num_fields:5d} fields: jinja {results['jinja']:8.3f} ms  "
+            f"plan {results['render plan']:8.3f} ms  ({speedup:.1f}x)"
+        )
+    if speedup <= 1.0:
+        print("render plans are slower than Jinja at 1000 fields", file=sys.stderr)
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
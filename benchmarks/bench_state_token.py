@@ -0,0 +1,76 @@
+"""Compare hidden inputs with a signed state token for carried flow data.
+
+Run from the repository root::
+
+    PYTHONPATH=. python benchmarks/bench_state_token.py
+"""
+
+from __future__ import annotations
+
+import timeit
+from urllib.parse import urlencode
+
+from pyformatic.formflow import FormFlow
+from pyformatic.signing import STATE_FIELD
+
+NUM_FIELDS = 10
+
+
+def make_config(num_steps: int) -> dict:
+    """Return a flow definition with ``num_steps`` steps of text fields."""
+    return {
+        "module": None,
+        "steps": [
+            {
+                "name": f"step{s}",
+                "fields": [
+                    {"name": f"s{s}_f{f}", "label": f"Field {f}"} for f in range(NUM_FIELDS)
+                ],
+            }
+            for s in range(num_steps)
+        ],
+    }
+
+
+def carried_data(num_steps: int) -> dict:
+    """Return answers for every step but the last."""
+    return {
+        f"s{s}_f{f}": f"answer {s}-{f} with some text"
+        for s in range(num_steps - 1)
+        for f in range(NUM_FIELDS)
+    }
+
+
+def main() -> None:
+    """Print page size, request size and per-request time for both modes."""
+    for num_steps in (5, 20, 50):
+        cfg = make_config(num_steps)
+        data = carried_data(num_steps)
+        last = num_steps - 1
+        for label, options in (
+            ("hidden", {}),
+            ("token", {"secret_key": "bench", "state_token": True}),
+        ):
+            flow = FormFlow.from_config(cfg, "/", **options)
+            html = flow.render(last, data_store=data)
+            if flow.state_signer is None:
+                posted = data
+            else:
+                posted = {STATE_FIELD: flow.encode_state(data)}
+
+            def roundtrip(flow=flow, posted=posted, last=last, data=data):
+                flow.render(last, data_store=data)
+                if STATE_FIELD in posted:
+                    flow.decode_state(posted[STATE_FIELD])
+
+            roundtrip()  # warm template caches
+            runs = 500
+            per_call = timeit.timeit(roundtrip, number=runs) / runs * 1000
+            print(
+                f"{num_steps:3d} steps {label:6s}: page {len(html):7d} B  "
+                f"request {len(urlencode(posted)):6d} B  {per_call:6.3f} ms"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,75 @@
+"""Compare per-value and column-at-a-time validation of a large batch.
+
+Run from the repository root::
+
+    PYTHONPATH=. python benchmarks/bench_validate_many.py
+"""
+
+from __future__ import annotations
+
+import re
+
+from timing import best
+
+from pyformatic.exceptions import ValidationError
+from pyformatic.step import Step
+
+ROWS = 100_000
+CODE = re.compile(r"[A-Z]{2}\d{4}")
+
+
+class Validator:
+    """Same check in per-value and batch form."""
+
+    def code(self, value):
+        """Validate one code."""
+        value = value.strip().upper()
+        if CODE.fullmatch(value) is None:
+            raise ValidationError("Invalid code", value)
+        return value
+
+    def validate_many_code(self, values, _data_columns):
+        """Validate a column of codes."""
+        cleaned = [value.strip().upper() for value in values]
+        match = CODE.fullmatch
+        levels = ["ok" if match(value) else "error" for value in cleaned]
+        messages = ["" if level == "ok" else "Invalid code" for level in levels]
+        return cleaned, levels, messages
+
+
+class PerValueValidator:  # pylint: disable=too-few-public-methods  # per-value form only
+    """Validator without a batch form."""
+
+    code = Validator.code
+
+
+def build(validator) -> Step:
+    """Return a step validating ``code`` with ``validator``."""
+    step = Step({"name": "s", "fields": [{"name": "code"}]}, None, action="/")
+    step.validator = validator
+    step.reindex()
+    return step
+
+
+def main() -> None:
+    """Print the time to validate ``ROWS`` values each way."""
+    values = [f" ab{i % 10000:04d} " if i % 10 else "bad" for i in range(ROWS)]
+    columns = {"code": values}
+    batch = build(Validator())
+    per_value = build(PerValueValidator())
+
+    def each_field():
+        for value in values:
+            per_value.validate_field("code", value, {})
+
+    print(f"{ROWS} values")
+    for label, func in (
+        ("validate_field() loop", each_field),
+        ("validate_many() per value", lambda: per_value.validate_many("code", values, columns)),
+        ("validate_many() batch", lambda: batch.validate_many("code", values, columns)),
+    ):
+        print(f"{label:26s}: {best(func):8.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
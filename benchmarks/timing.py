@@ -0,0 +1,16 @@
+"""Timing helper shared by the benchmark scripts."""
+
+from __future__ import annotations
+
+import time
+from typing import Callable
+
+
+def best(func: Callable[[], object], repeat: int = 3) -> float:
+    """Return the fastest of ``repeat`` runs of ``func`` in milliseconds."""
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        timings.append(time.perf_counter() - start)
+    return min(timings) * 1e3
@@ -126,6 +126,7 @@ async def signup_python_demo(request: Request):
                     "type": "email",
                     "label": "Email Address",
                     "required": True,
+                    "messages": {"required": "Email required"},
                     "validator": (
                         "cleaned = value.strip()\n"
                         "if not cleaned:\n"
@@ -148,6 +149,7 @@ async def signup_python_demo(request: Request):
                     "type": "checkbox",
                     "label": "I agree to the terms and conditions",
                     "required": True,
+                    "messages": {"required": "You must agree to the terms"},
                 },
                 {
                     "name": "marketing",
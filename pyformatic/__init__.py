@@ -5,8 +5,10 @@ from .elements import TextInput, Button, RawInput, RawElement
 from .display import Display
 from .csrf import ensure_csrf_token, validate_csrf_token
 from .formflow import FormFlow
+from .flow_registry import FlowRegistry
 from .flow_runner import run_form_flow
 from .exceptions import (
+    FlowConfigError,
     ValidationError,
     ValidationInfo,
     ValidationWarning,
@@ -22,7 +24,9 @@ __all__ = [
     "RawElement",
     "Display",
     "FormFlow",
+    "FlowRegistry",
     "run_form_flow",
+    "FlowConfigError",
     "ValidationError",
     "ValidationInfo",
     "ValidationWarning",
@@ -0,0 +1,5 @@
+"""Entry point for ``python -m pyformatic``."""
+
+from .cli import main
+
+raise SystemExit(main())
@@ -0,0 +1,162 @@
+"""Build and serve fingerprinted, precompressed static assets."""
+
+from __future__ import annotations
+
+import gzip
+import hashlib
+import json
+import mimetypes
+import re
+from importlib import resources
+from pathlib import Path
+from typing import Any, Awaitable, Callable, Mapping
+
+ASSETS = ("pyformatic.css", "pyformatic.js")
+MANIFEST_NAME = "manifest.json"
+
+_CSS_COMMENT = re.compile(r"/\*.*?\*/", re.S)
+_CSS_SPACE = re.compile(r"\s+")
+_CSS_PUNCT = re.compile(r"\s*([{};,>])\s*")
+
+
+def builtin_static_dir() -> Path:
+    """Return the directory holding the bundled CSS and JavaScript."""
+    return Path(str(resources.files(__package__) / "static"))
+
+
+def minify_css(text: str) -> str:
+    """Return ``text`` without comments and redundant whitespace."""
+    text = _CSS_COMMENT.sub("", text)
+    text = _CSS_SPACE.sub(" ", text)
+    text = _CSS_PUNCT.sub(r"\1", text)
+    text = re.sub(r":\s+", ":", text)
+    return text.replace(";}", "}").strip()
+
+
+def minify_js(text: str) -> str:
+    """Return ``text`` without indentation, blank lines and comment lines.
+
+    Only whole-line ``//`` comments are removed and line breaks are kept,
+    so statements relying on automatic semicolon insertion are unaffected.
+    """
+    lines = []
+    for line in text.splitlines():
+        stripped = line.strip()
+        if stripped and not stripped.startswith("//"):
+            lines.append(stripped)
+    return "\n".join(lines) + "\n"
+
+
+_MINIFIERS: dict[str, Callable[[str], str]] = {".css": minify_css, ".js": minify_js}
+
+
+def build_assets(
+    out_dir: str | Path,
+    static_dir: str | Path | None = None,
+) -> dict[str, str]:
+    """Write minified, content-hashed and gzipped assets to ``out_dir``.
+
+    For every bundled asset ``name.ext`` this writes ``name.<hash>.ext`` and
+    ``name.<hash>.ext.gz`` plus a ``manifest.json`` mapping the logical name
+    to the fingerprinted one. The manifest is returned.
+    """
+    source = Path(static_dir) if static_dir else builtin_static_dir()
+    target = Path(out_dir)
+    target.mkdir(parents=True, exist_ok=True)
+    manifest: dict[str, str] = {}
+    for name in ASSETS:
+        path = source / name
+        minify = _MINIFIERS.get(path.suffix, lambda text: text)
+        data = minify(path.read_text(encoding="utf-8")).encode("utf-8")
+        digest = hashlib.sha256(data).hexdigest()[:12]
+        hashed = f"{path.stem}.{digest}{path.suffix}"
+        (target / hashed).write_bytes(data)
+        (target / f"{hashed}.gz").write_bytes(gzip.compress(data, 9, mtime=0))
+        manifest[name] = hashed
+    (target / MANIFEST_NAME).write_text(
+        json.dumps(manifest, indent=2, sort_keys=True), encoding="utf-8"
+    )
+    return manifest
+
+
+def load_manifest(path: str | Path) -> dict[str, str]:
+    """Return the manifest stored at ``path`` (a file or its directory)."""
+    path = Path(path)
+    if path.is_dir():
+        path = path / MANIFEST_NAME
+    return json.loads(path.read_text(encoding="utf-8"))
+
+
+Scope = Mapping[str, Any]
+Receive = Callable[[], Awaitable[Mapping[str, Any]]]
+Send = Callable[[Mapping[str, Any]], Awaitable[None]]
+
+
+class StaticAssets:  # pylint: disable=too-few-public-methods  # ASGI application
+    """Minimal ASGI app serving a directory built by :func:`build_assets`.
+
+    Files named in the manifest are served with a long-lived ``immutable``
+    cache header. When the client accepts gzip and a ``.gz`` sibling exists,
+    the precompressed variant is sent instead.
+    """
+
+    def __init__(self, directory: str | Path, *, max_age: int = 31536000) -> None:
+        self.directory = Path(directory).resolve()
+        self.max_age = max_age
+        manifest_file = self.directory / MANIFEST_NAME
+        self.fingerprinted = (
+            set(load_manifest(manifest_file).values()) if manifest_file.exists() else set()
+        )
+
+    def _resolve(self, scope: Scope) -> Path | None:
+        path = scope.get("path", "")
+        root = scope.get("root_path", "")
+        if root and path.startswith(root):
+            path = path[len(root):]
+        candidate = (self.directory / path.lstrip("/")).resolve()
+        if self.directory not in candidate.parents or not candidate.is_file():
+            return None
+        return candidate
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            return
+        path = self._resolve(scope) if scope.get("method") in {"GET", "HEAD"} else None
+        if path is None:
+            await self._respond(send, 404, [(b"content-type", b"text/plain")], b"Not Found")
+            return
+        headers = dict(scope.get("headers") or [])
+        accept = headers.get(b"accept-encoding", b"").decode("latin-1")
+        content_type = mimetypes.guess_type(path.name)[0] or "application/octet-stream"
+        if path.suffix in {".css", ".js"}:
+            content_type += "; charset=utf-8"
+        response_headers = [
+            (b"content-type", content_type.encode("latin-1")),
+            (b"vary", b"accept-encoding"),
+        ]
+        if path.name in self.fingerprinted:
+            cache = f"public, max-age={self.max_age}, immutable"
+        else:
+            cache = "no-cache"
+        response_headers.append((b"cache-control", cache.encode("latin-1")))
+        compressed = path.with_name(path.name + ".gz")
+        if "gzip" in accept and compressed.is_file():
+            path = compressed
+            response_headers.append((b"content-encoding", b"gzip"))
+        body = path.read_bytes()
+        if scope.get("method") == "HEAD":
+            response_headers.append((b"content-length", str(len(body)).encode()))
+            body = b""
+        await self._respond(send, 200, response_headers, body)
+
+    @staticmethod
+    async def _respond(
+        send: Send,
+        status: int,
+        headers: list[tuple[bytes, bytes]],
+        body: bytes,
+    ) -> None:
+        if not any(name == b"content-length" for name, _ in headers):
+            headers = [*headers, (b"content-length", str(len(body)).encode())]
+        await send({"type": "http.response.start", "status": status, "headers": headers})
+        await send({"type": "http.response.body", "body": body})
@@ -0,0 +1,185 @@
+"""Validate large record sets offline with a flow's validators."""
+
+from __future__ import annotations
+
+import asyncio
+import csv
+import json
+import os
+from collections import deque
+from concurrent.futures import Future, ProcessPoolExecutor
+from itertools import islice
+from pathlib import Path
+from typing import IO, Any, Iterable, Iterator, Mapping
+
+from .bundle import BUNDLE_SUFFIX
+from .formflow import FormFlow
+from .step import EMPTY_FIELD
+
+LEVELS = ("ok", "info", "warning", "error")
+
+# The flow used by this worker process, set by ``_init_worker``.
+_WORKER: dict[str, FormFlow] = {}
+
+
+def read_records(path: str | os.PathLike) -> Iterator[dict[str, Any]]:
+    """Yield the records of a ``.csv`` or JSON lines file one at a time.
+
+    CSV files need a header row. Blank JSON lines are skipped; lines that
+    are not JSON objects raise :class:`ValueError`.
+    """
+    with open(path, "r", encoding="utf-8", newline="") as fh:
+        if Path(path).suffix.lower() == ".csv":
+            yield from csv.DictReader(fh)
+            return
+        for lineno, line in enumerate(fh, 1):
+            if not line.strip():
+                continue
+            record = json.loads(line)
+            if not isinstance(record, dict):
+                raise ValueError(f"{path}:{lineno}: expected a JSON object")
+            yield record
+
+
+def load_flow_file(path: str | os.PathLike, action: str = "/", **options: Any) -> FormFlow:
+    """Return the flow defined by a YAML file or a ``.bundle``."""
+    if Path(path).suffix == BUNDLE_SUFFIX:
+        return FormFlow.from_bundle(path, action, **options)
+    return FormFlow.from_yaml(str(path), action, **options)
+
+
+def _columns(rows: list[dict[str, Any]]) -> dict[str, list[Any]]:
+    """Return the values of ``rows`` as columns, using ``""`` for gaps."""
+    keys = dict.fromkeys(key for data in rows for key in data)
+    return {key: [data.get(key, "") for data in rows] for key in keys}
+
+
+def _note(messages: dict[str, dict], name: str, level: str | None, text: str) -> None:
+    """Record the message for ``name`` unless it passed cleanly."""
+    if level and level != "ok":
+        messages[name] = {"level": level, "message": text}
+
+
+def _validate_chunk_rows(
+    flow: FormFlow,
+    rows: list[dict[str, Any]],
+    loop: asyncio.AbstractEventLoop,
+) -> list[dict[str, dict]]:
+    """Validate ``rows`` in place and return each row's messages.
+
+    Steps are validated a column at a time with
+    :meth:`Step.validate_many`, or :meth:`Step.validate_many_async` for
+    fields with ``async def`` validators.
+    """
+    found: list[dict[str, dict]] = [{} for _ in rows]
+    for step in flow.steps:
+        columns = _columns(rows)
+        for name in step.field_names:
+            values = [data.get(name, "") for data in rows]
+            if step.fields.get(name, EMPTY_FIELD).is_async:
+                cleaned, levels, texts = loop.run_until_complete(
+                    step.validate_many_async(name, values, columns, data_rows=rows)
+                )
+            else:
+                cleaned, levels, texts = step.validate_many(name, values, columns, data_rows=rows)
+            columns[name] = cleaned
+            for i, data in enumerate(rows):
+                data[name] = cleaned[i]
+                _note(found[i], name, levels[i], texts[i])
+    return found
+
+
+def validate_records(
+    flow: FormFlow,
+    records: Iterable[Mapping[str, Any]],
+    *,
+    start: int = 1,
+    chunk_size: int = 500,
+) -> Iterator[dict[str, Any]]:
+    """Validate ``records`` with every step of ``flow`` in this process.
+
+    Yields one result per record with its ``row`` number (counted from
+    ``start``), the most severe ``level``, the ``messages`` of fields that
+    did not pass cleanly and the cleaned ``values``. All steps are
+    validated even if an earlier one fails, and ``async def`` validators
+    are awaited. Records are read ``chunk_size`` at a time and validated
+    a field at a time, so ``validate_many_<field>`` batch validators
+    receive a whole chunk per call.
+    """
+    loop = asyncio.new_event_loop()
+    rows = iter(records)
+    try:
+        while chunk := [dict(record) for record in islice(rows, chunk_size)]:
+            for data, messages in zip(chunk, _validate_chunk_rows(flow, chunk, loop)):
+                level = max(
+                    (meta["level"] for meta in messages.values()), key=LEVELS.index, default="ok"
+                )
+                yield {"row": start, "level": level, "messages": messages, "values": data}
+                start += 1
+    finally:
+        loop.close()
+
+
+def _init_worker(path: str, action: str, options: dict[str, Any]) -> None:
+    _WORKER["flow"] = load_flow_file(path, action, warmup=True, **options)
+
+
+def _validate_chunk(start: int, records: list[dict[str, Any]]) -> list[dict[str, Any]]:
+    return list(
+        validate_records(_WORKER["flow"], records, start=start, chunk_size=len(records))
+    )
+
+
+def validate_bulk(  # pylint: disable=too-many-arguments  # pool tuning knobs
+    flow_path: str | os.PathLike,
+    records: Iterable[Mapping[str, Any]],
+    *,
+    action: str = "/",
+    chunk_size: int = 500,
+    workers: int | None = None,
+    **options: Any,
+) -> Iterator[dict[str, Any]]:
+    """Validate ``records`` with the flow at ``flow_path`` in worker processes.
+
+    Records are read lazily and sent to ``workers`` processes (default:
+    one per CPU) in chunks of ``chunk_size``; ``workers=0`` validates in
+    this process. Results are yielded in input order as described for
+    :func:`validate_records`. At most two chunks per worker are in flight,
+    so memory use does not grow with the number of records. ``options``
+    are passed to :meth:`FormFlow.from_yaml` or
+    :meth:`FormFlow.from_bundle` in every worker.
+    """
+    if chunk_size < 1:
+        raise ValueError("chunk_size must be at least 1")
+    if workers == 0:
+        flow = load_flow_file(flow_path, action, **options)
+        yield from validate_records(flow, records, chunk_size=chunk_size)
+        return
+    workers = workers or os.cpu_count() or 1
+    pool = ProcessPoolExecutor(
+        workers,
+        initializer=_init_worker,
+        initargs=(os.fspath(flow_path), action, options),
+    )
+    pending: deque[Future] = deque()
+    rows = iter(records)
+    start = 1
+    try:
+        while chunk := list(islice(rows, chunk_size)):
+            pending.append(pool.submit(_validate_chunk, start, chunk))
+            start += len(chunk)
+            if len(pending) >= 2 * workers:
+                yield from pending.popleft().result()
+        while pending:
+            yield from pending.popleft().result()
+    finally:
+        pool.shutdown(cancel_futures=True)
+
+
+def write_results(results: Iterable[Mapping[str, Any]], out: IO[str]) -> dict[str, int]:
+    """Write ``results`` to ``out`` as JSON lines and return level counts."""
+    counts = dict.fromkeys(LEVELS, 0)
+    for result in results:
+        counts[result["level"]] += 1
+        out.write(json.dumps(result, default=str) + "\n")
+    return counts
@@ -0,0 +1,127 @@
+"""Precompiled flow bundles that load without parsing YAML."""
+
+from __future__ import annotations
+
+import hashlib
+import marshal
+import os
+from importlib.util import MAGIC_NUMBER
+from pathlib import Path
+from types import CodeType
+from typing import Any
+
+from .codecache import CodeCache, source_name, validator_source
+from .exceptions import FlowConfigError
+from .loader import LineDict, inline_validators, load_flow
+
+BUNDLE_SUFFIX = ".bundle"
+BUNDLE_VERSION = 1
+_HEADER = b"PYFORMATIC-BUNDLE\n"
+_SCALARS = (str, int, float, bool, bytes, type(None))
+
+
+def _encode(value: Any, source: str) -> Any:
+    """Return ``value`` in a form ``marshal`` can store.
+
+    :class:`LineDict` mappings become ``(mapping, lines)`` tuples; YAML
+    never produces tuples itself.
+    """
+    if isinstance(value, dict):
+        mapping = {key: _encode(item, source) for key, item in value.items()}
+        return (mapping, dict(value.lines)) if isinstance(value, LineDict) else mapping
+    if isinstance(value, list):
+        return [_encode(item, source) for item in value]
+    if isinstance(value, _SCALARS):
+        return value
+    raise FlowConfigError(f"cannot bundle a value of type {type(value).__name__}", source=source)
+
+
+def _decode(value: Any) -> Any:
+    if isinstance(value, tuple):
+        mapping, lines = value
+        result = LineDict((key, _decode(item)) for key, item in mapping.items())
+        result.lines.update(lines)
+        return result
+    if isinstance(value, dict):
+        return {key: _decode(item) for key, item in value.items()}
+    if isinstance(value, list):
+        return [_decode(item) for item in value]
+    return value
+
+
+def _is_stale(source: str, digest: str) -> bool:
+    """Return True if the flow file ``source`` exists and no longer matches ``digest``."""
+    try:
+        with open(source, "rb") as fh:
+            data = fh.read()
+    except OSError:
+        return False
+    return hashlib.sha256(data).hexdigest() != digest
+
+
+def build_bundle(
+    yaml_path: str | os.PathLike,
+    target: str | os.PathLike | None = None,
+) -> Path:
+    """Write the flow at ``yaml_path`` as a bundle and return its path.
+
+    The bundle holds the parsed configuration, the compiled code of its
+    inline validators and a digest of the flow file, serialized with
+    ``marshal``. It
+    can only be loaded by the Python version that built it. ``target``
+    defaults to ``yaml_path`` with the suffix ``.bundle``.
+    """
+    source = source_name(yaml_path)
+    with open(yaml_path, "rb") as fh:
+        data = fh.read()
+    cfg = load_flow(data, source)
+    cache = CodeCache(maxsize=0)
+    code: dict[str, CodeType] = {}
+    for name, spec, line in inline_validators(cfg):
+        text = str(spec)
+        code[CodeCache.key(validator_source(text, line), source)] = cache.compile_validator(
+            text, name, line, source
+        )
+    payload = {
+        "version": BUNDLE_VERSION,
+        "source": source,
+        "digest": hashlib.sha256(data).hexdigest(),
+        "config": _encode(cfg, source),
+        "code": code,
+    }
+    path = Path(target) if target is not None else Path(yaml_path).with_suffix(BUNDLE_SUFFIX)
+    tmp = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+    tmp.write_bytes(_HEADER + MAGIC_NUMBER + marshal.dumps(payload))
+    os.replace(tmp, path)
+    return path
+
+
+def load_bundle(path: str | os.PathLike) -> dict[str, Any]:
+    """Return the contents of the bundle at ``path``.
+
+    The result has the keys ``source`` (the flow file it was built from),
+    ``digest`` (SHA-256 of that file), ``config`` and ``code`` (compiled
+    validators keyed by :meth:`CodeCache.key`). Bundles from another
+    pyformatic or Python version, and bundles whose flow file still exists
+    but has changed since, raise :class:`FlowConfigError`.
+    """
+    with open(path, "rb") as fh:
+        data = fh.read()
+    start = len(_HEADER) + len(MAGIC_NUMBER)
+    if not data.startswith(_HEADER):
+        raise FlowConfigError("not a flow bundle", source=path)
+    if data[len(_HEADER):start] != MAGIC_NUMBER:
+        raise FlowConfigError("bundle was built by another Python version; rebuild it", source=path)
+    try:
+        payload = marshal.loads(data[start:])
+    except (EOFError, ValueError, TypeError) as exc:
+        raise FlowConfigError("corrupt flow bundle", source=path) from exc
+    if payload.get("version") != BUNDLE_VERSION:
+        raise FlowConfigError("unsupported bundle version; rebuild it", source=path)
+    if _is_stale(payload["source"], payload["digest"]):
+        raise FlowConfigError(
+            f"flow file {payload['source']} changed since the bundle was built; rebuild it",
+            source=path,
+        )
+    payload["config"] = _decode(payload["config"])
+    return payload
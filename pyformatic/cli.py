@@ -0,0 +1,151 @@
+"""Command line interface, available as ``python -m pyformatic``."""
+
+from __future__ import annotations
+
+import argparse
+import os
+import sys
+from pathlib import Path
+from typing import Sequence
+
+from .assets import build_assets
+from .bulk import read_records, validate_bulk, write_results
+from .bundle import BUNDLE_SUFFIX, build_bundle
+from .exceptions import FlowConfigError
+from .templating import compile_templates
+
+
+def _cmd_compile(args: argparse.Namespace) -> int:
+    """Precompile templates into a bundle."""
+    compile_templates(
+        args.target,
+        args.template_dirs,
+        zip_bundle=args.format == "zip",
+        log_function=print if args.verbose else None,
+    )
+    print(f"Compiled templates written to {args.target}")
+    return 0
+
+
+def _cmd_assets(args: argparse.Namespace) -> int:
+    """Build fingerprinted, precompressed static assets."""
+    manifest = build_assets(args.out_dir, args.static_dir)
+    for name, hashed in sorted(manifest.items()):
+        print(f"{name} -> {hashed}")
+    return 0
+
+
+def _cmd_bundle(args: argparse.Namespace) -> int:
+    """Precompile flow YAML files into bundles."""
+    status = 0
+    for flow in args.flows:
+        target = None
+        if args.out_dir:
+            os.makedirs(args.out_dir, exist_ok=True)
+            target = Path(args.out_dir, Path(flow).stem + BUNDLE_SUFFIX)
+        try:
+            path = build_bundle(flow, target)
+        except FlowConfigError as exc:
+            print(f"error: {exc}", file=sys.stderr)
+            status = 1
+            continue
+        print(f"{flow} -> {path}")
+    return status
+
+
+def _cmd_validate_bulk(args: argparse.Namespace) -> int:
+    """Validate a CSV or JSON lines file with a flow's validators."""
+    results = validate_bulk(
+        args.flow,
+        read_records(args.data),
+        chunk_size=args.chunk_size,
+        workers=args.workers,
+    )
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as out:
+            counts = write_results(results, out)
+    else:
+        counts = write_results(results, sys.stdout)
+    summary = ", ".join(f"{count} {level}" for level, count in counts.items())
+    print(f"{sum(counts.values())} rows: {summary}", file=sys.stderr)
+    return 1 if counts["error"] else 0
+
+
+def build_parser() -> argparse.ArgumentParser:
+    """Return the argument parser for all sub-commands."""
+    parser = argparse.ArgumentParser(prog="python -m pyformatic")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    compile_cmd = commands.add_parser(
+        "compile",
+        help="precompile templates for use with compiled_templates",
+    )
+    compile_cmd.add_argument("target", help="output zip file or directory")
+    compile_cmd.add_argument(
+        "-t",
+        "--template-dir",
+        dest="template_dirs",
+        action="append",
+        default=[],
+        help="additional template directory (may be repeated, first wins)",
+    )
+    compile_cmd.add_argument(
+        "--format",
+        choices=["zip", "modules"],
+        default="zip",
+        help="write a zip file (default) or a directory of Python modules",
+    )
+    compile_cmd.add_argument("-v", "--verbose", action="store_true")
+    compile_cmd.set_defaults(func=_cmd_compile)
+
+    assets_cmd = commands.add_parser(
+        "assets",
+        help="write minified, fingerprinted and gzipped CSS/JS with a manifest",
+    )
+    assets_cmd.add_argument("out_dir", help="output directory")
+    assets_cmd.add_argument(
+        "--static-dir",
+        help="read pyformatic.css/pyformatic.js from here instead of the package",
+    )
+    assets_cmd.set_defaults(func=_cmd_assets)
+
+    bundle_cmd = commands.add_parser(
+        "bundle",
+        help="precompile flow YAML files for FormFlow.from_bundle",
+    )
+    bundle_cmd.add_argument("flows", nargs="+", help="flow YAML files")
+    bundle_cmd.add_argument(
+        "-o",
+        "--out-dir",
+        help="write bundles here instead of next to each flow file",
+    )
+    bundle_cmd.set_defaults(func=_cmd_bundle)
+
+    bulk_cmd = commands.add_parser(
+        "validate-bulk",
+        help="validate CSV or JSON lines records with a flow's validators",
+    )
+    bulk_cmd.add_argument("flow", help="flow YAML file or bundle")
+    bulk_cmd.add_argument("data", help=".csv file with a header row or JSON lines file")
+    bulk_cmd.add_argument("-o", "--output", help="write JSON lines results here (default: stdout)")
+    bulk_cmd.add_argument(
+        "--chunk-size",
+        type=int,
+        default=500,
+        help="records sent to a worker at a time (default: 500)",
+    )
+    bulk_cmd.add_argument(
+        "-j",
+        "--workers",
+        type=int,
+        default=None,
+        help="worker processes (default: one per CPU, 0 to run in-process)",
+    )
+    bulk_cmd.set_defaults(func=_cmd_validate_bulk)
+    return parser
+
+
+def main(argv: Sequence[str] | None = None) -> int:
+    """Run the command line interface and return the exit status."""
+    args = build_parser().parse_args(argv)
+    return args.func(args)
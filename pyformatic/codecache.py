@@ -0,0 +1,144 @@
+"""Cache of compiled inline validator code."""
+
+from __future__ import annotations
+
+import hashlib
+import marshal
+import os
+from importlib.util import MAGIC_NUMBER
+from pathlib import Path
+from threading import Lock
+from types import CodeType
+from typing import Mapping
+
+from .cache import CacheStats, LRUCache
+from .exceptions import FlowConfigError
+
+
+def validator_source(code: str, line: int | None = None) -> str:
+    """Return the function source for inline validator ``code``.
+
+    Leading blank lines put the body on its lines in the flow file, where
+    it starts at ``line``, so syntax errors and tracebacks point there.
+    """
+    body = "\n".join(f"    {text}" for text in code.splitlines())
+    return "\n" * max((line or 0) - 2, 0) + "def _v(value, data_store):\n" + body
+
+
+def source_name(source: str | os.PathLike | None) -> str:
+    """Return the file name used to compile validators from ``source``."""
+    return os.fspath(source) if source is not None else "<validator>"
+
+
+class CodeCache:
+    """Keep code objects compiled from validator source.
+
+    Code is keyed by a SHA-256 hash of the source, its file name and the
+    interpreter's bytecode version, so a source string is compiled at most
+    once per process. With a ``directory`` the code is also stored there in
+    ``marshal`` format and shared between processes and restarts. Syntax
+    errors are not cached.
+    """
+
+    def __init__(self, directory: str | os.PathLike | None = None, *, maxsize: int = 1024) -> None:
+        self.directory = Path(directory) if directory is not None else None
+        self._memory = LRUCache(maxsize)
+        self._lock = Lock()
+        self.disk_hits = 0
+        if self.directory is not None:
+            self.directory.mkdir(parents=True, exist_ok=True)
+
+    @property
+    def stats(self) -> CacheStats:
+        """Return the hit and miss counters of the in-memory cache."""
+        return self._memory.stats
+
+    @staticmethod
+    def key(source: str, filename: str) -> str:
+        """Return the cache key for ``source`` compiled as ``filename``."""
+        digest = hashlib.sha256(MAGIC_NUMBER)
+        digest.update(filename.encode("utf-8", "surrogatepass") + b"\0")
+        digest.update(source.encode("utf-8", "surrogatepass"))
+        return digest.hexdigest()
+
+    def compile(self, source: str, filename: str = "<validator>") -> CodeType:
+        """Return ``source`` compiled in ``exec`` mode.
+
+        Raises :class:`SyntaxError` like :func:`compile`.
+        """
+        key = self.key(source, filename)
+        code = self._memory.get(key)
+        if code is not None:
+            return code
+        code = self._load(key)
+        if code is None:
+            code = compile(source, filename, "exec", dont_inherit=True)
+            self._store(key, code)
+        self._memory.set(key, code)
+        return code
+
+    def compile_validator(
+        self,
+        code: str,
+        name: str,
+        line: int | None = None,
+        source: str | os.PathLike | None = None,
+    ) -> CodeType:
+        """Return inline validator ``code`` compiled for flow file ``source``.
+
+        Syntax errors raise :class:`FlowConfigError` with the file and line.
+        """
+        try:
+            return self.compile(validator_source(code, line), source_name(source))
+        except SyntaxError as exc:
+            raise FlowConfigError(
+                f"invalid validator {name!r}: {exc.msg}",
+                source=source,
+                line=exc.lineno if line else None,
+            ) from exc
+
+    def _path(self, key: str) -> Path:
+        assert self.directory is not None
+        return self.directory / f"{key}.marshal"
+
+    def _load(self, key: str) -> CodeType | None:
+        if self.directory is None:
+            return None
+        try:
+            data = self._path(key).read_bytes()
+        except OSError:
+            return None
+        if not data.startswith(MAGIC_NUMBER):
+            return None
+        try:
+            code = marshal.loads(data[len(MAGIC_NUMBER):])
+        except (EOFError, ValueError, TypeError):
+            return None
+        if not isinstance(code, CodeType):
+            return None
+        with self._lock:
+            self.disk_hits += 1
+        return code
+
+    def _store(self, key: str, code: CodeType) -> None:
+        if self.directory is None:
+            return
+        path = self._path(key)
+        tmp = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+        try:
+            tmp.write_bytes(MAGIC_NUMBER + marshal.dumps(code))
+            os.replace(tmp, path)
+        except OSError:
+            tmp.unlink(missing_ok=True)
+
+    def update(self, codes: Mapping[str, CodeType]) -> None:
+        """Add code objects keyed by :meth:`key`, e.g. from a bundle."""
+        for key, code in codes.items():
+            self._memory.set(key, code)
+
+    def clear(self) -> None:
+        """Drop all in-memory entries; files on disk are kept."""
+        self._memory.clear()
+
+
+default_cache = CodeCache()
@@ -2,45 +2,97 @@
 
 from __future__ import annotations
 
-from importlib import resources
-
-from typing import Mapping
+import asyncio
+from dataclasses import astuple
+from os import PathLike
+from typing import Any, Callable, Iterator, Mapping
 from markupsafe import escape
-from jinja2 import (
-    Environment,
-    FileSystemLoader,
-    TemplateNotFound,
-    select_autoescape,
-)
+from jinja2 import Environment, Template
 
+from .assets import load_manifest
 from .form import Form
 from .elements import InputElement, RawInput, RawElement
+from .render_plan import build_plan, split_render, static_key
+from .state import FormState
+from .templating import bytecode_cache, registry
+
+# Slots of an item template that change between requests, and whether
+# their values are escaped.
+_ITEM_SLOTS = {
+    "item_value": True,
+    "item_message": True,
+    "item_outer_classes": True,
+    "item_input_classes": True,
+}
+_FORM_SLOTS = {"form_items": False, "buttons": False, "form_action": True}
+# Input types whose markup depends on the value (``checked``/``selected``)
+# are always rendered through Jinja.
+_VALUE_STRUCTURAL = frozenset({"checkbox", "radio", "switch", "select"})
+
+
+def _cache_key(context: Mapping[str, Any], slots: Mapping[str, bool]) -> tuple | None:
+    """Return the static key of ``context`` or ``None`` if it is unhashable."""
+    key = static_key(context, slots)
+    try:
+        hash(key)
+    except TypeError:
+        return None
+    return key
 
 
 class Display:
     """Renders a form to HTML."""
 
     static_url = "/static"
+    asset_manifest: Mapping[str, str] = {}
 
     @classmethod
-    def header_html(cls, static_url: str | None = None) -> str:
-        """Return ``<link>`` tags for required assets."""
+    def use_asset_manifest(cls, manifest: str | PathLike | Mapping[str, str]) -> None:
+        """Emit fingerprinted asset URLs listed in ``manifest``.
+
+        ``manifest`` is a mapping of logical to fingerprinted file names or
+        the path of a ``manifest.json`` written by
+        :func:`pyformatic.assets.build_assets`.
+        """
+        if isinstance(manifest, (str, PathLike)):
+            cls.asset_manifest = load_manifest(manifest)
+        else:
+            cls.asset_manifest = dict(manifest)
+
+    @classmethod
+    def asset_url(cls, name: str, static_url: str | None = None) -> str:
+        """Return the URL of asset ``name``, fingerprinted if known."""
         url = static_url or cls.static_url
         url = url.rstrip("/")
-        return f'<link rel="stylesheet" href="{url}/pyformatic.css">'
+        return f"{url}/{cls.asset_manifest.get(name, name)}"
+
+    @classmethod
+    def header_html(cls, static_url: str | None = None) -> str:
+        """Return ``<link>`` tags for required assets."""
+        return f'<link rel="stylesheet" href="{cls.asset_url("pyformatic.css", static_url)}">'
 
     @classmethod
     def footer_html(cls, static_url: str | None = None) -> str:
         """Return ``<script>`` tags for required assets."""
-        url = static_url or cls.static_url
-        url = url.rstrip("/")
-        return f'<script src="{url}/pyformatic.js"></script>'
+        return f'<script src="{cls.asset_url("pyformatic.js", static_url)}"></script>'
 
     @classmethod
-    def setup_jinja(cls, env: Environment, static_url: str | None = None) -> None:
-        """Register globals in a :class:`jinja2.Environment`."""
+    def setup_jinja(
+        cls,
+        env: Environment,
+        static_url: str | None = None,
+        *,
+        bytecode_cache_dir: str | None = None,
+    ) -> None:
+        """Register globals in a :class:`jinja2.Environment`.
+
+        When ``bytecode_cache_dir`` is given, compiled templates of ``env``
+        are also persisted in that directory.
+        """
         env.globals["pyformatic_header"] = cls.header_html(static_url)
         env.globals["pyformatic_footer"] = cls.footer_html(static_url)
+        if bytecode_cache_dir:
+            env.bytecode_cache = bytecode_cache(bytecode_cache_dir)
 
     def __init__(
         self,
@@ -48,87 +100,318 @@ class Display:
         *,
         template_dirs: list[str] | None = None,
         static_url: str | None = None,
+        bytecode_cache_dir: str | None = None,
+        compiled_templates: str | None = None,
+        render_plan: bool = False,
+        fragment_cache_size: int = 0,
     ) -> None:
+        """Create a display for ``form``.
+
+        With ``render_plan`` enabled, the static parts of each item, the
+        buttons and the form wrapper are rendered once and cached; later
+        renders only escape and join the values, messages and classes.
+
+        A positive ``fragment_cache_size`` keeps up to that many rendered
+        items in an LRU cache shared by displays using the same templates.
+        Items are looked up by their complete render state, so unchanged
+        fields are not rendered again.
+        """
+        # pylint: disable=too-many-arguments  # template options are independent
         self.form = form
+        self.render_plan = render_plan
         self.static_url = static_url or self.__class__.static_url
-        template_dir = resources.files(__package__) / "templates"
-        search_paths = []
-        if template_dirs:
-            search_paths.extend(str(p) for p in template_dirs)
-        search_paths.append(str(template_dir))
-        self.env = Environment(
-            loader=FileSystemLoader(search_paths),
-            autoescape=select_autoescape(["html", "xml"]),
+        self.env = registry.environment(
+            template_dirs,
+            bytecode_cache_dir=bytecode_cache_dir,
+            compiled_templates=compiled_templates,
+        )
+        # Identifies the current render to the plan cache, which counts
+        # renders rather than lookups that missed.
+        self._plan_round = object()
+        self.fragments = (
+            registry.fragment_cache(self.env, fragment_cache_size)
+            if fragment_cache_size > 0
+            else None
         )
 
     def _get_input_template(self, input_type: str):
         """Return template for the given input type, falling back to default."""
 
-        try:
-            return self.env.get_template(f"ui/input_{input_type}.html")
-        except TemplateNotFound:
-            return self.env.get_template("ui/input.html")
+        return registry.input_template(self.env, input_type)
 
-    def _render_items(self) -> str:
-        parts = []
+    def _item_context(
+        self,
+        item: InputElement,
+        state: FormState | None = None,
+    ) -> dict[str, Any]:
+        """Return the template context for an input element."""
+        if state is None:
+            value, message, classes_outer = item.value, item.message, item.classes_outer
+        else:
+            value, message, classes_outer = state.overlay(item)
+        extra = dict(item.extra)
+        if item.include:
+            extra["data-include"] = ",".join(item.include)
+        extra_attrs = " ".join(f'{k}="{v}"' for k, v in extra.items())
+        custom_html = item.html if isinstance(item, RawInput) else ""
+        return {
+            "item_id": item.id,
+            "item_label": item.label,
+            "item_name": item.name,
+            "item_value": value,
+            "item_help": item.help,
+            "item_message": message or "",
+            "item_type": item.input_type,
+            "item_placeholder": item.placeholder,
+            "item_outer_classes": " ".join(classes_outer),
+            "item_input_classes": " ".join(item.classes_input),
+            "item_options": item.options,
+            "item_rows": item.rows,
+            "extra_attrs": extra_attrs,
+            "item_raw_html": custom_html,
+        }
+
+    def _planned(
+        self,
+        tpl: Template,
+        context: dict[str, Any],
+        slots: Mapping[str, bool],
+    ) -> str:
+        """Render ``tpl`` through a cached render plan when possible."""
+        key = _cache_key(context, slots)
+        if key is None:
+            return tpl.render(context)
+        plan = registry.render_plan(
+            self.env,
+            tpl,
+            key,
+            lambda: build_plan(lambda values: tpl.render({**context, **values}), slots),
+            render=self._plan_round,
+        )
+        if plan is None:
+            return tpl.render(context)
+        return plan.render(context)
+
+    def _render_item(self, item: InputElement, state: FormState | None = None) -> str:
+        tpl = self._get_input_template(item.input_type)
+        context = self._item_context(item, state)
+        if self.render_plan and item.input_type not in _VALUE_STRUCTURAL:
+            return self._planned(tpl, context, _ITEM_SLOTS)
+        key = _cache_key(context, {}) if self.fragments is not None else None
+        if key is None:
+            return tpl.render(context)
+        html = self.fragments.get((tpl, key))
+        if html is None:
+            html = tpl.render(context)
+            self.fragments.set((tpl, key), html)
+        return html
+
+    def _iter_items(self, state: FormState | None = None) -> Iterator[str]:
+        """Yield rendered items separated by newlines."""
+        first = True
         for item in self.form.items:
             if isinstance(item, RawElement):
-                parts.append(item.html)
+                html = item.html
+            elif isinstance(item, InputElement):
+                html = self._render_item(item, state)
+            else:
                 continue
+            if not first:
+                yield "\n"
+            first = False
+            yield html
+
+    def _render_items(self, state: FormState | None = None) -> str:
+        return "".join(self._iter_items(state))
+
+    def render_item(self, name: str, *, state: FormState | None = None) -> str:
+        """Return the HTML fragment for the form item called ``name``.
+
+        Raises :class:`KeyError` if the form has no such item.
+        """
+        self._plan_round = object()
+        for item in self.form.items:
+            if item.name != name:
+                continue
+            if isinstance(item, RawElement):
+                return item.html
             if isinstance(item, InputElement):
-                tpl = self._get_input_template(item.input_type)
-                extra = dict(item.extra)
-                if item.include:
-                    extra["data-include"] = ",".join(item.include)
-                extra_attrs = " ".join(f'{k}="{v}"' for k, v in extra.items())
-                custom_html = item.html if isinstance(item, RawInput) else ""
-                parts.append(
-                    tpl.render(
-                        item_id=item.id,
-                        item_label=item.label,
-                        item_name=item.name,
-                        item_value=item.value,
-                        item_help=item.help,
-                        item_message=item.message or "",
-                        item_type=item.input_type,
-                        item_placeholder=item.placeholder,
-                        item_outer_classes=" ".join(item.classes_outer),
-                        item_input_classes=" ".join(item.classes_input),
-                        item_options=item.options,
-                        item_rows=item.rows,
-                        extra_attrs=extra_attrs,
-                        item_raw_html=custom_html,
-                    )
-                )
-        return "\n".join(parts)
+                return self._render_item(item, state)
+        raise KeyError(name)
 
     def _render_buttons(self) -> str:
         if not self.form.buttons:
             return ""
-        tpl_btn = self.env.get_template("ui/button.html")
+        if self.render_plan:
+            context = {"buttons": [astuple(btn) for btn in self.form.buttons]}
+            tpl = registry.get_template(self.env, "ui/buttons_outer.html")
+            plan = registry.render_plan(
+                self.env,
+                tpl,
+                static_key(context, {}),
+                lambda: build_plan(lambda _: self._render_buttons_jinja(), {}),
+                render=self._plan_round,
+            )
+            if plan is not None:
+                return plan.render({})
+        return self._render_buttons_jinja()
+
+    def _render_buttons_jinja(self) -> str:
+        tpl_btn = registry.get_template(self.env, "ui/button.html")
         rendered = [tpl_btn.render(button=btn) for btn in self.form.buttons]
-        outer = self.env.get_template("ui/buttons_outer.html")
+        outer = registry.get_template(self.env, "ui/buttons_outer.html")
         return outer.render(buttons="".join(rendered))
 
-    def get_html(self, *, hidden_fields: Mapping[str, str] | None = None) -> str:
-        """Return HTML string for the form."""
-
-        tpl = self.env.get_template("ui/form.html")
-        items = self._render_items()
-        if hidden_fields:
-            hidden = []
-            for name, value in hidden_fields.items():
-                hidden.append(
-                    f'<input type="hidden" name="{escape(name)}" '
-                    f'value="{escape(value)}">'
-                )
-            items += "\n".join(hidden)
+    @staticmethod
+    def _hidden_html(hidden_fields: Mapping[str, str] | None) -> str:
+        if not hidden_fields:
+            return ""
+        hidden = []
+        for name, value in hidden_fields.items():
+            hidden.append(
+                f'<input type="hidden" name="{escape(name)}" '
+                f'value="{escape(value)}">'
+            )
+        return "\n".join(hidden)
+
+    def _form_context(self) -> dict[str, Any]:
+        """Return the ``ui/form.html`` context without items and buttons."""
+        return {
+            "form_id": self.form.id,
+            "form_action": self.form.action,
+            "form_method": self.form.method,
+            "form_autocomplete": "off" if not self.form.autocomplete else "on",
+        }
+
+    def get_html(
+        self,
+        *,
+        hidden_fields: Mapping[str, str] | None = None,
+        state: FormState | None = None,
+    ) -> str:
+        """Return HTML string for the form.
+
+        Values, messages and levels recorded in ``state`` take precedence
+        over the attributes of the form's elements.
+        """
+        self._plan_round = object()
+        tpl = registry.get_template(self.env, "ui/form.html")
+        items = self._render_items(state) + self._hidden_html(hidden_fields)
         buttons = self._render_buttons()
-        return tpl.render(
-            form_id=self.form.id,
-            form_action=self.form.action,
-            form_method=self.form.method,
-            form_autocomplete="off" if not self.form.autocomplete else "on",
-            form_items=items,
-            buttons=buttons,
+        context = {**self._form_context(), "form_items": items, "buttons": buttons}
+        if self.render_plan:
+            return self._planned(tpl, context, _FORM_SLOTS)
+        return tpl.render(context)
+
+    def iter_html(
+        self,
+        *,
+        hidden_fields: Mapping[str, str] | None = None,
+        state: FormState | None = None,
+    ) -> Iterator[str]:
+        """Yield the form HTML in document order.
+
+        Items are rendered one at a time as the generator is consumed, so the
+        chunks can be fed straight into a streaming response. Joined together
+        they equal :meth:`get_html`.
+        """
+        self._plan_round = object()
+        tpl = registry.get_template(self.env, "ui/form.html")
+        context = self._form_context()
+        segments = split_render(
+            lambda values: tpl.render({**context, **values}),
+            ("form_items", "buttons"),
+        )
+        if segments is None:
+            yield self.get_html(hidden_fields=hidden_fields, state=state)
+            return
+        head, middle, tail = segments
+        yield head
+        yield from self._iter_items(state)
+        hidden = self._hidden_html(hidden_fields)
+        if hidden:
+            yield hidden
+        yield middle
+        yield self._render_buttons()
+        yield tail
+
+    async def _render_async(
+        self,
+        lookup: Callable[[Environment], Template],
+        context: Mapping[str, Any],
+    ) -> str:
+        """Render ``lookup(env)`` with the async environment when available."""
+        env = registry.async_environment(self.env)
+        if env is None:
+            return lookup(self.env).render(context)
+        return await lookup(env).render_async(context)
+
+    async def _render_item_async(
+        self,
+        item: InputElement,
+        state: FormState | None = None,
+    ) -> str:
+        if self.render_plan and item.input_type not in _VALUE_STRUCTURAL:
+            return self._render_item(item, state)
+        context = self._item_context(item, state)
+        key = None
+        static = _cache_key(context, {}) if self.fragments is not None else None
+        if static is not None:
+            key = (self._get_input_template(item.input_type), static)
+            html = self.fragments.get(key)
+            if html is not None:
+                return html
+        html = await self._render_async(
+            lambda env: registry.input_template(env, item.input_type),
+            context,
+        )
+        if key is not None:
+            self.fragments.set(key, html)
+        return html
+
+    async def _render_buttons_async(self) -> str:
+        if not self.form.buttons or self.render_plan:
+            return self._render_buttons()
+        rendered = [
+            await self._render_async(
+                lambda env: registry.get_template(env, "ui/button.html"),
+                {"button": btn},
+            )
+            for btn in self.form.buttons
+        ]
+        return await self._render_async(
+            lambda env: registry.get_template(env, "ui/buttons_outer.html"),
+            {"buttons": "".join(rendered)},
+        )
+
+    async def get_html_async(
+        self,
+        *,
+        hidden_fields: Mapping[str, str] | None = None,
+        state: FormState | None = None,
+    ) -> str:
+        """Return HTML string for the form without blocking the event loop.
+
+        Templates are rendered with Jinja's async mode and control returns
+        to the event loop after every item, so other tasks keep running
+        while a large form renders. Templates loaded from a compiled bundle
+        are rendered synchronously, still yielding between items.
+        """
+        self._plan_round = object()
+        parts = []
+        for item in self.form.items:
+            if isinstance(item, RawElement):
+                parts.append(item.html)
+            elif isinstance(item, InputElement):
+                parts.append(await self._render_item_async(item, state))
+                await asyncio.sleep(0)
+        items = "\n".join(parts) + self._hidden_html(hidden_fields)
+        buttons = await self._render_buttons_async()
+        context = {**self._form_context(), "form_items": items, "buttons": buttons}
+        if self.render_plan:
+            tpl = registry.get_template(self.env, "ui/form.html")
+            return self._planned(tpl, context, _FORM_SLOTS)
+        return await self._render_async(
+            lambda env: registry.get_template(env, "ui/form.html"),
+            context,
         )
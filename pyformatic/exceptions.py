@@ -28,3 +28,20 @@ class ValidationError(ValidationMessage):
     """Error level validation message."""
 
     level = "error"
+
+
+class FlowConfigError(ValueError):
+    """Raised when a flow definition cannot be loaded.
+
+    ``source`` is the flow file, if known, and ``line`` the 1-based line
+    the problem was found on.
+    """
+
+    def __init__(self, message: str, *, source: object = None, line: int | None = None) -> None:
+        location = str(source) if source is not None else "<flow>"
+        if line is not None:
+            location = f"{location}:{line}"
+        super().__init__(f"{location}: {message}")
+        self.message = message
+        self.source = source
+        self.line = line
@@ -0,0 +1,120 @@
+"""Process-wide cache of flows loaded from YAML definitions."""
+
+from __future__ import annotations
+
+import hashlib
+import os
+from dataclasses import dataclass
+from threading import Lock
+from time import perf_counter
+from typing import Any
+
+from .cache import CacheStats
+from .formflow import FormFlow
+from .loader import load_flow
+
+
+def _option_key(value: Any) -> Any:
+    """Return a hashable stand-in for an option value."""
+    if isinstance(value, dict):
+        return tuple(sorted((k, _option_key(v)) for k, v in value.items()))
+    if isinstance(value, (list, tuple)):
+        return tuple(_option_key(v) for v in value)
+    try:
+        hash(value)
+    except TypeError:
+        return ("id", id(value))
+    return value
+
+
+@dataclass
+class _LoadedFlow:
+    """A compiled flow and the file state it was built from."""
+
+    flow: FormFlow
+    mtime_ns: int
+    digest: str
+
+
+class FlowRegistry:
+    """Load and compile each flow definition once per process.
+
+    Flows are keyed by the resolved YAML path, the form action and the
+    construction options. A cached flow is reused until the file's
+    modification time changes *and* its content hash differs, in which
+    case it is rebuilt.
+    """
+
+    def __init__(self) -> None:
+        self._lock = Lock()
+        self._flows: dict[tuple, _LoadedFlow] = {}
+        self.stats = CacheStats()
+        self.reloads = 0
+        self.load_seconds = 0.0
+
+    def get(
+        self,
+        yaml_path: str | os.PathLike,
+        action: str,
+        *,
+        validator_context: dict | None = None,
+        **options: Any,
+    ) -> FormFlow:
+        """Return the flow for ``yaml_path``, loading it when needed.
+
+        Arguments match :meth:`FormFlow.from_yaml`.
+        """
+        path = os.path.realpath(yaml_path)
+        key = (
+            path,
+            action,
+            _option_key(validator_context),
+            _option_key(options),
+        )
+        mtime_ns = os.stat(path).st_mtime_ns
+        with self._lock:
+            loaded = self._flows.get(key)
+            if loaded is not None and loaded.mtime_ns == mtime_ns:
+                self.stats.hits += 1
+                return loaded.flow
+            with open(path, "rb") as fh:
+                data = fh.read()
+            digest = hashlib.sha256(data).hexdigest()
+            if loaded is not None and loaded.digest == digest:
+                loaded.mtime_ns = mtime_ns
+                self.stats.hits += 1
+                return loaded.flow
+            self.stats.misses += 1
+            if loaded is not None:
+                self.reloads += 1
+            start = perf_counter()
+            flow = FormFlow.from_config(
+                load_flow(data, path),
+                action,
+                validator_context=validator_context,
+                source=path,
+                **options,
+            )
+            self.load_seconds += perf_counter() - start
+            self._flows[key] = _LoadedFlow(flow, mtime_ns, digest)
+            return flow
+
+    def metrics(self) -> dict[str, float]:
+        """Return cache and load-time metrics."""
+        loads = self.stats.misses
+        return {
+            **self.stats.as_dict(),
+            "flows": len(self._flows),
+            "loads": loads,
+            "reloads": self.reloads,
+            "load_seconds": self.load_seconds,
+            "avg_load_seconds": self.load_seconds / loads if loads else 0.0,
+        }
+
+    def clear(self) -> None:
+        """Forget all cached flows and reset the metrics."""
+        with self._lock:
+            self._flows.clear()
+            self.stats.reset()
+            self.reloads = 0
+            self.load_seconds = 0.0
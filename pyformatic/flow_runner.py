@@ -1,16 +1,60 @@
 """Utility helpers for executing a :class:`~pyformatic.formflow.FormFlow`."""
 from __future__ import annotations
 
-from typing import Any, Tuple
+import hashlib
+from typing import Any, MutableMapping, Tuple
 
 from .csrf import ensure_csrf_token, validate_csrf_token
 
 from .formflow import FormFlow, RequestLike
+from .signing import STATE_FIELD
+from .stores import FlowStateStore
 
 
-async def run_form_flow(
+def _state_session_key(form_flow: FormFlow) -> str:
+    """Return the session key holding ``form_flow``'s state id."""
+    ids = ",".join(form_flow.form_ids())
+    return "_pyformatic_flow_" + hashlib.sha256(ids.encode()).hexdigest()[:12]
+
+
+async def _load_state(
+    store: FlowStateStore,
+    session: MutableMapping[str, Any],
+    key: str,
+) -> dict[str, Any]:
+    """Return the saved ``values``, ``step`` and ``messages`` of the flow."""
+    state_id = session.get(key)
+    return (await store.load_async(state_id) or {}) if state_id else {}
+
+
+async def _save_state(  # pylint: disable=too-many-arguments  # one record per flow
+    store: FlowStateStore,
+    session: MutableMapping[str, Any],
+    key: str,
+    data: dict[str, Any] | None,
+    *,
+    step_index: int = 0,
+    messages: dict | None = None,
+) -> None:
+    """Save ``data`` and the step shown with it, or drop it if ``None``."""
+    state_id = session.get(key)
+    if data is None:
+        if state_id:
+            await store.delete_async(state_id)
+            session.pop(key, None)
+        return
+    if not state_id:
+        state_id = store.new_id()
+        session[key] = state_id
+    record = {"values": data, "step": step_index, "messages": messages or {}}
+    await store.save_async(state_id, record)
+
+
+async def run_form_flow(  # pylint: disable=too-many-branches,too-many-locals  # one branch per request kind
     form_flow: FormFlow,
     request: RequestLike,
+    *,
+    state_store: FlowStateStore | None = None,
 ) -> Tuple[str, Any]:
     """Handle a request for a multi-step form.
 
@@ -21,6 +65,12 @@ async def run_form_flow(
     request:
         An object providing ``method``, ``headers`` and ``json``/``form``
         coroutine methods.
+    state_store:
+        Optional :class:`~pyformatic.stores.FlowStateStore`. When given and
+        the request has a session, in-progress data is kept in the store
+        under an id saved in the session instead of being sent to the
+        browser. A GET shows the step of the last submission again with
+        its values and messages, without running the validators.
 
     Returns
     -------
@@ -35,12 +85,20 @@ async def run_form_flow(
     except (AttributeError, AssertionError):
         session = None
     csrf_token = ensure_csrf_token(session) if session is not None else None
+    state = form_flow.session_state(session)
+    store = state_store if session is not None else None
+    state_key = _state_session_key(form_flow)
+    saved: dict[str, Any] = {}
+    if store is not None:
+        saved = await _load_state(store, session, state_key)
+        data_store = dict(saved.get("values") or {})
 
     if form_flow.is_validation_request(request):
         payload = await request.json()
-        data_store = payload.get("fields", {})
-        data_store[payload.get("field", "")] = payload.get("value", "")
-        _is_val, payload = await form_flow.handle_request(request, data_store)
+        data_store.update(payload.get("fields") or {})
+        if "field" in payload:
+            data_store[payload["field"]] = payload.get("value", "")
+        _is_val, payload = await form_flow.handle_request(request, data_store, state=state)
         assert _is_val is True
         return "validation", payload
 
@@ -48,21 +106,47 @@ async def run_form_flow(
         form_data = await request.form()
         if session is not None:
             if not validate_csrf_token(session, form_data.get("csrf_token", "")):
-                html = form_flow.render(0, data_store=data_store, csrf_token=csrf_token)
+                html = await form_flow.render_async(0, csrf_token=csrf_token)
                 return "form", html
         for k, v in form_data.items():
-            if k not in {"next", "submit", "csrf_token"}:
+            if k not in {"next", "submit", "csrf_token", STATE_FIELD}:
                 data_store[k] = v
-        _is_val, result = await form_flow.handle_request(request, data_store)
+        _is_val, result = await form_flow.handle_request(request, data_store, state=state)
         assert not _is_val
         step_index, messages, has_error = result
         if step_index >= form_flow.num_steps:
+            if store is not None:
+                await _save_state(store, session, state_key, None)
             return "complete", data_store
+        carried = data_store
+        if store is not None:
+            await _save_state(
+                store,
+                session,
+                state_key,
+                data_store,
+                step_index=step_index,
+                messages=messages if has_error else None,
+            )
+            carried = None
         if has_error:
-            html = form_flow.render(step_index, messages, data_store, csrf_token=csrf_token)
+            html = await form_flow.render_async(
+                step_index, messages, carried, csrf_token=csrf_token
+            )
         else:
-            html = form_flow.render(step_index, data_store=data_store, csrf_token=csrf_token)
+            html = await form_flow.render_async(
+                step_index, data_store=carried, csrf_token=csrf_token
+            )
         return "form", html
 
-    html = form_flow.render(0, data_store=data_store, csrf_token=csrf_token)
+    step_index = saved.get("step", 0)
+    if saved and step_index < form_flow.num_steps:
+        for name in form_flow.steps[step_index].field_names:
+            if name in data_store:
+                state.values[name] = data_store[name]
+        html = await form_flow.render_async(
+            step_index, saved.get("messages") or None, csrf_token=csrf_token, state=state
+        )
+        return "form", html
+    html = await form_flow.render_async(0, csrf_token=csrf_token)
     return "form", html
@@ -1,25 +1,33 @@
 """Multi-step form flow management."""
 from __future__ import annotations
 
-from importlib import import_module
-from importlib import resources
+import asyncio
+import hmac
+import os
 from pathlib import Path
-from types import MethodType, SimpleNamespace
-from typing import Any, Awaitable, Callable, Mapping, Protocol
-from inspect import signature
-
-import yaml
-from jinja2 import Environment, FileSystemLoader, select_autoescape
+from typing import (
+    Any,
+    Awaitable,
+    Generator,
+    Iterator,
+    Mapping,
+    MutableMapping,
+    Protocol,
+    Sequence,
+)
 
+from .bundle import load_bundle
+from .codecache import CodeCache, default_cache
 from .form import Form
-from .elements import TextInput, Button, RawInput, RawElement
 from .display import Display
-from .exceptions import (
-    ValidationError,
-    ValidationInfo,
-    ValidationMessage,
-    ValidationWarning,
-)
+from .loader import inline_validators, load_flow
+from .memo import MEMO_SESSION_KEY, ValidationMemo
+from .offload import ValidatorPool
+from .state import FormState
+from .render_plan import split_render
+from .signing import DIGEST_FIELD, STATE_FIELD, BadSignature, Signer
+from .step import EMPTY_FIELD, LazySteps, Step
+from .templating import registry
 
 
 class RequestLike(Protocol):
@@ -37,208 +45,93 @@ class RequestLike(Protocol):
         raise NotImplementedError
 
 
-class Step:
-    """Represents a single stage of a multi-step form."""
-
-    def __init__(  # pylint: disable=too-many-arguments  # initializer sets up many configurable options
-        self,
-        config: dict,
-        module_base: str | None,
-        action: str,
-        *,
-        is_last: bool = False,
-        validator_context: dict | None = None,
-    ) -> None:
-        """Create a step instance from configuration."""
-        # pylint: disable=too-many-locals  # splitting would reduce clarity here
-
-        fields = [f for f in config.get("fields", []) if f.get("type") != "submit"]
-        self.config = {**config, "fields": fields}
-        self.validator = self._load_validator(module_base, config["name"])
-        if validator_context:
-            for name, value in validator_context.items():
-                setattr(self.validator, name, value)
-        self._setup_inline_validators(fields, config)
-        self.form = Form(config['name'], action=action)
-        for idx, field in enumerate(fields):
-            self._add_field(field, idx)
-        button_label = config.get("button_label", "Submit" if is_last else "Next")
-        self.form.add_button(Button(name="submit" if is_last else "next", label=button_label))
-
-    def _load_validator(self, module_base: str | None, name: str) -> Any:
-        """Return validator instance from module or an empty namespace."""
-        if not module_base:
-            return SimpleNamespace()
-        try:
-            module_path = f"{module_base}.validators.{name}"
-            module = import_module(module_path)
-            return module.Validator()
-        except ModuleNotFoundError:
-            return SimpleNamespace()
-
-    def _make_callable(self, spec: Any) -> Callable:
-        """Return a callable implementing the validator."""
-        # pylint: disable=function-redefined  # wrapper must match original callable signature
-        if callable(spec):
-            sig_len = len(signature(spec).parameters)
-            if sig_len <= 1:
-                def method(_, value):
-                    return spec(value)
-            else:
-                def method(_, value, data_store):
-                    return spec(value, data_store)
-            return method
-        code = str(spec)
-        local: dict[str, Any] = {}
-        body = "\n".join(f"    {line}" for line in code.splitlines())
-        src = "def _v(value, data_store):\n" + body
-        exec(  # pylint: disable=exec-used  # executing inline validator code from YAML
-            src,
-            {
-                "ValidationError": ValidationError,
-                "ValidationInfo": ValidationInfo,
-                "ValidationWarning": ValidationWarning,
-            },
-            local,
-        )
-        def method(_, value, data_store):
-            return local["_v"](value, data_store)
-
-        return method
-
-    def _setup_inline_validators(self, fields: list[dict], config: dict) -> None:
-        """Bind inline validators defined in the configuration."""
-
-        validators = dict(config.get("validators", {}))
-        for field in fields:
-            if "validator" in field:
-                validators[field["name"]] = field["validator"]
-        for name, spec in validators.items():
-            func = self._make_callable(spec)
-            bound = MethodType(func, self.validator)
-            setattr(self.validator, name, bound)
-
-    def _add_field(self, field: dict, idx: int) -> None:
-        """Add a configured field to ``self.form``."""
-        field_type = field.get('type', 'text')
-        if field_type == 'raw_html':
-            self.form.add_item(
-                RawElement(
-                    name=field.get('name', f'raw_{idx}'),
-                    label='',
-                    html=field.get('html', ''),
-                )
-            )
-            return
-        if field_type == 'raw_input':
-            item = RawInput(
-                name=field['name'],
-                label=field.get('label', ''),
-                html=field.get('html', ''),
-            )
-            item.include = field.get('include', [])
-            self.form.add_item(item)
-            return
-        item = TextInput(name=field['name'], label=field.get('label', ''))
-        item.input_type = field_type
-        item.include = field.get('include', [])
-        self.form.add_item(item)
-
-    def validate_field(  # pylint: disable=too-many-arguments  # flexible API for custom validators
-        self,
-        name: str,
-        value: str,
-        data_store: dict,
-        *,
-        update_data: bool = False,
-        extra_fields: Mapping[str, str] | None = None,
-    ) -> tuple[str, str | None, str]:
-        """Validate a single field.
-
-        ``extra_fields`` may contain additional field values to temporarily
-        merge into ``data_store`` for the validation call.
-
-        Returns the possibly modified value, message level and message text.
-        """
-        func = getattr(self.validator, name, None)
-        if not func:
-            return value, None, ""
-        data_view = data_store if not extra_fields else {**data_store, **extra_fields}
-        try:
-            if func.__code__.co_argcount == 2:
-                new_value = func(value)
-            else:
-                new_value = func(value, data_view)
-            if new_value is None:
-                new_value = value
-            level = "ok"
-            message = ""
-        except ValidationMessage as exc:  # catch info/warn/error
-            new_value = exc.value if exc.value is not None else value
-            level = exc.level
-            message = exc.message
-        if update_data:
-            data_store[name] = new_value
-            if extra_fields:
-                data_store.update(extra_fields)
-        item = next((i for i in self.form.items if i.name == name), None)
-        if item:
-            item.value = new_value
-            item.message = message if level else None
-            item.classes_outer = [
-                c for c in item.classes_outer
-                if c not in {"info", "warning", "error", "ok"}
-            ]
-            if level:
-                item.classes_outer.append(level)
-        return new_value, level, message
-
-    def validate(self, data: dict, data_store: dict) -> tuple[dict, bool]:
-        """Validate all fields in this step and update ``data_store``."""
-        messages: dict[str, dict] = {}
-        has_error = False
-        for field in self.config.get('fields', []):
-            if field.get('type') in {'submit', 'raw_html'}:
-                continue
-            name = field['name']
-            value = data.get(name, '')
-            new_val, level, msg = self.validate_field(
-                name,
-                value,
-                data_store,
-                update_data=True,
-            )
-            if level:
-                messages[name] = {"level": level, "message": msg, "value": new_val}
-                if level == "error":
-                    has_error = True
-        return messages, has_error
-
-
 class FormFlow:
     """Manage rendering and validation of a form flow."""
+    # pylint: disable=too-many-instance-attributes  # holds template and rendering options
+    # pylint: disable=too-many-public-methods  # loaders, rendering and validation entry points
 
     def __init__(  # pylint: disable=too-many-arguments  # flow setup requires several options
         self,
-        steps: list[Step],
+        steps: Sequence[Step],
         *,
         template_dirs: list[str] | None = None,
         static_url: str | None = None,
         show_progress: bool = False,
+        bytecode_cache_dir: str | None = None,
+        compiled_templates: str | None = None,
+        render_plan: bool = False,
+        fragment_cache_size: int = 0,
+        secret_key: str | bytes | None = None,
+        state_token: bool = False,
+        offload_pool: ValidatorPool | None = None,
+        offload_all: bool = False,
+        validation_memo: int = 0,
+        warmup: bool = False,
     ) -> None:
+        # pylint: disable=too-many-locals  # one parameter per option
         self.steps = steps
-        template_dir = resources.files(__package__) / 'templates'
-        search_paths = []
-        if template_dirs:
-            search_paths.extend(template_dirs)
-        search_paths.append(str(template_dir))
+        self.memo = ValidationMemo(validation_memo) if validation_memo else None
+        # Which validators are offloaded is only known once their modules
+        # are loaded; the pool starts no workers until it is used.
+        self.offload_pool = offload_pool if offload_pool is not None else ValidatorPool()
+        self.offload_all = offload_all
+        if isinstance(steps, LazySteps):
+            steps.on_load = self._prepare_step
+        else:
+            for step in steps:
+                self._prepare_step(step)
+        self.signer = Signer(secret_key, salt="pyformatic.steps") if secret_key else None
+        if state_token and not secret_key:
+            raise ValueError("state_token requires a secret_key")
+        self.state_signer = Signer(secret_key, salt="pyformatic.state") if state_token else None
+        self.render_plan = render_plan
+        self.fragment_cache_size = fragment_cache_size
         self.template_dirs = template_dirs or []
-        self.env = Environment(
-            loader=FileSystemLoader(search_paths),
-            autoescape=select_autoescape(['html', 'xml']),
+        self.bytecode_cache_dir = bytecode_cache_dir
+        self.compiled_templates = compiled_templates
+        self.env = registry.environment(
+            self.template_dirs,
+            bytecode_cache_dir=bytecode_cache_dir,
+            compiled_templates=compiled_templates,
         )
         self.static_url = static_url or Display.static_url
         self.show_progress = show_progress
+        self._field_index: dict[str, int] = {}
+        self.reindex()
+        if warmup:
+            self.warmup()
+
+    def _prepare_step(self, step: Step) -> None:
+        """Apply the flow's offload settings to ``step``."""
+        step.pool = self.offload_pool
+        step.offload_all = self.offload_all
+
+    def warmup(self) -> None:
+        """Build all steps and load their validator modules now.
+
+        Steps of flows loaded from YAML or bundles are otherwise built on
+        first access and import their validators on first validation.
+        """
+        for step in self.steps:
+            step.warmup()
+
+    def reindex(self) -> None:
+        """Rebuild the flow-wide field name index.
+
+        Maps each field name to the index of the first step defining it.
+        Steps that have not been built yet are not built.
+        """
+        index: dict[str, int] = {}
+        for idx in range(len(self.steps)):
+            for name in self._fields_for_step(idx):
+                index.setdefault(name, idx)
+        self._field_index = index
+
+    def form_ids(self) -> tuple[str, ...]:
+        """Return the form id of every step without building the steps."""
+        if isinstance(self.steps, LazySteps):
+            return tuple(self.steps.form_id(idx) for idx in range(len(self.steps)))
+        return tuple(step.form.id for step in self.steps)
 
     @classmethod
     def from_yaml(  # pylint: disable=too-many-arguments  # method builds complex object from file
@@ -249,29 +142,112 @@ class FormFlow:
         validator_context: dict | None = None,
         template_dirs: list[str] | None = None,
         static_url: str | None = None,
+        **options: Any,
     ) -> 'FormFlow':
-        """Construct a :class:`FormFlow` instance from a YAML definition."""
+        """Construct a :class:`FormFlow` instance from a YAML definition.
+
+        Additional keyword ``options`` such as ``bytecode_cache_dir`` or
+        ``render_plan`` are passed to :meth:`from_config`. Errors in the
+        file, including syntax errors in inline validators, raise
+        :class:`FlowConfigError` with the file name and line.
+        """
         with open(Path(yaml_path), 'r', encoding='utf-8') as fh:
-            cfg = yaml.safe_load(fh)
+            cfg = load_flow(fh, yaml_path)
+        return cls.from_config(
+            cfg,
+            action,
+            validator_context=validator_context,
+            source=yaml_path,
+            template_dirs=template_dirs,
+            static_url=static_url,
+            **options,
+        )
+
+    @classmethod
+    def from_bundle(  # pylint: disable=too-many-arguments  # mirrors from_yaml
+        cls,
+        bundle_path: str | os.PathLike,
+        action: str,
+        *,
+        validator_context: dict | None = None,
+        template_dirs: list[str] | None = None,
+        static_url: str | None = None,
+        code_cache: CodeCache | None = None,
+        **options: Any,
+    ) -> 'FormFlow':
+        """Construct a :class:`FormFlow` from a bundle made by ``build_bundle``.
+
+        Loading a bundle skips YAML parsing and validator compilation; the
+        bundled code is added to ``code_cache``. Other arguments match
+        :meth:`from_yaml`.
+        """
+        bundle = load_bundle(bundle_path)
+        code_cache = code_cache if code_cache is not None else default_cache
+        code_cache.update(bundle["code"])
+        return cls.from_config(
+            bundle["config"],
+            action,
+            validator_context=validator_context,
+            template_dirs=template_dirs,
+            static_url=static_url,
+            source=bundle["source"],
+            code_cache=code_cache,
+            **options,
+        )
+
+    @classmethod
+    def from_config(
+        cls,
+        cfg: dict,
+        action: str,
+        *,
+        validator_context: dict | None = None,
+        source: str | os.PathLike | None = None,
+        code_cache: CodeCache | None = None,
+        **options: Any,
+    ) -> 'FormFlow':
+        """Construct a :class:`FormFlow` from an already parsed definition.
+
+        ``cfg`` has the structure of a flow YAML file; keyword ``options``
+        are passed to the constructor and take precedence over the file's
+        ``offload``, ``validation_memo`` and ``warmup`` settings. Steps are
+        built on first access unless ``warmup`` is set. ``source`` names the
+        file ``cfg`` was loaded from and ``code_cache`` compiles inline
+        validators, see :class:`~pyformatic.codecache.CodeCache`.
+        """
         module_base = cfg['module']
         step_cfgs = cfg.get('steps', [])
         show_progress = cfg.get('show_progress', False)
-        steps = [
-            Step(
-                step_cfg,
+        if cfg.get('validation_memo'):
+            options.setdefault('validation_memo', int(cfg['validation_memo']))
+        offload = cfg.get('offload')
+        if offload:
+            options.setdefault('offload_pool', ValidatorPool.from_config(offload))
+            options.setdefault(
+                'offload_all',
+                offload is True or bool(isinstance(offload, dict) and offload.get('all')),
+            )
+        if cfg.get('warmup'):
+            options.setdefault('warmup', True)
+        code_cache = code_cache if code_cache is not None else default_cache
+        # Compile inline validators now so syntax errors surface at load
+        # time; the steps themselves are only built when first used.
+        for name, spec, line in inline_validators(cfg):
+            if not callable(spec):
+                code_cache.compile_validator(str(spec), name, line, source)
+
+        def build(idx: int) -> Step:
+            return Step(
+                step_cfgs[idx],
                 module_base,
                 action,
                 is_last=idx == len(step_cfgs) - 1,
                 validator_context=validator_context,
+                source=source,
+                code_cache=code_cache,
             )
-            for idx, step_cfg in enumerate(step_cfgs)
-        ]
-        return cls(
-            steps,
-            template_dirs=template_dirs,
-            static_url=static_url,
-            show_progress=show_progress,
-        )
+
+        return cls(LazySteps(step_cfgs, build), show_progress=show_progress, **options)
 
     @staticmethod
     def is_validation_request(request: RequestLike) -> bool:
@@ -284,75 +260,288 @@ class FormFlow:
         self,
         request: RequestLike,
         data_store: dict,
+        *,
+        state: FormState | None = None,
     ) -> tuple[bool, dict | tuple[int, dict | None, bool]]:
-        """Process a web request and return the resulting action."""
+        """Process a web request and return the resulting action.
+
+        Validation payloads with a true ``fragment`` key also receive the
+        re-rendered field as ``html``. A batch payload of the form
+        ``{"fields": {...}, "validate": [names...]}`` is answered with
+        ``{"results": {name: result}}``. ``state`` may carry a session's
+        validation memo, see :meth:`session_state`.
+        """
+        state = state if state is not None else FormState()
         if self.is_validation_request(request):
             payload = await request.json()
-            field = payload.get("field", "")
-            data_store.update(payload.get("fields", {}))
-            data_store[field] = payload.get("value", "")
-            step_index = self.step_index_for_field(field)
-            value, level, message = self.validate_field(
-                step_index,
-                field,
-                payload.get("value", ""),
-                data_store,
-                extra_fields=payload.get("fields"),
-            )
-            return True, {"level": level or "", "message": message, "value": value}
+            if "validate" in payload:
+                return True, await self._batch_result(payload, data_store, state)
+            return True, await self._validation_result(payload, data_store, state)
 
         form_data = await request.form()
+        token = form_data.get(STATE_FIELD)
+        if token and self.state_signer is not None:
+            try:
+                data_store.update(self.decode_state(token))
+            except BadSignature:
+                pass
         for key, value in form_data.items():
-            if key not in {"next", "submit"}:
+            if key not in {"next", "submit", STATE_FIELD}:
                 data_store[key] = value
-        index, messages, has_error = self.current_step(data_store)
+        index, messages, has_error = await self.current_step_async(data_store, state)
         return False, (index, messages, has_error)
 
-    def render(
+    def session_state(self, session: MutableMapping[str, Any] | None) -> FormState:
+        """Return a request state using ``session``'s validation memo.
+
+        Without a session or with ``validation_memo`` disabled a plain
+        :class:`FormState` is returned. The memo is found through an id
+        stored in the session.
+        """
+        if session is None or self.memo is None:
+            return FormState()
+        memo_id = session.get(MEMO_SESSION_KEY)
+        if not memo_id:
+            memo_id = self.memo.new_id()
+            session[MEMO_SESSION_KEY] = memo_id
+        return FormState(memo=self.memo.for_session(memo_id))
+
+    async def _validation_result(
         self,
-        index: int,
-        messages: dict | None = None,
-        data_store: dict | None = None,
-        csrf_token: str | None = None,
-    ) -> str:
-        """Return HTML for the given step, applying validation messages."""
+        payload: dict,
+        data_store: dict,
+        state: FormState,
+    ) -> dict:
+        """Validate the single field described by an AJAX ``payload``."""
+        field = payload.get("field", "")
+        data_store.update(payload.get("fields", {}))
+        data_store[field] = payload.get("value", "")
+        step_index = self.step_index_for_field(field)
+        value, level, message = await self.validate_field_async(
+            step_index,
+            field,
+            payload.get("value", ""),
+            data_store,
+            extra_fields=payload.get("fields"),
+            state=state,
+        )
+        result = {"level": level or "", "message": message, "value": value}
+        if payload.get("fragment"):
+            result["html"] = self.render_field(step_index, field, state=state)
+        return result
 
+    async def _batch_result(
+        self,
+        payload: dict,
+        data_store: dict,
+        state: FormState,
+    ) -> dict:
+        """Validate every field named in a batch ``payload`` in one pass."""
+        fields = payload.get("fields") or {}
+        names = [name for name in dict.fromkeys(payload.get("validate") or []) if name]
+        data_store.update(fields)
+        steps = {name: self.step_index_for_field(name) for name in names}
+        outcomes = await asyncio.gather(
+            *(
+                self.validate_field_async(
+                    steps[name], name, fields.get(name, ""), data_store, state=state
+                )
+                for name in names
+            )
+        )
+        results = {}
+        for name, (value, level, message) in zip(names, outcomes):
+            result = {"level": level or "", "message": message, "value": value}
+            if payload.get("fragment"):
+                result["html"] = self.render_field(steps[name], name, state=state)
+            results[name] = result
+        return {"results": results}
+
+    def _page_context(
+        self,
+        index: int,
+        messages: dict | None,
+        state: FormState,
+    ) -> dict[str, Any]:
+        """Record ``messages`` in ``state`` and return the page context."""
         step = self.steps[index]
+        state.apply_messages(messages)
         error_fields: list[str] = []
         if messages:
             for name, meta in messages.items():
-                item = next((i for i in step.form.items if i.name == name), None)
-                if item:
-                    item.message = meta.get("message")
-                    item.classes_outer = [
-                        c
-                        for c in item.classes_outer
-                        if c not in {"info", "warning", "error", "ok"}
-                    ]
-                    if meta.get("level"):
-                        item.classes_outer.append(meta["level"])
-                    if "value" in meta:
-                        item.value = meta["value"]
-                    if meta.get("level") == "error":
-                        error_fields.append(item.label or item.name)
+                item = step.fields.get(name, EMPTY_FIELD).item
+                if item and meta.get("level") == "error":
+                    error_fields.append(item.label or item.name)
+        return {
+            "messages": messages or {},
+            "form_id": step.form.id,
+            "error_fields": error_fields,
+            "show_progress": self.show_progress,
+            "step_index": index,
+            "total_steps": self.num_steps,
+            "pyformatic_header": Display.header_html(self.static_url),
+            "pyformatic_footer": Display.footer_html(self.static_url),
+        }
+
+    def render_field(  # pylint: disable=too-many-arguments  # mirrors render()
+        self,
+        index: int,
+        name: str,
+        messages: dict | None = None,
+        data_store: dict | None = None,
+        *,
+        state: FormState | None = None,
+    ) -> str:
+        """Return the HTML fragment for field ``name`` in step ``index``.
+
+        Only the field's wrapper from ``ui/input*.html`` is rendered, which
+        suits partial page updates. The value is taken from ``messages`` or
+        ``state``, failing that from ``data_store``.
+        """
+        state = state if state is not None else FormState()
+        state.apply_messages(messages)
+        if data_store and name in data_store and name not in state.values:
+            state.values[name] = data_store[name]
+        return self._display(self.steps[index].form).render_item(name, state=state)
+
+    def encode_state(self, data: Mapping[str, Any]) -> str:
+        """Return ``data`` as a compressed, signed state token."""
+        if self.state_signer is None:
+            raise ValueError("state tokens are not enabled for this flow")
+        return self.state_signer.dumps(dict(data))
+
+    def decode_state(self, token: str) -> dict:
+        """Return the data stored in a token from :meth:`encode_state`.
+
+        Raises :class:`~pyformatic.signing.BadSignature` for altered tokens.
+        """
+        if self.state_signer is None:
+            raise ValueError("state tokens are not enabled for this flow")
+        data = self.state_signer.loads(token)
+        if not isinstance(data, dict):
+            raise BadSignature("state token does not hold a mapping")
+        return data
+
+    def _hidden_fields(
+        self,
+        index: int,
+        data_store: dict | None,
+        csrf_token: str | None,
+    ) -> dict:
+        """Return the hidden inputs carrying ``data_store`` to the next POST.
+
+        In state token mode the values are packed into one signed field,
+        leaving out the fields shown on step ``index``.
+        """
         hidden = data_store or {}
+        if self.state_signer is not None and index < self.num_steps:
+            visible = {
+                *self._fields_for_step(index),
+                *(item.name for item in self.steps[index].form.items),
+            }
+            carried = {k: v for k, v in hidden.items() if k not in visible}
+            hidden = {STATE_FIELD: self.encode_state(carried)} if carried else {}
         if csrf_token:
             hidden = {**hidden, "csrf_token": csrf_token}
-        disp = Display(
-            step.form,
+        return hidden
+
+    def render(
+        self,
+        index: int,
+        messages: dict | None = None,
+        data_store: dict | None = None,
+        csrf_token: str | None = None,
+        *,
+        state: FormState | None = None,
+    ) -> str:
+        """Return HTML for the given step, applying validation messages.
+
+        Messages are recorded in ``state`` (a fresh :class:`FormState` by
+        default); the step's form definition is never modified.
+        """
+        # pylint: disable=too-many-arguments  # optional per-request state
+        state = state if state is not None else FormState()
+        context = self._page_context(index, messages, state)
+        disp = self._display(self.steps[index].form)
+        form_html = disp.get_html(
+            hidden_fields=self._hidden_fields(index, data_store, csrf_token),
+            state=state,
+        )
+        tpl = registry.get_template(self.env, "multi_step/page.html")
+        return tpl.render(form_html=form_html, **context)
+
+    async def render_async(
+        self,
+        index: int,
+        messages: dict | None = None,
+        data_store: dict | None = None,
+        csrf_token: str | None = None,
+        *,
+        state: FormState | None = None,
+    ) -> str:
+        """Return HTML for the given step without blocking the event loop.
+
+        Produces the same output as :meth:`render` using
+        :meth:`Display.get_html_async` and Jinja's async mode.
+        """
+        # pylint: disable=too-many-arguments  # optional per-request state
+        state = state if state is not None else FormState()
+        context = self._page_context(index, messages, state)
+        disp = self._display(self.steps[index].form)
+        form_html = await disp.get_html_async(
+            hidden_fields=self._hidden_fields(index, data_store, csrf_token),
+            state=state,
+        )
+        env = registry.async_environment(self.env)
+        if env is None:
+            tpl = registry.get_template(self.env, "multi_step/page.html")
+            return tpl.render(form_html=form_html, **context)
+        tpl = registry.get_template(env, "multi_step/page.html")
+        return await tpl.render_async(form_html=form_html, **context)
+
+    def render_iter(
+        self,
+        index: int,
+        messages: dict | None = None,
+        data_store: dict | None = None,
+        csrf_token: str | None = None,
+        *,
+        state: FormState | None = None,
+    ) -> Iterator[str]:
+        """Yield HTML for the given step in document order.
+
+        This is the streaming counterpart of :meth:`render`; the joined
+        chunks are identical to its output.
+        """
+        # pylint: disable=too-many-arguments  # optional per-request state
+        state = state if state is not None else FormState()
+        context = self._page_context(index, messages, state)
+        disp = self._display(self.steps[index].form)
+        hidden = self._hidden_fields(index, data_store, csrf_token)
+        tpl = registry.get_template(self.env, "multi_step/page.html")
+        segments = split_render(
+            lambda values: tpl.render({**context, **values}),
+            ("form_html",),
+        )
+        if segments is None:
+            form_html = disp.get_html(hidden_fields=hidden, state=state)
+            yield tpl.render(form_html=form_html, **context)
+            return
+        head, tail = segments
+        yield head
+        yield from disp.iter_html(hidden_fields=hidden, state=state)
+        yield tail
+
+    def _display(self, form: Form) -> Display:
+        """Return a :class:`Display` sharing this flow's template options."""
+        return Display(
+            form,
             template_dirs=self.template_dirs,
             static_url=self.static_url,
-        )
-        form_html = disp.get_html(hidden_fields=hidden)
-        tpl = self.env.get_template("multi_step/page.html")
-        return tpl.render(
-            form_html=form_html,
-            messages=messages or {},
-            form_id=step.form.id,
-            error_fields=error_fields,
-            show_progress=self.show_progress,
-            step_index=index,
-            total_steps=self.num_steps,
+            bytecode_cache_dir=self.bytecode_cache_dir,
+            compiled_templates=self.compiled_templates,
+            render_plan=self.render_plan,
+            fragment_cache_size=self.fragment_cache_size,
         )
 
     def validate_field(
@@ -363,6 +552,7 @@ class FormFlow:
         data_store: dict,
         *,
         extra_fields: Mapping[str, str] | None = None,
+        state: FormState | None = None,
     ) -> tuple[str, str | None, str]:
         """Validate a field in the specified step."""  # pylint: disable=too-many-arguments  # passthrough helper
         return self.steps[index].validate_field(
@@ -370,43 +560,188 @@ class FormFlow:
             value,
             data_store,
             extra_fields=extra_fields,
+            state=state if state is not None else FormState(),
+        )
+
+    async def validate_field_async(
+        self,
+        index: int,
+        name: str,
+        value: str,
+        data_store: dict,
+        *,
+        extra_fields: Mapping[str, str] | None = None,
+        state: FormState | None = None,
+    ) -> tuple[str, str | None, str]:
+        """Validate a field in the specified step, awaiting async validators."""
+        # pylint: disable=too-many-arguments  # passthrough helper
+        return await self.steps[index].validate_field_async(
+            name,
+            value,
+            data_store,
+            extra_fields=extra_fields,
+            state=state if state is not None else FormState(),
         )
 
-    def validate(self, index: int, data: dict, data_store: dict) -> tuple[dict, bool]:
+    def validate(
+        self,
+        index: int,
+        data: dict,
+        data_store: dict,
+        state: FormState | None = None,
+    ) -> tuple[dict, bool]:
         """Validate all fields for the given step."""
-        return self.steps[index].validate(data, data_store)
+        return self.steps[index].validate(
+            data,
+            data_store,
+            state if state is not None else FormState(),
+        )
+
+    async def validate_async(
+        self,
+        index: int,
+        data: dict,
+        data_store: dict,
+        state: FormState | None = None,
+    ) -> tuple[dict, bool]:
+        """Validate all fields for the given step, awaiting async validators."""
+        return await self.steps[index].validate_async(
+            data,
+            data_store,
+            state if state is not None else FormState(),
+        )
+
+    def validate_many(
+        self,
+        index: int,
+        name: str,
+        values: Sequence[Any],
+        data_columns: Mapping[str, Sequence[Any]] | None = None,
+    ) -> tuple[list[Any], list[str | None], list[str]]:
+        """Validate a column of values for a field, see :meth:`Step.validate_many`."""
+        return self.steps[index].validate_many(name, values, data_columns)
+
+    async def validate_many_async(
+        self,
+        index: int,
+        name: str,
+        values: Sequence[Any],
+        data_columns: Mapping[str, Sequence[Any]] | None = None,
+    ) -> tuple[list[Any], list[str | None], list[str]]:
+        """Validate a column of values, see :meth:`Step.validate_many_async`."""
+        return await self.steps[index].validate_many_async(name, values, data_columns)
 
     @property
     def num_steps(self) -> int:
         """Return the number of configured steps."""
         return len(self.steps)
 
-    def _fields_for_step(self, index: int) -> list[str]:
+    def _fields_for_step(self, index: int) -> tuple[str, ...]:
         """Return names of non-button fields for the given step."""
-        step = self.steps[index]
-        return [
-            f["name"]
-            for f in step.config.get("fields", [])
-            if f.get("type") not in {"submit", "raw_html"}
-        ]
+        if isinstance(self.steps, LazySteps):
+            return self.steps.field_names(index)
+        return self.steps[index].field_names
 
     def step_index_for_field(self, name: str) -> int:
         """Return the index of the step containing ``name``."""
-        for idx in range(len(self.steps)):
-            if name in self._fields_for_step(idx):
-                return idx
-        return 0
+        return self._field_index.get(name, 0)
+
+    def current_step(
+        self,
+        data_store: dict,
+        state: FormState | None = None,
+    ) -> tuple[int, dict | None, bool]:
+        """Return step index, validation messages and failure state.
+
+        Validation results are recorded in ``state`` rather than on the
+        shared step forms.
+
+        With a ``secret_key`` every completed step is recorded as a signed
+        digest of its submitted values in the hidden ``_pyformatic_digests``
+        field and its validated values are written back to ``data_store``.
+        Steps whose digest still matches are not validated again. Digests
+        are chained, so changing a value also revalidates all later steps.
+        """
+        state = state if state is not None else FormState()
+        walk = self._walk_steps(data_store)
+        try:
+            idx, subset, data = next(walk)
+            while True:
+                idx, subset, data = walk.send(self.validate(idx, subset, data, state))
+        except StopIteration as stop:
+            return stop.value
+
+    async def current_step_async(
+        self,
+        data_store: dict,
+        state: FormState | None = None,
+    ) -> tuple[int, dict | None, bool]:
+        """Return the same result as :meth:`current_step`.
+
+        Steps are validated with :meth:`Step.validate_async`, so ``async
+        def`` validators are awaited and independent fields run
+        concurrently.
+        """
+        state = state if state is not None else FormState()
+        walk = self._walk_steps(data_store)
+        try:
+            idx, subset, data = next(walk)
+            while True:
+                result = await self.validate_async(idx, subset, data, state)
+                idx, subset, data = walk.send(result)
+        except StopIteration as stop:
+            return stop.value
+
+    def _walk_steps(
+        self,
+        data_store: dict,
+    ) -> Generator[tuple[int, dict, dict], tuple[dict, bool], tuple[int, dict | None, bool]]:
+        """Drive :meth:`current_step` and :meth:`current_step_async`.
 
-    def current_step(self, data_store: dict) -> tuple[int, dict | None, bool]:
-        """Return step index, validation messages and failure state."""
+        Yields ``(index, values, data)`` for each step that has to be
+        validated and expects the ``(messages, has_error)`` result to be
+        sent back. The generator's return value is the current step result.
+        """
         data = dict(data_store)
+        submitted = str(data.pop(DIGEST_FIELD, "") or "").split(".")
+        digests: list[str] = []
         for idx in range(len(self.steps)):
             names = self._fields_for_step(idx)
             if not any(n in data for n in names):
+                self._store_digests(data_store, digests)
                 return idx, None, False
             subset = {n: data.get(n, "") for n in names}
-            messages, has_error = self.validate(idx, subset, data)
+            digest = self._step_digest(idx, subset, digests)
+            if digest and idx < len(submitted) and hmac.compare_digest(digest, submitted[idx]):
+                digests.append(digest)
+                continue
+            messages, has_error = yield idx, subset, data
             if has_error:
+                self._store_digests(data_store, digests)
                 return idx, messages, True
+            if self.signer is not None:
+                # Carry the validated values forward so the digest matches
+                # what is posted back; fields never submitted stay absent.
+                data_store.update((n, data[n]) for n in names if n in data)
+                validated = {n: data.get(n, "") for n in names}
+                digests.append(self._step_digest(idx, validated, digests))
         data_store.update(data)
+        data_store.pop(DIGEST_FIELD, None)
         return len(self.steps), None, False
+
+    def _step_digest(self, index: int, values: dict, previous: list[str]) -> str:
+        """Return the signed digest of step ``index`` or ``""`` if unsigned."""
+        if self.signer is None:
+            return ""
+        chain = previous[-1] if previous else ""
+        form_id = (
+            self.steps.form_id(index)
+            if isinstance(self.steps, LazySteps)
+            else self.steps[index].form.id
+        )
+        return self.signer.digest(index, form_id, chain, values)
+
+    def _store_digests(self, data_store: dict, digests: list[str]) -> None:
+        """Record the digests of completed steps for the next request."""
+        if self.signer is not None:
+            data_store[DIGEST_FIELD] = ".".join(digests)
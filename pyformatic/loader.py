@@ -0,0 +1,85 @@
+"""Load flow definitions from YAML and remember where values came from."""
+
+from __future__ import annotations
+
+import os
+from typing import IO, Any, Iterator, Mapping
+
+import yaml
+
+from .exceptions import FlowConfigError
+
+
+class LineDict(dict):
+    """Mapping loaded from YAML that knows the line of each value.
+
+    ``lines`` maps keys to the 1-based line where the value's content
+    starts; for block scalars (``|`` and ``>``) that is the line after the
+    indicator.
+    """
+
+    __slots__ = ("lines",)
+
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        super().__init__(*args, **kwargs)
+        self.lines: dict[Any, int] = {}
+
+
+# libyaml's parser is several times faster; the constructors stay in Python.
+_BaseLoader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+
+class FlowLoader(_BaseLoader):  # pylint: disable=too-many-ancestors  # PyYAML loader mixins
+    """Safe YAML loader building :class:`LineDict` mappings.
+
+    It uses the libyaml parser when PyYAML was built with it.
+    """
+
+    def construct_line_mapping(self, node: yaml.MappingNode) -> LineDict:
+        """Return ``node`` as a :class:`LineDict`."""
+        mapping = LineDict(self.construct_mapping(node))
+        for key_node, value_node in node.value:
+            line = value_node.start_mark.line + 1
+            if isinstance(value_node, yaml.ScalarNode) and value_node.style in ("|", ">"):
+                line += 1
+            mapping.lines[self.construct_object(key_node)] = line
+        return mapping
+
+
+FlowLoader.add_constructor(
+    yaml.resolver.BaseResolver.DEFAULT_MAPPING_TAG,
+    FlowLoader.construct_line_mapping,
+)
+
+
+def line_of(mapping: Mapping[str, Any], key: str) -> int | None:
+    """Return the line of ``mapping[key]`` in its flow file, if known."""
+    return getattr(mapping, "lines", {}).get(key)
+
+
+def inline_validators(cfg: Mapping[str, Any]) -> Iterator[tuple[str, Any, int | None]]:
+    """Yield ``(name, source, line)`` for the inline validators in ``cfg``."""
+    for step in cfg.get("steps") or []:
+        configured = step.get("validators") or {}
+        for name, spec in configured.items():
+            yield name, spec, line_of(configured, name)
+        for field in step.get("fields") or []:
+            if "validator" in field and field.get("type") != "submit":
+                yield field.get("name", ""), field["validator"], line_of(field, "validator")
+
+
+def load_flow(stream: str | bytes | IO, source: str | os.PathLike | None = None) -> Any:
+    """Parse a flow definition from ``stream``.
+
+    YAML errors are raised as :class:`FlowConfigError` naming ``source``
+    and the offending line.
+    """
+    try:
+        return yaml.load(stream, Loader=FlowLoader)
+    except yaml.MarkedYAMLError as exc:
+        mark = exc.problem_mark or exc.context_mark
+        raise FlowConfigError(
+            str(exc.problem or exc.context or "invalid YAML"),
+            source=source,
+            line=mark.line + 1 if mark is not None else None,
+        ) from exc
@@ -0,0 +1,59 @@
+"""Per-session memoization of field validation results."""
+
+from __future__ import annotations
+
+from secrets import token_urlsafe
+from threading import Lock
+from typing import Callable
+
+from .cache import LRUCache
+
+MEMO_SESSION_KEY = "_pyformatic_memo"
+
+
+def uncached(func: Callable) -> Callable:
+    """Mark a validator whose result must not be memoized.
+
+    Use it for validators that depend on data other than the field value
+    and its ``include`` fields, or on external state that may change
+    between requests. It has the same effect as ``cacheable: false`` on the
+    field in YAML.
+    """
+    func.pyformatic_cacheable = False
+    return func
+
+
+class ValidationMemo:
+    """Bounded validation result caches, one per session.
+
+    Each session gets an :class:`~pyformatic.cache.LRUCache` of
+    ``maxsize`` results keyed by step, field name, value and the values of
+    the field's ``include`` dependencies. At most ``sessions`` caches are
+    kept; the least recently used session is dropped first.
+    """
+
+    def __init__(self, maxsize: int = 128, *, sessions: int = 10000) -> None:
+        self.maxsize = maxsize
+        self._sessions = LRUCache(sessions)
+        self._lock = Lock()
+
+    def __len__(self) -> int:
+        return len(self._sessions)
+
+    @staticmethod
+    def new_id() -> str:
+        """Return a new id to store in the session."""
+        return token_urlsafe(16)
+
+    def for_session(self, memo_id: str) -> LRUCache:
+        """Return the result cache for ``memo_id``, creating it if needed."""
+        with self._lock:
+            memo = self._sessions.get(memo_id)
+            if memo is None:
+                memo = LRUCache(self.maxsize)
+                self._sessions.set(memo_id, memo)
+            return memo
+
+    def clear(self) -> None:
+        """Drop the caches of all sessions."""
+        self._sessions.clear()
@@ -0,0 +1,192 @@
+"""Run blocking validators in a worker pool from the async request path."""
+
+from __future__ import annotations
+
+import asyncio
+import time
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from functools import lru_cache
+from importlib import import_module
+from threading import Lock
+from typing import Any, Callable, Mapping, NamedTuple
+
+from .exceptions import ValidationMessage
+
+POOL_KINDS = ("thread", "process")
+
+
+def offload(func: Callable) -> Callable:
+    """Mark a validator method to run in the flow's worker pool.
+
+    Use it as a decorator on methods of a ``Validator`` class; it has the
+    same effect as ``offload: true`` on the field in YAML.
+    """
+    func.pyformatic_offload = True
+    return func
+
+
+class MethodRef(NamedTuple):
+    """Picklable reference to a method of an importable validator class.
+
+    Sent to process pools instead of the bound method, whose instance may
+    hold inline validators and ``validator_context`` values that cannot be
+    pickled. Each worker creates its own instance of the class, without
+    the context.
+    """
+
+    module: str
+    qualname: str
+    name: str
+
+    def __call__(self, *args: Any) -> Any:
+        return getattr(_worker_instance(self.module, self.qualname), self.name)(*args)
+
+
+@lru_cache(maxsize=None)
+def _worker_instance(module: str, qualname: str) -> Any:
+    """Return this process's instance of a validator class."""
+    obj: Any = import_module(module)
+    for part in qualname.split("."):
+        obj = getattr(obj, part)
+    return obj()
+
+
+def _importable(obj: Any) -> bool:
+    """Return True if pickle can find ``obj`` by its module and name."""
+    qualname = getattr(obj, "__qualname__", "<")
+    return getattr(obj, "__module__", None) is not None and "<" not in qualname
+
+
+def process_target(name: str, func: Callable, original: Callable) -> Callable | None:
+    """Return what a process pool calls for validator ``name``.
+
+    ``func`` is the validator as found on the step's validator instance
+    and ``original`` the callable it wraps, if any. Methods defined on an
+    importable class become a :class:`MethodRef` and importable functions
+    are sent as they are. Returns ``None`` for inline YAML validators and
+    other closures, which then run in the caller.
+    """
+    if original is not func:
+        return original if _importable(original) else None
+    owner = getattr(func, "__self__", None)
+    if owner is not None:
+        cls = type(owner)
+        if callable(getattr(cls, name, None)) and _importable(cls):
+            return MethodRef(cls.__module__, cls.__qualname__, name)
+        return None
+    return func if _importable(func) else None
+
+
+def _timed_call(func: Callable, args: tuple) -> tuple[str, Any, float, float]:
+    """Call ``func`` in a worker and report its outcome and timing.
+
+    Validation messages are returned rather than raised so their ``value``
+    survives the trip back from a worker process.
+    """
+    started = time.time()
+    start = time.perf_counter()
+    try:
+        outcome: tuple[str, Any] = ("ok", func(*args))
+    except ValidationMessage as exc:
+        outcome = ("message", (type(exc), exc.message, exc.value))
+    return outcome[0], outcome[1], started, time.perf_counter() - start
+
+
+class ValidatorPool:
+    """Bounded thread or process pool with queue and timing metrics.
+
+    The executor is created on first use. Process pools run methods of
+    ``Validator`` classes in importable modules on a fresh instance per
+    worker, and module-level functions as they are; see
+    :func:`process_target`. Inline YAML validators and other closures are
+    not sent to a process pool and run in the caller instead.
+    """
+
+    # pylint: disable=too-many-instance-attributes  # metrics counters
+
+    def __init__(self, kind: str = "thread", max_workers: int = 4) -> None:
+        if kind not in POOL_KINDS:
+            raise ValueError(f"unknown pool kind {kind!r}; expected one of {POOL_KINDS}")
+        self.kind = kind
+        self.max_workers = max_workers
+        self._executor: Executor | None = None
+        self._lock = Lock()
+        self.submitted = 0
+        self.completed = 0
+        self.queue_depth = 0
+        self.max_queue_depth = 0
+        self.exec_seconds = 0.0
+        self.wait_seconds = 0.0
+
+    @classmethod
+    def from_config(cls, config: bool | Mapping[str, Any] | None) -> ValidatorPool | None:
+        """Return a pool for a YAML ``offload`` setting or ``None``."""
+        if not config:
+            return None
+        if config is True:
+            return cls()
+        return cls(
+            kind=config.get("kind", "thread"),
+            max_workers=int(config.get("max_workers", 4)),
+        )
+
+    def _get_executor(self) -> Executor:
+        with self._lock:
+            if self._executor is None:
+                if self.kind == "process":
+                    self._executor = ProcessPoolExecutor(self.max_workers)
+                else:
+                    self._executor = ThreadPoolExecutor(
+                        self.max_workers, thread_name_prefix="pyformatic-validator"
+                    )
+            return self._executor
+
+    async def run(self, func: Callable, *args: Any) -> Any:
+        """Return ``func(*args)`` computed in the pool.
+
+        Validation messages raised by ``func`` are re-raised here.
+        """
+        executor = self._get_executor()
+        with self._lock:
+            self.submitted += 1
+            self.queue_depth += 1
+            self.max_queue_depth = max(self.max_queue_depth, self.queue_depth)
+        submitted_at = time.time()
+        loop = asyncio.get_running_loop()
+        try:
+            status, payload, started, elapsed = await loop.run_in_executor(
+                executor, _timed_call, func, args
+            )
+        finally:
+            with self._lock:
+                self.queue_depth -= 1
+        with self._lock:
+            self.completed += 1
+            self.exec_seconds += elapsed
+            self.wait_seconds += max(started - submitted_at, 0.0)
+        if status == "message":
+            exc_type, message, value = payload
+            raise exc_type(message, value)
+        return payload
+
+    def metrics(self) -> dict[str, float]:
+        """Return queue depth and execution time metrics."""
+        with self._lock:
+            done = self.completed
+            return {
+                "submitted": self.submitted,
+                "completed": done,
+                "queue_depth": self.queue_depth,
+                "max_queue_depth": self.max_queue_depth,
+                "exec_seconds": self.exec_seconds,
+                "avg_exec_seconds": self.exec_seconds / done if done else 0.0,
+                "wait_seconds": self.wait_seconds,
+                "avg_wait_seconds": self.wait_seconds / done if done else 0.0,
+            }
+
+    def shutdown(self, wait: bool = True) -> None:
+        """Stop the worker pool; it is recreated on next use."""
+        with self._lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=wait)
@@ -0,0 +1,131 @@
+"""Precomputed render plans made of static segments and dynamic slots."""
+
+from __future__ import annotations
+
+from typing import Any, Callable, Mapping, Sequence
+from uuid import uuid4
+
+from markupsafe import escape
+
+
+class RenderPlan:  # pylint: disable=too-few-public-methods  # value object with one operation
+    """Template output split into static text and named slots.
+
+    ``segments`` always holds one more entry than ``slots``; rendering
+    interleaves them. Slots listed in ``escaped`` are HTML-escaped the same
+    way Jinja's autoescaping would, the others are inserted verbatim.
+    """
+
+    __slots__ = ("segments", "slots", "escaped")
+
+    def __init__(
+        self,
+        segments: list[str],
+        slots: list[str],
+        escaped: frozenset[str],
+    ) -> None:
+        self.segments = segments
+        self.slots = slots
+        self.escaped = escaped
+
+    def render(self, values: Mapping[str, Any]) -> str:
+        """Return the output with ``values`` substituted into the slots."""
+        segments = self.segments
+        escaped = self.escaped
+        out = [segments[0]]
+        for idx, slot in enumerate(self.slots, 1):
+            value = values[slot]
+            out.append(escape(value) if slot in escaped else str(value))
+            out.append(segments[idx])
+        return "".join(out)
+
+
+def freeze(value: Any) -> Any:
+    """Return a hashable version of ``value`` made of tuples."""
+    if isinstance(value, (list, tuple)):
+        return tuple(freeze(v) for v in value)
+    if isinstance(value, dict):
+        return tuple((k, freeze(v)) for k, v in value.items())
+    return value
+
+
+def static_key(context: Mapping[str, Any], slots: Mapping[str, bool]) -> tuple:
+    """Return a hashable key of the ``context`` entries that are not slots."""
+    return tuple(
+        v if v.__class__ is str else freeze(v)
+        for k, v in context.items()
+        if k not in slots
+    )
+
+
+def _sentinels(slots: Mapping[str, bool], marker: str = "") -> dict[str, str]:
+    token = uuid4().hex
+    return {name: f"pfslot{token}{name}slot{marker}" for name in slots}
+
+
+def build_plan(
+    render: Callable[[Mapping[str, Any]], str],
+    slots: Mapping[str, bool],
+) -> RenderPlan | None:
+    """Return a :class:`RenderPlan` for ``render`` or ``None``.
+
+    ``render`` is called with sentinel values for ``slots`` (a mapping of
+    slot name to whether the value is escaped). The plan is verified against
+    a second render with different sentinels, including characters that need
+    escaping, and against a render with empty values. ``None`` is returned
+    when the template's structure depends on the slot values or when a slot
+    is transformed by a filter, in which case callers must keep using the
+    full template render.
+    """
+    probe = _sentinels(slots)
+    output = render(probe)
+    positions = []
+    for name, sentinel in probe.items():
+        start = output.find(sentinel)
+        while start != -1:
+            positions.append((start, name, sentinel))
+            start = output.find(sentinel, start + len(sentinel))
+    positions.sort()
+    segments: list[str] = []
+    order: list[str] = []
+    last = 0
+    for start, name, sentinel in positions:
+        segments.append(output[last:start])
+        order.append(name)
+        last = start + len(sentinel)
+    segments.append(output[last:])
+    plan = RenderPlan(
+        segments,
+        order,
+        frozenset(name for name, escaped in slots.items() if escaped),
+    )
+    checks = (_sentinels(slots, "<&>'\""), dict.fromkeys(slots, ""))
+    for values in checks:
+        if plan.render(values) != render(values):
+            return None
+    return plan
+
+
+def split_render(
+    render: Callable[[Mapping[str, Any]], str],
+    slots: Sequence[str],
+) -> list[str] | None:
+    """Return the text around ``slots`` in a single render of ``render``.
+
+    The result has one more entry than ``slots`` so callers can stream their
+    own content between the pieces. ``None`` is returned unless every slot
+    is emitted verbatim exactly once and in the given order.
+    """
+    probe = _sentinels(dict.fromkeys(slots, False))
+    output = render(probe)
+    segments = []
+    last = 0
+    for name in slots:
+        sentinel = probe[name]
+        start = output.find(sentinel, last)
+        if start == -1 or output.count(sentinel) != 1:
+            return None
+        segments.append(output[last:start])
+        last = start + len(sentinel)
+    segments.append(output[last:])
+    return segments
@@ -0,0 +1,76 @@
+"""HMAC signing helpers for data round-tripped through the browser."""
+
+from __future__ import annotations
+
+import hashlib
+import hmac
+import json
+import zlib
+from base64 import urlsafe_b64decode, urlsafe_b64encode
+from binascii import Error as BinasciiError
+from typing import Any
+
+DIGEST_FIELD = "_pyformatic_digests"
+STATE_FIELD = "_pyformatic_state"
+
+
+class BadSignature(ValueError):
+    """Raised when signed data was altered or signed with another key."""
+
+
+def _b64(data: bytes) -> str:
+    return urlsafe_b64encode(data).rstrip(b"=").decode("ascii")
+
+
+def _unb64(text: str) -> bytes:
+    return urlsafe_b64decode(text + "=" * (-len(text) % 4))
+
+
+def _canonical(value: Any) -> bytes:
+    return json.dumps(value, sort_keys=True, separators=(",", ":"), default=str).encode()
+
+
+class Signer:
+    """Create and check HMAC-SHA256 signatures with a secret key.
+
+    ``salt`` separates signatures made for different purposes with the same
+    key, so a value signed for one use is never accepted for another.
+    """
+
+    def __init__(self, secret_key: str | bytes, *, salt: str = "pyformatic") -> None:
+        if not secret_key:
+            raise ValueError("secret_key must not be empty")
+        key = secret_key.encode() if isinstance(secret_key, str) else secret_key
+        self._key = hashlib.sha256(salt.encode() + b"\0" + key).digest()
+
+    def signature(self, data: bytes) -> str:
+        """Return the URL-safe signature of ``data``."""
+        return _b64(hmac.new(self._key, data, hashlib.sha256).digest())
+
+    def verify(self, data: bytes, signature: str) -> bool:
+        """Return True if ``signature`` was made for ``data`` with this key."""
+        return hmac.compare_digest(self.signature(data), str(signature))
+
+    def digest(self, *parts: Any) -> str:
+        """Return the signature of ``parts`` serialized as canonical JSON."""
+        return self.signature(_canonical(parts))
+
+    def dumps(self, value: Any) -> str:
+        """Return ``value`` as a compressed, signed, URL-safe token."""
+        payload = zlib.compress(_canonical(value))
+        return f"{_b64(payload)}.{self.signature(payload)}"
+
+    def loads(self, token: str) -> Any:
+        """Return the value stored in ``token`` by :meth:`dumps`.
+
+        Raises :class:`BadSignature` if the token is malformed or its
+        signature does not match.
+        """
+        data, _, signature = str(token).partition(".")
+        try:
+            payload = _unb64(data)
+        except (BinasciiError, ValueError) as exc:
+            raise BadSignature("malformed token") from exc
+        if not self.verify(payload, signature):
+            raise BadSignature("signature does not match")
+        return json.loads(zlib.decompress(payload))
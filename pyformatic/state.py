@@ -0,0 +1,69 @@
+"""Per-request form state layered over immutable form definitions."""
+
+from __future__ import annotations
+
+from typing import Any, Mapping
+
+from .cache import LRUCache
+from .elements import BaseElement
+
+LEVEL_CLASSES = frozenset({"info", "warning", "error", "ok"})
+
+_MISSING = object()
+
+
+class FormState:
+    """Values, messages and validation levels for one request.
+
+    Validation and rendering record their results here instead of on the
+    shared :class:`~pyformatic.form.Form` elements, so a single
+    :class:`~pyformatic.formflow.FormFlow` can serve concurrent requests.
+    Fields without an entry fall back to the element's own attributes.
+
+    ``memo`` is an optional per-session cache of validation results, see
+    :class:`~pyformatic.memo.ValidationMemo`.
+    """
+
+    __slots__ = ("values", "messages", "levels", "memo")
+
+    def __init__(self, memo: LRUCache | None = None) -> None:
+        self.memo = memo
+        self.values: dict[str, Any] = {}
+        self.messages: dict[str, str | None] = {}
+        self.levels: dict[str, str | None] = {}
+
+    def set(
+        self,
+        name: str,
+        *,
+        value: Any = _MISSING,
+        level: str | None = None,
+        message: str | None = None,
+    ) -> None:
+        """Record the state of field ``name``."""
+        if value is not _MISSING:
+            self.values[name] = value
+        self.levels[name] = level
+        self.messages[name] = message
+
+    def apply_messages(self, messages: Mapping[str, Mapping[str, Any]] | None) -> None:
+        """Record validation ``messages`` as returned by ``Step.validate``."""
+        for name, meta in (messages or {}).items():
+            self.set(
+                name,
+                value=meta["value"] if "value" in meta else _MISSING,
+                level=meta.get("level"),
+                message=meta.get("message"),
+            )
+
+    def overlay(self, item: BaseElement) -> tuple[Any, str | None, list[str]]:
+        """Return the value, message and outer classes to render ``item`` with."""
+        name = item.name
+        value = self.values.get(name, item.value)
+        if name not in self.levels:
+            return value, item.message, item.classes_outer
+        level = self.levels[name]
+        classes = [c for c in item.classes_outer if c not in LEVEL_CLASSES]
+        if level:
+            classes.append(level)
+        return value, self.messages.get(name), classes
@@ -1,42 +1,96 @@
-function pyformaticValidateField(ev) {
-  const el = ev.target;
-  const form = el.closest('form');
-  if (!form) {
-    return;
+// Validations queued within this many milliseconds are sent together.
+const PYFORMATIC_BATCH_WINDOW = 25;
+const pyformaticQueues = new WeakMap();
+
+function pyformaticFieldValue(el) {
+  if (el.type === 'checkbox' || el.type === 'radio') {
+    return el.checked ? el.value : '';
   }
-  const payload = { field: el.name, value: el.value };
+  return el.value;
+}
+
+function pyformaticIncludes(form, el) {
+  const fields = {};
   if (el.dataset.include) {
-    payload.fields = {};
     el.dataset.include.split(',').forEach(name => {
       const other = form.querySelector(`[name="${name}"]`);
       if (other) {
-        if (other.type === 'checkbox' || other.type === 'radio') {
-          payload.fields[name] = other.checked ? other.value : '';
-        } else {
-          payload.fields[name] = other.value;
-        }
+        fields[name] = pyformaticFieldValue(other);
       }
     });
   }
-  fetch(form.action, {
+  return fields;
+}
+
+function pyformaticApplyResult(el, resp) {
+  el.value = resp.value;
+  const outer = el.closest('div');
+  if (outer) {
+    outer.classList.remove('info', 'warning', 'error', 'ok');
+    if (resp.level) {
+      outer.classList.add(resp.level);
+    }
+    const msg = outer.querySelector('.validation-msg');
+    if (msg) {
+      msg.textContent = resp.message || '';
+      msg.className = 'validation-msg ' + (resp.level || '');
+    }
+  }
+}
+
+function pyformaticPost(form, payload) {
+  return fetch(form.action, {
     method: 'POST',
     headers: { 'Content-Type': 'application/json' },
     body: JSON.stringify(payload)
-  }).then(r => r.json()).then(resp => {
-    el.value = resp.value;
-    const outer = el.closest('div');
-    if (outer) {
-      outer.classList.remove('info', 'warning', 'error', 'ok');
-      if (resp.level) {
-        outer.classList.add(resp.level);
-      }
-      const msg = outer.querySelector('.validation-msg');
-      if (msg) {
-        msg.textContent = resp.message || '';
-        msg.className = 'validation-msg ' + (resp.level || '');
-      }
+  }).then(r => r.json());
+}
+
+function pyformaticFlush(form) {
+  const queue = pyformaticQueues.get(form);
+  pyformaticQueues.delete(form);
+  const elements = Array.from(queue.fields.values());
+  if (elements.length === 1) {
+    // A lone field keeps using the single-field payload.
+    const el = elements[0];
+    const payload = { field: el.name, value: el.value };
+    if (el.dataset.include) {
+      payload.fields = pyformaticIncludes(form, el);
     }
+    pyformaticPost(form, payload).then(resp => pyformaticApplyResult(el, resp));
+    return;
+  }
+  const payload = { fields: {}, validate: [] };
+  elements.forEach(el => {
+    Object.assign(payload.fields, pyformaticIncludes(form, el));
+  });
+  elements.forEach(el => {
+    payload.fields[el.name] = el.value;
+    payload.validate.push(el.name);
   });
+  pyformaticPost(form, payload).then(resp => {
+    elements.forEach(el => {
+      const result = resp.results && resp.results[el.name];
+      if (result) {
+        pyformaticApplyResult(el, result);
+      }
+    });
+  });
+}
+
+function pyformaticValidateField(ev) {
+  const el = ev.target;
+  const form = el.closest('form');
+  if (!form) {
+    return;
+  }
+  let queue = pyformaticQueues.get(form);
+  if (!queue) {
+    queue = { fields: new Map() };
+    pyformaticQueues.set(form, queue);
+    setTimeout(() => pyformaticFlush(form), PYFORMATIC_BATCH_WINDOW);
+  }
+  queue.fields.set(el.name, el);
 }
 
 function pyformaticInit() {
@@ -0,0 +1,756 @@
+"""Single steps of a multi-step form and their validation."""
+from __future__ import annotations
+
+import asyncio
+import os
+from importlib import import_module
+from threading import RLock
+from types import CodeType, MethodType, SimpleNamespace
+from typing import Any, Callable, Mapping, NamedTuple, Sequence
+from inspect import isawaitable, iscoroutinefunction, ismethod, signature
+
+from .codecache import CodeCache, default_cache
+from .constraints import compile_constraints
+from .form import Form
+from .loader import line_of
+from .elements import BaseElement, TextInput, Button, RawInput, RawElement
+from .offload import ValidatorPool, process_target
+from .state import FormState
+from .exceptions import (
+    ValidationError,
+    ValidationInfo,
+    ValidationMessage,
+    ValidationWarning,
+)
+
+
+class FieldRef(NamedTuple):
+    """Precomputed lookup entry for one field of a step."""
+
+    item: BaseElement | None
+    validator: Callable | None
+    arity: int
+    is_async: bool = False
+    offload: bool = False
+    cacheable: bool = True
+    include: tuple[str, ...] = ()
+    check: Callable | None = None
+    batch: Callable | None = None
+    process_target: Callable | None = None
+
+
+EMPTY_FIELD = FieldRef(None, None, 0)
+BATCH_PREFIX = "validate_many_"
+# Set by ``_make_callable`` on wrappers of callables given in the config.
+_ORIGINAL_ATTR = "_pyformatic_original"
+
+
+def _outcome(value: Any, result: Any) -> tuple[Any, str, str]:
+    """Return the value, level and message for a validator ``result``."""
+    if isinstance(result, ValidationMessage):
+        return (result.value if result.value is not None else value), result.level, result.message
+    return (value if result is None else result), "ok", ""
+
+
+def step_field_names(config: Mapping[str, Any]) -> tuple[str, ...]:
+    """Return the names of the input fields configured for a step."""
+    return tuple(
+        f["name"]
+        for f in config.get("fields", [])
+        if f.get("type") not in {"submit", "raw_html"}
+    )
+
+_UNSET = object()
+
+
+class Step:
+    """Represents a single stage of a multi-step form."""
+    # pylint: disable=too-many-instance-attributes  # lookup tables and offload settings
+
+    def __init__(  # pylint: disable=too-many-arguments  # initializer sets up many configurable options
+        self,
+        config: dict,
+        module_base: str | None,
+        action: str,
+        *,
+        is_last: bool = False,
+        validator_context: dict | None = None,
+        source: str | os.PathLike | None = None,
+        code_cache: CodeCache | None = None,
+    ) -> None:
+        """Create a step instance from configuration.
+
+        ``source`` names the flow file in error messages and tracebacks of
+        inline validators, which are compiled through ``code_cache``. The
+        step's validator module is imported when a field is first
+        validated, or by :meth:`warmup`.
+        """
+        fields = [f for f in config.get("fields", []) if f.get("type") != "submit"]
+        self.config = {**config, "fields": fields}
+        self.module_base = module_base
+        self.validator_context = validator_context
+        self.source = source
+        self.code_cache = code_cache if code_cache is not None else default_cache
+        self._inline = self._inline_validators(fields, config)
+        self._validator: Any = None
+        self._lock = RLock()
+        self.form = Form(config['name'], action=action)
+        for idx, field in enumerate(fields):
+            self._add_field(field, idx)
+        button_label = config.get("button_label", "Submit" if is_last else "Next")
+        self.form.add_button(Button(name="submit" if is_last else "next", label=button_label))
+        self.field_names = step_field_names(self.config)
+        self._fields: dict[str, FieldRef] | None = None
+        self._validation_order: tuple[tuple[str, ...], ...] = ()
+        self.pool: ValidatorPool | None = None
+        self.offload_all = False
+
+    @property
+    def validator(self) -> Any:
+        """Return the validator instance, importing its module if needed."""
+        if self._validator is None:
+            with self._lock:
+                if self._validator is None:
+                    self._validator = self._bind_validator()
+        return self._validator
+
+    @validator.setter
+    def validator(self, value: Any) -> None:
+        with self._lock:
+            self._validator = value
+            self._fields = None
+
+    @property
+    def loaded(self) -> bool:
+        """Return True once the validator module has been loaded."""
+        return self._validator is not None
+
+    @property
+    def fields(self) -> dict[str, FieldRef]:
+        """Return the field lookup table, building it on first use."""
+        if self._fields is None:
+            self.reindex()
+        return self._fields
+
+    @property
+    def validation_order(self) -> tuple[tuple[str, ...], ...]:
+        """Return the field groups used by :meth:`validate_async`."""
+        if self._fields is None:
+            self.reindex()
+        return self._validation_order
+
+    def warmup(self) -> Step:
+        """Load the validator module and build the lookup tables now."""
+        self.reindex()
+        return self
+
+    def reindex(self) -> None:
+        """Rebuild the field lookup tables.
+
+        Called on first validation and when :attr:`validator` is replaced.
+        Validator methods assigned later are found without it; call it
+        after adding form items.
+        """
+        with self._lock:
+            self.field_names = step_field_names(self.config)
+            items = {}
+            for item in self.form.items:
+                items.setdefault(item.name, item)
+            configs = {f["name"]: f for f in self.config.get("fields", []) if "name" in f}
+            self._fields = {
+                name: self._field_ref(name, items.get(name), configs.get(name, {}))
+                for name in {*items, *self.field_names}
+            }
+            self._validation_order = self._validation_order_groups()
+
+    def _ref(self, name: str) -> FieldRef:
+        """Return the lookup entry for ``name``.
+
+        The validator method is looked up again on every call, so methods
+        assigned or replaced after the index was built are used.
+        """
+        ref = self.fields.get(name)
+        if ref is None:
+            return self._field_ref(name, None)
+        current = getattr(self.validator, name, None)
+        if current != ref.validator and (callable(current) or ref.validator is not None):
+            config = next((f for f in self.config["fields"] if f.get("name") == name), {})
+            ref = self._fields[name] = self._field_ref(name, ref.item, config)
+        return ref
+
+    def _validation_order_groups(self) -> tuple[tuple[str, ...], ...]:
+        """Group field names so each group only includes earlier groups.
+
+        Fields listing another field of this step under ``include`` are
+        validated after it; fields within a group are independent. Cyclic
+        includes are validated one at a time in field order.
+        """
+        names = set(self.field_names)
+        deps = {
+            f["name"]: {n for n in f.get("include", []) if n in names and n != f["name"]}
+            for f in self.config.get("fields", [])
+            if f.get("name") in names
+        }
+        remaining = list(self.field_names)
+        done: set[str] = set()
+        groups: list[tuple[str, ...]] = []
+        while remaining:
+            ready = tuple(n for n in remaining if deps.get(n, set()) <= done)
+            group = ready or (remaining[0],)
+            groups.append(group)
+            done.update(group)
+            remaining = [n for n in remaining if n not in done]
+        return tuple(groups)
+
+    def _field_ref(
+        self,
+        name: str,
+        item: BaseElement | None,
+        config: Mapping[str, Any] | None = None,
+    ) -> FieldRef:
+        """Return the lookup entry for ``name`` configured by ``config``.
+
+        Declarative constraints in ``config`` are compiled into
+        :attr:`FieldRef.check`, which runs before the custom validator.
+        """
+        config = config or {}
+        func = getattr(self.validator, name, None)
+        if not callable(func):
+            func = None
+        code = getattr(func, "__code__", None)
+        # Validators taking only ``value`` are called without the data store.
+        arity = code.co_argcount - ismethod(func) if code else 2
+        # Markers set by the offload/uncached decorators, which may sit
+        # above other decorators or on a callable wrapped by _make_callable.
+        original = getattr(func, _ORIGINAL_ATTR, func)
+        marked = (func, original)
+        batch = getattr(self.validator, BATCH_PREFIX + name, None)
+        return FieldRef(
+            item,
+            func,
+            arity if func else 0,
+            iscoroutinefunction(func),
+            bool(
+                config.get("offload")
+                or any(getattr(f, "pyformatic_offload", False) for f in marked)
+            ),
+            bool(
+                config.get("cacheable", True)
+                and all(getattr(f, "pyformatic_cacheable", True) for f in marked)
+            ),
+            tuple(config.get("include", ())),
+            compile_constraints(config),
+            batch if callable(batch) else None,
+            process_target(name, func, original) if func else None,
+        )
+
+    def _memo_key(
+        self,
+        ref: FieldRef,
+        name: str,
+        value: Any,
+        data_view: Mapping[str, Any],
+    ) -> tuple | None:
+        """Return the memo key for validating ``value`` or ``None``."""
+        if not ref.cacheable:
+            return None
+        key = (self.form.id, name, value, tuple(data_view.get(n, "") for n in ref.include))
+        try:
+            hash(key)
+        except TypeError:
+            return None
+        return key
+
+    def _load_validator(self, module_base: str | None, name: str) -> Any:
+        """Return validator instance from module or an empty namespace."""
+        if not module_base:
+            return SimpleNamespace()
+        try:
+            module_path = f"{module_base}.validators.{name}"
+            module = import_module(module_path)
+            return module.Validator()
+        except ModuleNotFoundError:
+            return SimpleNamespace()
+
+    def _bind_validator(self) -> Any:
+        """Return the validator instance with context and inline validators."""
+        validator = self._load_validator(self.module_base, self.config["name"])
+        for name, value in (self.validator_context or {}).items():
+            setattr(validator, name, value)
+        for name, spec in self._inline.items():
+            setattr(validator, name, MethodType(self._make_callable(spec), validator))
+        return validator
+
+    @staticmethod
+    def _make_callable(spec: Callable | CodeType) -> Callable:
+        """Return a callable implementing the validator.
+
+        ``spec`` is a callable or the compiled code of an inline validator.
+        """
+        # pylint: disable=function-redefined  # wrapper must match original callable signature
+        if callable(spec):
+            sig_len = len(signature(spec).parameters)
+            if iscoroutinefunction(spec):
+                if sig_len <= 1:
+                    async def method(_, value):
+                        return await spec(value)
+                else:
+                    async def method(_, value, data_store):
+                        return await spec(value, data_store)
+            elif sig_len <= 1:
+                def method(_, value):
+                    return spec(value)
+            else:
+                def method(_, value, data_store):
+                    return spec(value, data_store)
+            setattr(method, _ORIGINAL_ATTR, spec)  # the picklable original for process pools
+            return method
+        local: dict[str, Any] = {}
+        exec(  # pylint: disable=exec-used  # executing inline validator code from YAML
+            spec,
+            {
+                "ValidationError": ValidationError,
+                "ValidationInfo": ValidationInfo,
+                "ValidationWarning": ValidationWarning,
+            },
+            local,
+        )
+        def method(_, value, data_store):
+            return local["_v"](value, data_store)
+
+        return method
+
+    def _inline_validators(
+        self,
+        fields: list[dict],
+        config: dict,
+    ) -> dict[str, Callable | CodeType]:
+        """Return the inline validators defined in the configuration.
+
+        Source is compiled right away, so syntax errors raise
+        :class:`FlowConfigError` when the step is built.
+        """
+        configured = config.get("validators", {})
+        validators = {
+            name: (spec, line_of(configured, name)) for name, spec in configured.items()
+        }
+        for field in fields:
+            if "validator" in field:
+                validators[field["name"]] = (field["validator"], line_of(field, "validator"))
+        return {
+            name: spec if callable(spec)
+            else self.code_cache.compile_validator(str(spec), name, line, self.source)
+            for name, (spec, line) in validators.items()
+        }
+
+    def _add_field(self, field: dict, idx: int) -> None:
+        """Add a configured field to ``self.form``."""
+        field_type = field.get('type', 'text')
+        if field_type == 'raw_html':
+            self.form.add_item(
+                RawElement(
+                    name=field.get('name', f'raw_{idx}'),
+                    label='',
+                    html=field.get('html', ''),
+                )
+            )
+            return
+        if field_type == 'raw_input':
+            item = RawInput(
+                name=field['name'],
+                label=field.get('label', ''),
+                html=field.get('html', ''),
+            )
+            item.include = field.get('include', [])
+            self.form.add_item(item)
+            return
+        item = TextInput(name=field['name'], label=field.get('label', ''))
+        item.input_type = field_type
+        item.include = field.get('include', [])
+        self.form.add_item(item)
+
+    def validate_field(  # pylint: disable=too-many-arguments  # flexible API for custom validators
+        self,
+        name: str,
+        value: str,
+        data_store: dict,
+        *,
+        update_data: bool = False,
+        extra_fields: Mapping[str, str] | None = None,
+        state: FormState | None = None,
+    ) -> tuple[str, str | None, str]:
+        """Validate a single field.
+
+        ``extra_fields`` may contain additional field values to temporarily
+        merge into ``data_store`` for the validation call.
+
+        The result is recorded in ``state`` when given. Without a state the
+        matching form element is updated in place, which is only safe when
+        the step is not shared between requests.
+
+        Returns the possibly modified value, message level and message text.
+        Async validators must be run with :meth:`validate_field_async`.
+        """
+        ref = self._ref(name)
+        if ref.validator is None and ref.check is None:
+            return value, None, ""
+        if ref.is_async:
+            raise TypeError(f"validator for {name!r} is async; use validate_field_async()")
+        memo = state.memo if state is not None else None
+        key = None
+        if memo is not None:
+            key = self._memo_key(ref, name, value, {**data_store, **(extra_fields or {})})
+        result: Any = memo.get(key, _UNSET) if key is not None else _UNSET
+        if result is _UNSET:
+            try:
+                result = self._call(ref, value, data_store, extra_fields)
+            except ValidationMessage as exc:  # catch info/warn/error
+                result = exc.with_traceback(None)
+            if key is not None:
+                memo.set(key, result)
+        return self._record(
+            name, ref, value, result, data_store,
+            update_data=update_data, extra_fields=extra_fields, state=state,
+        )
+
+    async def validate_field_async(  # pylint: disable=too-many-arguments  # mirrors validate_field()
+        self,
+        name: str,
+        value: str,
+        data_store: dict,
+        *,
+        update_data: bool = False,
+        extra_fields: Mapping[str, str] | None = None,
+        state: FormState | None = None,
+    ) -> tuple[str, str | None, str]:
+        """Validate a single field, awaiting ``async def`` validators.
+
+        Accepts the same arguments as :meth:`validate_field`, which it
+        matches for synchronous validators. Synchronous validators marked
+        for offloading run in :attr:`pool` instead of on the event loop.
+        """
+        ref = self._ref(name)
+        if ref.validator is None and ref.check is None:
+            return value, None, ""
+        memo = state.memo if state is not None else None
+        key = None
+        if memo is not None:
+            key = self._memo_key(ref, name, value, {**data_store, **(extra_fields or {})})
+        result: Any = memo.get(key, _UNSET) if key is not None else _UNSET
+        if result is _UNSET:
+            try:
+                result = await self._call_async(ref, value, data_store, extra_fields)
+            except ValidationMessage as exc:  # catch info/warn/error
+                result = exc.with_traceback(None)
+            if key is not None:
+                memo.set(key, result)
+        return self._record(
+            name, ref, value, result, data_store,
+            update_data=update_data, extra_fields=extra_fields, state=state,
+        )
+
+    @staticmethod
+    def _call(
+        ref: FieldRef,
+        value: str,
+        data_store: dict,
+        extra_fields: Mapping[str, str] | None,
+    ) -> Any:
+        """Check the constraints of ``ref`` and invoke its validator."""
+        if ref.check is not None:
+            ref.check(value)
+        if ref.validator is None:
+            return value
+        if ref.arity == 1:
+            return ref.validator(value)
+        data_view = data_store if not extra_fields else {**data_store, **extra_fields}
+        return ref.validator(value, data_view)
+
+    async def _call_async(
+        self,
+        ref: FieldRef,
+        value: str,
+        data_store: dict,
+        extra_fields: Mapping[str, str] | None,
+    ) -> Any:
+        """Invoke the validator of ``ref``, offloading or awaiting it as needed."""
+        func = None
+        if self.pool is not None and not ref.is_async and (ref.offload or self.offload_all):
+            func = ref.process_target if self.pool.kind == "process" else ref.validator
+        if func is not None:
+            if ref.check is not None:
+                ref.check(value)
+            if ref.arity == 1:
+                return await self.pool.run(func, value)
+            return await self.pool.run(func, value, {**data_store, **(extra_fields or {})})
+        result = self._call(ref, value, data_store, extra_fields)
+        if isawaitable(result):
+            result = await result
+        return result
+
+    def _record(  # pylint: disable=too-many-arguments  # shared by sync and async validation
+        self,
+        name: str,
+        ref: FieldRef,
+        value: str,
+        result: Any,
+        data_store: dict,
+        *,
+        update_data: bool,
+        extra_fields: Mapping[str, str] | None,
+        state: FormState | None,
+    ) -> tuple[str, str | None, str]:
+        """Store the outcome of a validator call and return it."""
+        new_value, level, message = _outcome(value, result)
+        if update_data:
+            data_store[name] = new_value
+            if extra_fields:
+                data_store.update(extra_fields)
+        if state is not None:
+            state.set(name, value=new_value, level=level, message=message if level else None)
+            return new_value, level, message
+        item = ref.item
+        if item:
+            item.value = new_value
+            item.message = message if level else None
+            item.classes_outer = [
+                c for c in item.classes_outer
+                if c not in {"info", "warning", "error", "ok"}
+            ]
+            if level:
+                item.classes_outer.append(level)
+        return new_value, level, message
+
+    def validate_many(
+        self,
+        name: str,
+        values: Sequence[Any],
+        data_columns: Mapping[str, Sequence[Any]] | None = None,
+        *,
+        data_rows: Sequence[Mapping[str, Any]] | None = None,
+    ) -> tuple[list[Any], list[str | None], list[str]]:
+        """Validate a whole column of values for field ``name``.
+
+        ``data_columns`` maps other field names to columns of the same
+        length. Returns lists of the cleaned values, levels and messages,
+        one per value, matching :meth:`validate_field`. Nothing is recorded
+        on the form or in a state.
+
+        If the validator class defines ``validate_many_<name>(values,
+        data_columns)`` it is called once with the values that pass the
+        field's constraints and must return the cleaned values, levels
+        (``"ok"``, ``"info"``, ``"warning"`` or ``"error"``) and messages
+        as sequences, for example NumPy arrays. Otherwise the validator is
+        called per value with that row's data, taken from ``data_rows``
+        when given.
+        """
+        ref = self._ref(name)
+        count = len(values)
+        if ref.validator is None and ref.check is None and ref.batch is None:
+            return list(values), [None] * count, [""] * count
+        columns = data_columns or {}
+        if ref.batch is not None:
+            if iscoroutinefunction(ref.batch):
+                raise TypeError(f"{BATCH_PREFIX}{name} must not be async")
+            return self._validate_batch(ref, values, columns)
+        if ref.is_async:
+            raise TypeError(f"validator for {name!r} is async; use validate_many_async()")
+        if data_rows is None:
+            data_rows = [{k: col[i] for k, col in columns.items()} for i in range(count)]
+        return self._validate_each(ref, values, data_rows)
+
+    async def validate_many_async(
+        self,
+        name: str,
+        values: Sequence[Any],
+        data_columns: Mapping[str, Sequence[Any]] | None = None,
+        *,
+        data_rows: Sequence[Mapping[str, Any]] | None = None,
+    ) -> tuple[list[Any], list[str | None], list[str]]:
+        """Asynchronous counterpart of :meth:`validate_many`.
+
+        ``async def`` validators are awaited for all values concurrently;
+        other fields are validated as by :meth:`validate_many`.
+        """
+        ref = self._ref(name)
+        if not ref.is_async or ref.batch is not None:
+            return self.validate_many(name, values, data_columns, data_rows=data_rows)
+        if data_rows is None:
+            columns = data_columns or {}
+            data_rows = [{k: col[i] for k, col in columns.items()} for i in range(len(values))]
+
+        async def one(value: Any, row: Mapping[str, Any]) -> tuple[Any, str | None, str]:
+            try:
+                result = await self._call_async(ref, value, dict(row), None)
+            except ValidationMessage as exc:
+                result = exc
+            return _outcome(value, result)
+
+        outcomes = await asyncio.gather(*(one(v, row) for v, row in zip(values, data_rows)))
+        return (
+            [outcome[0] for outcome in outcomes],
+            [outcome[1] for outcome in outcomes],
+            [outcome[2] for outcome in outcomes],
+        )
+
+    def _validate_each(
+        self,
+        ref: FieldRef,
+        values: Sequence[Any],
+        data_rows: Sequence[Mapping[str, Any]],
+    ) -> tuple[list[Any], list[str | None], list[str]]:
+        """Call the validator of ``ref`` once per value."""
+        cleaned = list(values)
+        levels: list[str | None] = ["ok"] * len(cleaned)
+        messages = [""] * len(cleaned)
+        for i, (value, row) in enumerate(zip(values, data_rows)):
+            try:
+                result = self._call(ref, value, row, None)
+            except ValidationMessage as exc:
+                result = exc
+            cleaned[i], levels[i], messages[i] = _outcome(value, result)
+        return cleaned, levels, messages
+
+    @staticmethod
+    def _validate_batch(
+        ref: FieldRef,
+        values: Sequence[Any],
+        columns: Mapping[str, Sequence[Any]],
+    ) -> tuple[list[Any], list[str | None], list[str]]:
+        """Run the constraints per value and the batch validator once."""
+        count = len(values)
+        cleaned = list(values)
+        levels: list[str | None] = ["ok"] * count
+        messages = [""] * count
+        passed: Sequence[int] = range(count)
+        if ref.check is not None:
+            passed = []
+            for i, value in enumerate(values):
+                try:
+                    ref.check(value)
+                except ValidationMessage as exc:
+                    cleaned[i], levels[i], messages[i] = _outcome(value, exc)
+                else:
+                    passed.append(i)
+            if len(passed) < count:
+                values = [values[i] for i in passed]
+                columns = {k: [col[i] for i in passed] for k, col in columns.items()}
+        if passed:
+            out_values, out_levels, out_messages = ref.batch(values, columns)
+            for j, i in enumerate(passed):
+                cleaned[i] = out_values[j]
+                levels[i] = out_levels[j] or "ok"
+                messages[i] = out_messages[j] or ""
+        return cleaned, levels, messages
+
+    def validate(
+        self,
+        data: dict,
+        data_store: dict,
+        state: FormState | None = None,
+    ) -> tuple[dict, bool]:
+        """Validate all fields in this step and update ``data_store``."""
+        results = {
+            name: self.validate_field(
+                name,
+                data.get(name, ''),
+                data_store,
+                update_data=True,
+                state=state,
+            )
+            for name in self.field_names
+        }
+        return self._messages(results)
+
+    async def validate_async(
+        self,
+        data: dict,
+        data_store: dict,
+        state: FormState | None = None,
+    ) -> tuple[dict, bool]:
+        """Validate all fields like :meth:`validate`, awaiting async validators.
+
+        Fields are validated concurrently, group by group of
+        :attr:`validation_order`, so a field always sees the validated
+        values of the fields it ``include``s.
+        """
+        results: dict[str, tuple[str, str | None, str]] = {}
+        for group in self.validation_order:
+            outcomes = await asyncio.gather(
+                *(
+                    self.validate_field_async(
+                        name,
+                        data.get(name, ''),
+                        data_store,
+                        update_data=True,
+                        state=state,
+                    )
+                    for name in group
+                )
+            )
+            results.update(zip(group, outcomes))
+        return self._messages({name: results[name] for name in self.field_names})
+
+    @staticmethod
+    def _messages(results: Mapping[str, tuple[str, str | None, str]]) -> tuple[dict, bool]:
+        """Return the messages and error flag for per-field ``results``."""
+        messages: dict[str, dict] = {}
+        has_error = False
+        for name, (new_val, level, msg) in results.items():
+            if level:
+                messages[name] = {"level": level, "message": msg, "value": new_val}
+                if level == "error":
+                    has_error = True
+        return messages, has_error
+
+
+class LazySteps(Sequence):
+    """Sequence of steps that are built on first access.
+
+    ``factory`` builds the step for an index of ``configs``. Field names
+    and form ids are answered from the configuration, so walking a flow
+    only builds the steps that are rendered or validated. ``on_load`` is
+    called with each step once it is built.
+    """
+
+    def __init__(
+        self,
+        configs: Sequence[Mapping[str, Any]],
+        factory: Callable[[int], Step],
+    ) -> None:
+        self.configs = list(configs)
+        self.on_load: Callable[[Step], None] | None = None
+        self._factory = factory
+        self._steps: list[Step | None] = [None] * len(self.configs)
+        self._lock = RLock()
+
+    def __len__(self) -> int:
+        return len(self._steps)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(len(self)))]
+        step = self._steps[index]
+        if step is None:
+            with self._lock:
+                step = self._steps[index]
+                if step is None:
+                    step = self._factory(range(len(self))[index])
+                    if self.on_load is not None:
+                        self.on_load(step)
+                    self._steps[index] = step
+        return step
+
+    def is_loaded(self, index: int) -> bool:
+        """Return True if the step at ``index`` has been built."""
+        return self._steps[index] is not None
+
+    def field_names(self, index: int) -> tuple[str, ...]:
+        """Return the field names of a step without building it."""
+        step = self._steps[index]
+        return step.field_names if step is not None else step_field_names(self.configs[index])
+
+    def form_id(self, index: int) -> str:
+        """Return the form id of a step without building it."""
+        step = self._steps[index]
+        return step.form.id if step is not None else self.configs[index]["name"]
@@ -0,0 +1,230 @@
+"""Server-side storage for in-progress flow data."""
+
+from __future__ import annotations
+
+import asyncio
+import atexit
+import json
+import sqlite3
+import time
+import weakref
+from abc import ABC, abstractmethod
+from secrets import token_urlsafe
+from threading import Lock, Timer
+from typing import Any, Callable, Mapping
+
+from .cache import LRUCache
+
+
+class FlowStateStore(ABC):
+    """Interface for keeping a flow's ``data_store`` on the server.
+
+    :func:`~pyformatic.flow_runner.run_form_flow` keeps only the id returned
+    by :meth:`new_id` in the session and loads and saves the data through
+    the ``*_async`` methods on every request. They call the synchronous
+    methods directly; stores doing blocking IO override them to run it in
+    a thread.
+    """
+
+    def new_id(self) -> str:
+        """Return a new, unguessable state id."""
+        return token_urlsafe(24)
+
+    @abstractmethod
+    def load(self, state_id: str) -> dict[str, Any] | None:
+        """Return the data saved under ``state_id`` or ``None``."""
+
+    @abstractmethod
+    def save(self, state_id: str, data: Mapping[str, Any]) -> None:
+        """Store ``data`` under ``state_id``, replacing earlier data."""
+
+    @abstractmethod
+    def delete(self, state_id: str) -> None:
+        """Remove the data stored under ``state_id``."""
+
+    async def load_async(self, state_id: str) -> dict[str, Any] | None:
+        """Asynchronous counterpart of :meth:`load`."""
+        return self.load(state_id)
+
+    async def save_async(self, state_id: str, data: Mapping[str, Any]) -> None:
+        """Asynchronous counterpart of :meth:`save`."""
+        self.save(state_id, data)
+
+    async def delete_async(self, state_id: str) -> None:
+        """Asynchronous counterpart of :meth:`delete`."""
+        self.delete(state_id)
+
+    def close(self) -> None:
+        """Release resources held by the store."""
+
+
+class MemoryStateStore(FlowStateStore):
+    """Bounded in-process store with LRU eviction and TTL expiry.
+
+    At most ``maxsize`` flows are kept; entries not saved for ``ttl``
+    seconds are treated as missing. Data is lost when the process exits and
+    is not shared between worker processes.
+    """
+
+    def __init__(
+        self,
+        maxsize: int = 10000,
+        *,
+        ttl: float = 3600.0,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self.ttl = ttl
+        self.clock = clock
+        self._entries = LRUCache(maxsize)
+
+    @property
+    def stats(self):
+        """Return the hit and miss counters of the underlying cache."""
+        return self._entries.stats
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def load(self, state_id: str) -> dict[str, Any] | None:
+        entry = self._entries.get(state_id)
+        if entry is None:
+            return None
+        expires, data = entry
+        if expires <= self.clock():
+            self._entries.pop(state_id)
+            return None
+        return dict(data)
+
+    def save(self, state_id: str, data: Mapping[str, Any]) -> None:
+        self._entries.set(state_id, (self.clock() + self.ttl, dict(data)))
+
+    def delete(self, state_id: str) -> None:
+        self._entries.pop(state_id)
+
+
+class SQLiteStateStore(FlowStateStore):
+    """Store flow data in a local SQLite database.
+
+    Every change is committed at once by default, so several worker
+    processes can share the database. With ``batch_size`` above one,
+    writes are buffered and committed in one transaction once
+    ``batch_size`` changes are pending or at most ``flush_interval``
+    seconds after the first of them; reads in this process see buffered
+    writes immediately, and buffered writes are flushed at exit. Expired
+    rows are deleted at most every ``evict_interval`` seconds during a
+    flush. The ``*_async`` methods run the database calls in a thread.
+    """
+
+    # pylint: disable=too-many-instance-attributes  # buffering and eviction bookkeeping
+
+    def __init__(  # pylint: disable=too-many-arguments  # tuning knobs for batching
+        self,
+        path: str = "pyformatic-state.sqlite3",
+        *,
+        ttl: float = 86400.0,
+        batch_size: int = 1,
+        flush_interval: float = 1.0,
+        evict_interval: float = 60.0,
+        clock: Callable[[], float] = time.time,
+    ) -> None:
+        self.ttl = ttl
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.evict_interval = evict_interval
+        self.clock = clock
+        self._lock = Lock()
+        self._pending: dict[str, tuple[str, float] | None] = {}
+        self._timer: Timer | None = None
+        self._closed = False
+        self._last_flush = self._last_evict = clock()
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        if path != ":memory:":
+            self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS flow_state "
+            "(id TEXT PRIMARY KEY, data TEXT NOT NULL, expires REAL NOT NULL)"
+        )
+        self._conn.commit()
+        atexit.register(_close_at_exit, weakref.ref(self))
+
+    def load(self, state_id: str) -> dict[str, Any] | None:
+        now = self.clock()
+        with self._lock:
+            if state_id in self._pending:
+                pending = self._pending[state_id]
+                if pending is None or pending[1] <= now:
+                    return None
+                return json.loads(pending[0])
+            row = self._conn.execute(
+                "SELECT data FROM flow_state WHERE id = ? AND expires > ?",
+                (state_id, now),
+            ).fetchone()
+        return json.loads(row[0]) if row else None
+
+    def save(self, state_id: str, data: Mapping[str, Any]) -> None:
+        self._queue(state_id, (json.dumps(dict(data)), self.clock() + self.ttl))
+
+    def delete(self, state_id: str) -> None:
+        self._queue(state_id, None)
+
+    async def load_async(self, state_id: str) -> dict[str, Any] | None:
+        return await asyncio.to_thread(self.load, state_id)
+
+    async def save_async(self, state_id: str, data: Mapping[str, Any]) -> None:
+        await asyncio.to_thread(self.save, state_id, data)
+
+    async def delete_async(self, state_id: str) -> None:
+        await asyncio.to_thread(self.delete, state_id)
+
+    def _queue(self, state_id: str, entry: tuple[str, float] | None) -> None:
+        with self._lock:
+            self._pending[state_id] = entry
+            due = self.clock() - self._last_flush >= self.flush_interval
+            if len(self._pending) >= self.batch_size or due:
+                self._flush()
+            elif self._timer is None:
+                self._timer = Timer(self.flush_interval, self.flush)
+                self._timer.daemon = True
+                self._timer.start()
+
+    def flush(self) -> None:
+        """Write all buffered changes to the database."""
+        with self._lock:
+            if not self._closed:
+                self._flush()
+
+    def _flush(self) -> None:
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        now = self.clock()
+        pending, self._pending = self._pending, {}
+        upserts = [(sid, e[0], e[1]) for sid, e in pending.items() if e is not None]
+        deletes = [(sid,) for sid, e in pending.items() if e is None]
+        with self._conn:
+            if upserts:
+                self._conn.executemany(
+                    "INSERT OR REPLACE INTO flow_state (id, data, expires) VALUES (?, ?, ?)",
+                    upserts,
+                )
+            if deletes:
+                self._conn.executemany("DELETE FROM flow_state WHERE id = ?", deletes)
+            if now - self._last_evict >= self.evict_interval:
+                self._conn.execute("DELETE FROM flow_state WHERE expires <= ?", (now,))
+                self._last_evict = now
+        self._last_flush = now
+
+    def close(self) -> None:
+        with self._lock:
+            if self._closed:
+                return
+            self._flush()
+            self._closed = True
+            self._conn.close()
+
+
+def _close_at_exit(ref: weakref.ref[SQLiteStateStore]) -> None:
+    """Flush buffered writes of a store that is still open at exit."""
+    store = ref()
+    if store is not None:
+        store.close()
@@ -0,0 +1,305 @@
+"""Process-wide registry of Jinja environments and compiled templates."""
+
+from __future__ import annotations
+
+from importlib import resources
+from pathlib import Path
+from threading import Lock
+from typing import Any, Callable, Iterable
+from weakref import WeakKeyDictionary
+
+from jinja2 import (
+    Environment,
+    FileSystemBytecodeCache,
+    FileSystemLoader,
+    ModuleLoader,
+    Template,
+    TemplateNotFound,
+    select_autoescape,
+)
+
+from .cache import CacheStats, LRUCache
+from .render_plan import RenderPlan
+
+# Render plans kept per environment, and how many renders in a row may
+# build plans for one template without a cache hit before new plans stop
+# being built for it.
+PLAN_CACHE_SIZE = 1024
+PLAN_MISS_LIMIT = 8
+_MISSING = object()
+
+
+def builtin_template_dir() -> str:
+    """Return the directory holding the bundled templates."""
+    return str(resources.files(__package__) / "templates")
+
+
+def search_paths(template_dirs: Iterable[str] | None = None) -> tuple[str, ...]:
+    """Return the template search path with the bundled templates last."""
+    paths = [str(p) for p in template_dirs or []]
+    paths.append(builtin_template_dir())
+    return tuple(paths)
+
+
+def bytecode_cache(directory: str) -> FileSystemBytecodeCache:
+    """Return a bytecode cache storing compiled templates in ``directory``.
+
+    The directory is created if needed and may be shared by several worker
+    processes. Entries are checked against the template source and are
+    recompiled when it changes.
+    """
+    Path(directory).mkdir(parents=True, exist_ok=True)
+    return FileSystemBytecodeCache(str(directory), "pyformatic-%s.cache")
+
+
+def compile_templates(
+    target: str,
+    template_dirs: Iterable[str] | None = None,
+    *,
+    zip_bundle: bool = True,
+    log_function: Callable[[str], None] | None = None,
+) -> None:
+    """Precompile all templates on the search path into ``target``.
+
+    The bundled ``ui`` and ``multi_step`` templates are compiled together with
+    any ``template_dirs``, which take precedence as they do at render time.
+    ``target`` becomes a zip file when ``zip_bundle`` is true, otherwise a
+    directory of Python modules. Pass it as ``compiled_templates`` to
+    :class:`~pyformatic.display.Display` or
+    :class:`~pyformatic.formflow.FormFlow` to render without reading template
+    sources.
+    """
+    env = Environment(
+        loader=FileSystemLoader(list(search_paths(template_dirs))),
+        autoescape=select_autoescape(["html", "xml"]),
+    )
+    env.compile_templates(
+        target,
+        extensions=["html", "xml"],
+        zip="deflated" if zip_bundle else None,
+        log_function=log_function,
+        ignore_errors=False,
+    )
+
+
+class _EnvTemplates:  # pylint: disable=too-few-public-methods  # plain cache holder
+    """Templates resolved for a single environment."""
+
+    def __init__(self) -> None:
+        self.by_name: dict[str, Template] = {}
+        self.by_input_type: dict[str, Template] = {}
+        self.plans = LRUCache(PLAN_CACHE_SIZE)
+        self.plan_streaks: dict[Template, tuple[int, object]] = {}
+        self.key: tuple | None = None
+        self.fragments: dict[int, LRUCache] = {}
+
+
+class TemplateRegistry:
+    """Share environments and compiled templates between renders.
+
+    Environments are keyed by their template search path and options so
+    every :class:`~pyformatic.display.Display` and
+    :class:`~pyformatic.formflow.FormFlow` using the same configuration
+    compiles each template only once per process.
+    """
+
+    def __init__(self) -> None:
+        self._lock = Lock()
+        self._envs: dict[tuple, Environment] = {}
+        self._templates: WeakKeyDictionary[Environment, _EnvTemplates] = (
+            WeakKeyDictionary()
+        )
+        self.env_stats = CacheStats()
+        self.template_stats = CacheStats()
+        self.plan_stats = CacheStats()
+
+    def environment(
+        self,
+        template_dirs: Iterable[str] | None = None,
+        *,
+        bytecode_cache_dir: str | None = None,
+        compiled_templates: str | None = None,
+        **options: Any,
+    ) -> Environment:
+        """Return the shared environment for ``template_dirs`` and ``options``.
+
+        ``bytecode_cache_dir`` enables a persistent on-disk bytecode cache.
+        ``compiled_templates`` points at a bundle written by
+        :func:`compile_templates`; templates are then loaded from it and
+        ``template_dirs`` are not read. Other ``options`` are passed to
+        :class:`jinja2.Environment` and must be hashable.
+        """
+        paths = search_paths(template_dirs)
+        cache_dir = str(bytecode_cache_dir) if bytecode_cache_dir else None
+        bundle = str(compiled_templates) if compiled_templates else None
+        return self._environment((paths, cache_dir, bundle, tuple(sorted(options.items()))))
+
+    def _environment(self, key: tuple) -> Environment:
+        with self._lock:
+            env = self._envs.get(key)
+            if env is not None:
+                self.env_stats.hits += 1
+                return env
+            self.env_stats.misses += 1
+            paths, cache_dir, bundle, options = key
+            options = dict(options)
+            if bundle:
+                loader = ModuleLoader(bundle)
+            else:
+                loader = FileSystemLoader(list(paths))
+                if cache_dir:
+                    options["bytecode_cache"] = bytecode_cache(cache_dir)
+            env = Environment(
+                loader=loader,
+                autoescape=select_autoescape(["html", "xml"]),
+                **options,
+            )
+            self._envs[key] = env
+            self._entry(env).key = key
+            return env
+
+    def async_environment(self, env: Environment) -> Environment | None:
+        """Return the async-enabled counterpart of ``env``.
+
+        ``None`` is returned for environments that were not created by this
+        registry and for compiled bundles, whose templates are compiled for
+        synchronous rendering only.
+        """
+        if env.is_async:
+            return env
+        key = self._entry(env).key
+        if key is None or key[2]:
+            return None
+        paths, cache_dir, bundle, options = key
+        options = tuple(sorted({**dict(options), "enable_async": True}.items()))
+        return self._environment((paths, cache_dir, bundle, options))
+
+    def _entry(self, env: Environment) -> _EnvTemplates:
+        entry = self._templates.get(env)
+        if entry is None:
+            entry = self._templates.setdefault(env, _EnvTemplates())
+        return entry
+
+    @staticmethod
+    def _is_fresh(env: Environment, tpl: Template) -> bool:
+        return not env.auto_reload or tpl.is_up_to_date
+
+    def _count(self, *, hit: bool) -> None:
+        with self._lock:
+            if hit:
+                self.template_stats.hits += 1
+            else:
+                self.template_stats.misses += 1
+
+    def get_template(self, env: Environment, name: str) -> Template:
+        """Return the compiled template ``name`` from ``env``."""
+        entry = self._entry(env)
+        tpl = entry.by_name.get(name)
+        if tpl is not None and self._is_fresh(env, tpl):
+            self._count(hit=True)
+            return tpl
+        self._count(hit=False)
+        tpl = env.get_template(name)
+        entry.by_name[name] = tpl
+        return tpl
+
+    def input_template(self, env: Environment, input_type: str) -> Template:
+        """Return the template for ``input_type``, falling back to the default.
+
+        The result of the lookup, including a fallback to ``ui/input.html``,
+        is remembered so missing per-type templates are not searched for on
+        every render.
+        """
+        entry = self._entry(env)
+        tpl = entry.by_input_type.get(input_type)
+        if tpl is not None and self._is_fresh(env, tpl):
+            self._count(hit=True)
+            return tpl
+        self._count(hit=False)
+        try:
+            tpl = env.get_template(f"ui/input_{input_type}.html")
+        except TemplateNotFound:
+            tpl = env.get_template("ui/input.html")
+        entry.by_input_type[input_type] = tpl
+        return tpl
+
+    def render_plan(  # pylint: disable=too-many-arguments  # render identifies the caller's pass
+        self,
+        env: Environment,
+        tpl: Template,
+        key: tuple,
+        build: Callable[[], RenderPlan | None],
+        *,
+        render: object = None,
+    ) -> RenderPlan | None:
+        """Return the cached render plan of ``tpl`` for ``key``, building it if needed.
+
+        ``None`` results, meaning the output cannot be planned, are cached
+        as well so the probe renders are not repeated. At most
+        :data:`PLAN_CACHE_SIZE` plans are kept per environment.
+
+        ``render`` identifies one render of a form, so all misses of a
+        first render count once. After :data:`PLAN_MISS_LIMIT` renders in a
+        row that only missed for ``tpl``, no new plans are built for it and
+        ``None`` is returned for uncached keys until a lookup hits again.
+        Without ``render`` every lookup counts as a render.
+        """
+        entry = self._entry(env)
+        plan = entry.plans.get((tpl, key), _MISSING)
+        if plan is not _MISSING:
+            entry.plan_streaks[tpl] = (0, render)
+            with self._lock:
+                self.plan_stats.hits += 1
+            return plan
+        streak, last = entry.plan_streaks.get(tpl, (0, None))
+        if render is None or render is not last:
+            if streak >= PLAN_MISS_LIMIT:
+                return None
+            entry.plan_streaks[tpl] = (streak + 1, render)
+        with self._lock:
+            self.plan_stats.misses += 1
+        plan = build()
+        entry.plans.set((tpl, key), plan)
+        return plan
+
+    def fragment_cache(self, env: Environment, maxsize: int) -> LRUCache:
+        """Return the rendered-fragment cache of ``env`` holding ``maxsize`` items.
+
+        The cache is shared by every display using ``env`` with the same
+        ``maxsize``; displays asking for a different size get their own.
+        """
+        fragments = self._entry(env).fragments
+        cache = fragments.get(maxsize)
+        if cache is None:
+            with self._lock:
+                cache = fragments.setdefault(maxsize, LRUCache(maxsize))
+        return cache
+
+    def stats(self) -> dict[str, dict[str, float]]:
+        """Return hit and miss counts for environments and templates."""
+        return {
+            "environments": self.env_stats.as_dict(),
+            "templates": self.template_stats.as_dict(),
+            "render_plans": self.plan_stats.as_dict(),
+            "fragments": self._fragment_stats().as_dict(),
+        }
+
+    def _fragment_stats(self) -> CacheStats:
+        total = CacheStats()
+        for entry in list(self._templates.values()):
+            for cache in list(entry.fragments.values()):
+                total.hits += cache.stats.hits
+                total.misses += cache.stats.misses
+        return total
+
+    def clear(self) -> None:
+        """Drop all cached environments, templates and counters."""
+        with self._lock:
+            self._envs.clear()
+            self._templates.clear()
+            self.env_stats.reset()
+            self.template_stats.reset()
+            self.plan_stats.reset()
+
+
+registry = TemplateRegistry()
@@ -36,7 +36,13 @@ def test_confirm_password_ajax_validation():
         browser = p.chromium.launch()
         page = browser.new_page()
         page.goto(f"{BASE_URL}/signup")
-        page.locator("input[name=password]").fill("secret12")
+        password = page.locator("input[name=password]")
+        password.fill("secret12")
+        # Let the password validation go out on its own so the confirm
+        # blur is not batched with it.
+        with page.expect_request("**/signup") as first:
+            password.blur()
+        first.value.response()
         confirm = page.locator("input[name=confirm_password]")
         confirm.fill("bad")
         with page.expect_request("**/signup") as req_info:
@@ -53,3 +59,30 @@ def test_confirm_password_ajax_validation():
         assert data["level"] == "error"
         assert data["message"] == "Passwords do not match"
         browser.close()
+
+
+def test_blurs_within_the_window_are_batched():
+    """Fields blurred together are validated in one batch request."""
+    with sync_playwright() as p:
+        browser = p.chromium.launch()
+        page = browser.new_page()
+        page.goto(f"{BASE_URL}/signup")
+        # Set both values without moving the focus, then blur both fields
+        # in the same task so they fall into one batching window.
+        with page.expect_request("**/signup") as req_info:
+            page.evaluate(
+                """() => Object.entries({password: 'secret12', confirm_password: 'bad'})
+                    .forEach(([name, value]) => {
+                        const el = document.querySelector(`[name="${name}"]`);
+                        el.value = value;
+                        el.dispatchEvent(new Event('blur'));
+                    })"""
+            )
+        req = req_info.value
+        assert req.post_data_json == {
+            "fields": {"password": "secret12", "confirm_password": "bad"},
+            "validate": ["password", "confirm_password"],
+        }
+        data = req.response().json()
+        assert data["results"]["confirm_password"]["message"] == "Passwords do not match"
+        browser.close()
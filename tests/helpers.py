@@ -4,6 +4,8 @@
 
 
 SIGNUP_BASE_DATA = {
+    "first_name": "John",
+    "last_name": "Doe",
     "username": "john",
     "password": "secret12",
     "confirm_password": "secret12",
@@ -17,9 +19,35 @@ def step_one_data():
 
 def step_two_data():
     """Return data for the second signup step."""
-    return {**step_one_data(), "email": "john@example.com"}
+    return {**step_one_data(), "email": "john@example.com", "phone": "123456"}
 
 
 def final_step_data():
     """Return data for the final signup submission."""
     return {**step_two_data(), "terms": "on", "submit": "Submit"}
+
+
+class DummyRequest:
+    """Minimal async request-like object used in tests."""
+
+    def __init__(
+        self,
+        method="GET",
+        headers=None,
+        json_data=None,
+        form_data=None,
+        session=None,
+    ):  # pylint: disable=too-many-arguments,too-many-positional-arguments  # test helper
+        self.method = method
+        self.headers = headers or {}
+        self._json_data = json_data or {}
+        self._form_data = form_data or {}
+        self.session = session
+
+    async def json(self):
+        """Return stored JSON data."""
+        return self._json_data
+
+    async def form(self):
+        """Return stored form data."""
+        return self._form_data
@@ -0,0 +1,68 @@
+"""Tests for the static asset pipeline."""
+
+import asyncio
+import gzip
+
+import pyformatic
+from pyformatic.assets import StaticAssets, build_assets, minify_css
+
+
+def _get(app, path, headers=()):
+    """Call the ASGI ``app`` and return status, headers and body."""
+    messages = []
+
+    async def receive():
+        return {"type": "http.request"}
+
+    async def send(message):
+        messages.append(message)
+
+    scope = {"type": "http", "method": "GET", "path": path, "headers": list(headers)}
+    asyncio.run(app(scope, receive, send))
+    start, body = messages[0], messages[1]
+    return start["status"], dict(start["headers"]), body["body"]
+
+
+def test_build_assets_writes_manifest(tmp_path):
+    """Assets are minified, fingerprinted and gzipped."""
+    manifest = build_assets(tmp_path)
+    css = manifest["pyformatic.css"]
+    assert css.startswith("pyformatic.") and css.endswith(".css")
+    data = (tmp_path / css).read_bytes()
+    assert gzip.decompress((tmp_path / f"{css}.gz").read_bytes()) == data
+    assert b"\n" not in data
+    assert minify_css("a {\n  color: red;\n}\n/* x */") == "a{color:red}"
+
+
+def test_header_uses_manifest(tmp_path):
+    """Header, footer and flow pages link to fingerprinted files."""
+    manifest = build_assets(tmp_path)
+    try:
+        pyformatic.Display.use_asset_manifest(tmp_path / "manifest.json")
+        header = pyformatic.Display.header_html("/assets/")
+        assert f'href="/assets/{manifest["pyformatic.css"]}"' in header
+        step = pyformatic.formflow.Step({"name": "s", "fields": []}, None, action="/")
+        html = pyformatic.FormFlow([step]).render(0)
+        assert manifest["pyformatic.js"] in html
+    finally:
+        pyformatic.Display.use_asset_manifest({})
+    assert pyformatic.Display.footer_html() == '<script src="/static/pyformatic.js"></script>'
+
+
+def test_static_handler_serves_precompressed(tmp_path):
+    """Clients accepting gzip get the compressed file with cache headers."""
+    manifest = build_assets(tmp_path)
+    app = StaticAssets(tmp_path)
+    name = manifest["pyformatic.js"]
+    status, headers, body = _get(app, f"/{name}", [(b"accept-encoding", b"gzip, br")])
+    assert status == 200
+    assert headers[b"content-encoding"] == b"gzip"
+    assert b"immutable" in headers[b"cache-control"]
+    assert gzip.decompress(body) == (tmp_path / name).read_bytes()
+
+    status, headers, body = _get(app, f"/{name}")
+    assert b"content-encoding" not in headers
+    assert body == (tmp_path / name).read_bytes()
+
+    status, _, _ = _get(app, "/../manifest.json")
+    assert status == 404
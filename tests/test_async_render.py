@@ -0,0 +1,60 @@
+"""Tests for asynchronous rendering."""
+
+import asyncio
+from pathlib import Path
+
+import pyformatic
+from pyformatic.cli import main
+
+
+def _form(num_fields: int = 3) -> pyformatic.Form:
+    form = pyformatic.Form("f", action="/submit")
+    for idx in range(num_fields):
+        form.add_item(pyformatic.TextInput(name=f"f{idx}", label=f"F{idx}", value="<v>"))
+    form.add_button(pyformatic.Button(name="submit", label="Submit"))
+    return form
+
+
+def test_get_html_async_matches_sync():
+    """Async rendering produces the same markup as ``get_html``."""
+    display = pyformatic.Display(_form())
+    html = asyncio.run(display.get_html_async(hidden_fields={"a": "1"}))
+    assert html == display.get_html(hidden_fields={"a": "1"})
+
+
+def test_render_async_matches_render():
+    """Flow pages render identically in async mode."""
+    yaml_file = Path(__file__).parent.parent / "demo" / "user_signup.yaml"
+    flow = pyformatic.FormFlow.from_yaml(str(yaml_file), action="/signup")
+    messages = {"username": {"level": "error", "message": "Taken"}}
+    html = asyncio.run(flow.render_async(0, messages, {"x": "1"}, csrf_token="t"))
+    assert html == flow.render(0, messages, {"x": "1"}, csrf_token="t")
+
+
+def test_render_async_yields_to_event_loop():
+    """Other tasks make progress while a large form renders."""
+    display = pyformatic.Display(_form(50))
+    ticks = []
+
+    async def ticker():
+        while True:
+            ticks.append(1)
+            await asyncio.sleep(0)
+
+    async def run():
+        task = asyncio.create_task(ticker())
+        await asyncio.sleep(0)
+        start = len(ticks)
+        await display.get_html_async()
+        task.cancel()
+        return len(ticks) - start
+
+    assert asyncio.run(run()) > 10
+
+
+def test_get_html_async_with_compiled_bundle(tmp_path):
+    """Compiled bundles fall back to synchronous template rendering."""
+    bundle = tmp_path / "templates.zip"
+    main(["compile", str(bundle)])
+    display = pyformatic.Display(_form(), compiled_templates=str(bundle))
+    assert asyncio.run(display.get_html_async()) == display.get_html()
@@ -0,0 +1,76 @@
+"""Tests for async validators and concurrent step validation."""
+
+import asyncio
+import time
+
+import pytest
+
+from pyformatic.formflow import FormFlow, Step
+from pyformatic.exceptions import ValidationError
+
+
+def _slow(delay, result=None, error=None):
+    async def check(value):
+        await asyncio.sleep(delay)
+        if error:
+            raise ValidationError(error)
+        return result if result is not None else value
+    return check
+
+
+def test_independent_fields_run_concurrently():
+    """Validating a step takes about as long as its slowest validator."""
+    cfg = {
+        "name": "step",
+        "fields": [{"name": f"f{i}"} for i in range(5)],
+        "validators": {f"f{i}": _slow(0.1) for i in range(5)},
+    }
+    step = Step(cfg, None, action="/")
+    start = time.perf_counter()
+    messages, has_error = asyncio.run(step.validate_async({"f0": "a"}, {}))
+    assert time.perf_counter() - start < 0.3
+    assert has_error is False
+    assert list(messages) == [f"f{i}" for i in range(5)]
+
+
+def test_include_dependencies_are_respected():
+    """A field sees the validated values of the fields it includes."""
+    async def confirm(value, data):
+        await asyncio.sleep(0)
+        if value != data["password"]:
+            raise ValidationError("Mismatch")
+        return value
+
+    cfg = {
+        "name": "step",
+        "fields": [
+            {"name": "confirm", "include": ["password"]},
+            {"name": "password"},
+            {"name": "email"},
+        ],
+        "validators": {"password": _slow(0.05, result="secret"), "confirm": confirm},
+    }
+    step = Step(cfg, None, action="/")
+    assert step.validation_order == (("password", "email"), ("confirm",))
+    data = {"confirm": "secret", "password": " secret "}
+    messages, has_error = asyncio.run(step.validate_async(data, data))
+    assert has_error is False
+    assert list(messages) == ["confirm", "password"]
+    assert data["password"] == "secret"
+
+
+def test_async_validator_through_flow():
+    """Flows await async validators on the request handling path."""
+    cfg = {
+        "name": "step",
+        "fields": [{"name": "user"}],
+        "validators": {"user": _slow(0, error="Taken")},
+    }
+    flow = FormFlow([Step(cfg, None, action="/", is_last=True)])
+    index, messages, has_error = asyncio.run(flow.current_step_async({"user": "bob"}))
+    assert (index, has_error) == (0, True)
+    assert messages["user"]["message"] == "Taken"
+    result = asyncio.run(flow.validate_field_async(0, "user", "bob", {}))
+    assert result == ("bob", "error", "Taken")
+    with pytest.raises(TypeError):
+        flow.current_step({"user": "bob"})
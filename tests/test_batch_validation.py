@@ -0,0 +1,50 @@
+"""Tests for batched multi-field validation requests."""
+
+from pathlib import Path
+import asyncio
+
+import pyformatic
+from tests.helpers import DummyRequest
+
+YAML_FILE = Path(__file__).parent.parent / "demo" / "user_signup.yaml"
+
+
+def _validate(payload):
+    flow = pyformatic.FormFlow.from_yaml(str(YAML_FILE), action="/signup")
+    req = DummyRequest(
+        method="POST",
+        headers={"content-type": "application/json"},
+        json_data=payload,
+    )
+    return asyncio.run(pyformatic.run_form_flow(flow, req))
+
+
+def test_batch_returns_per_field_results():
+    """Fields from different steps are validated in one request."""
+    kind, payload = _validate(
+        {
+            "fields": {
+                "username": "",
+                "password": "secret12",
+                "confirm_password": "other",
+                "email": " john@example.com ",
+            },
+            "validate": ["username", "confirm_password", "email"],
+        }
+    )
+    assert kind == "validation"
+    results = payload["results"]
+    assert list(results) == ["username", "confirm_password", "email"]
+    assert results["username"]["level"] == "error"
+    assert results["username"]["message"] == "Username required"
+    assert results["confirm_password"]["level"] == "error"
+    assert results["email"] == {"level": "ok", "message": "", "value": "john@example.com"}
+
+
+def test_batch_fragments():
+    """Batch results include rendered fields on request."""
+    _, payload = _validate(
+        {"fields": {"username": ""}, "validate": ["username"], "fragment": True}
+    )
+    html = payload["results"]["username"]["html"]
+    assert 'name="username"' in html and "Username required" in html
@@ -0,0 +1,80 @@
+"""Tests for offline bulk validation."""
+
+import json
+
+import pytest
+
+from pyformatic.bulk import load_flow_file, read_records, validate_bulk, validate_records
+from pyformatic.cli import main
+
+FLOW = """\
+module: null
+steps:
+  - name: one
+    fields:
+      - name: email
+        email: true
+        required: true
+  - name: two
+    fields:
+      - name: code
+        validator: |
+          if value == "old":
+              raise ValidationWarning("Deprecated code", value.upper())
+          return value.strip().upper()
+"""
+
+RECORDS = [
+    {"email": "a@b.io", "code": " x "},
+    {"email": "nope", "code": "old", "extra": 1},
+    {"email": "", "code": ""},
+] * 4
+
+
+@pytest.fixture(name="flow_path")
+def fixture_flow_path(tmp_path):
+    """Return the path of a two-step flow file."""
+    path = tmp_path / "flow.yaml"
+    path.write_text(FLOW, encoding="utf-8")
+    return path
+
+
+def test_validate_records(flow_path):
+    """Every step is validated and cleaned values are returned."""
+    ok, bad, empty = list(validate_records(load_flow_file(flow_path), RECORDS[:3]))
+    assert ok == {"row": 1, "level": "ok", "messages": {},
+                  "values": {"email": "a@b.io", "code": "X"}}
+    assert bad["level"] == "error"
+    assert bad["messages"] == {
+        "email": {"level": "error", "message": "Invalid email address"},
+        "code": {"level": "warning", "message": "Deprecated code"},
+    }
+    assert bad["values"] == {"email": "nope", "code": "OLD", "extra": 1}
+    assert empty["messages"]["email"]["message"] == "email required"
+
+
+def test_process_pool_keeps_order(flow_path):
+    """Chunks validated in worker processes come back in input order."""
+    expected = list(validate_bulk(flow_path, iter(RECORDS), workers=0))
+    results = list(validate_bulk(flow_path, iter(RECORDS), workers=2, chunk_size=5))
+    assert results == expected
+    assert [r["row"] for r in results] == list(range(1, len(RECORDS) + 1))
+    with pytest.raises(ValueError):
+        next(validate_bulk(flow_path, RECORDS, chunk_size=0))
+
+
+def test_readers_and_command(flow_path, tmp_path, capsys):
+    """CSV and JSON lines inputs stream to a JSON lines report."""
+    data = tmp_path / "data.csv"
+    data.write_text("email,code\na@b.io,x\nbad,y\n", encoding="utf-8")
+    assert [r["email"] for r in read_records(data)] == ["a@b.io", "bad"]
+    out = tmp_path / "out.jsonl"
+    status = main(["validate-bulk", str(flow_path), str(data), "-o", str(out), "-j", "0"])
+    assert status == 1
+    rows = [json.loads(line) for line in out.read_text(encoding="utf-8").splitlines()]
+    assert [r["level"] for r in rows] == ["ok", "error"]
+    assert "2 rows: 1 ok, 0 info, 0 warning, 1 error" in capsys.readouterr().err
+    lines = tmp_path / "data.jsonl"
+    lines.write_text('{"email": "a@b.io"}\n\n[1]\n', encoding="utf-8")
+    with pytest.raises(ValueError, match="data.jsonl:3"):
+        list(read_records(lines))
@@ -0,0 +1,44 @@
+"""Tests for the persistent template bytecode cache."""
+
+from jinja2 import Environment
+
+import pyformatic
+
+
+def _form() -> pyformatic.Form:
+    form = pyformatic.Form("f", action="/submit")
+    form.add_item(pyformatic.TextInput(name="foo", label="Foo"))
+    return form
+
+
+def test_display_writes_bytecode_cache(tmp_path):
+    """Compiled templates are written to the cache directory."""
+    cache_dir = tmp_path / "bytecode"
+    html = pyformatic.Display(_form(), bytecode_cache_dir=str(cache_dir)).get_html()
+    assert "Foo" in html
+    assert list(cache_dir.glob("pyformatic-*.cache"))
+
+
+def test_cache_invalidated_when_source_changes(tmp_path):
+    """Changed templates are recompiled instead of served from the cache."""
+    tpl_dir = tmp_path / "templates"
+    (tpl_dir / "ui").mkdir(parents=True)
+    override = tpl_dir / "ui" / "input_text.html"
+    override.write_text("<div>FIRST {{ item_name }}</div>")
+    cache_dir = str(tmp_path / "bytecode")
+    env = pyformatic.Display(
+        _form(), template_dirs=[str(tpl_dir)], bytecode_cache_dir=cache_dir
+    ).env
+    assert "FIRST foo" in env.get_template("ui/input_text.html").render(item_name="foo")
+
+    override.write_text("<div>SECOND {{ item_name }}</div>")
+    fresh = Environment(loader=env.loader, bytecode_cache=env.bytecode_cache)
+    assert "SECOND foo" in fresh.get_template("ui/input_text.html").render(item_name="foo")
+
+
+def test_setup_jinja_enables_cache(tmp_path):
+    """``setup_jinja`` can attach a bytecode cache to an application env."""
+    env = Environment()
+    pyformatic.Display.setup_jinja(env, bytecode_cache_dir=str(tmp_path))
+    assert env.bytecode_cache is not None
+    assert "pyformatic_header" in env.globals
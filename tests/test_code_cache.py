@@ -0,0 +1,85 @@
+"""Tests for the inline validator code cache and flow load errors."""
+
+import traceback
+
+import pytest
+
+from pyformatic import FlowConfigError, FormFlow
+from pyformatic.codecache import CodeCache
+
+FLOW = """\
+module: null
+steps:
+  - name: one
+    fields:
+      - name: code
+        label: Code
+        validator: |
+          value = value.strip()
+          {line}
+          return value
+"""
+
+
+def _write(tmp_path, line):
+    path = tmp_path / "flow.yaml"
+    path.write_text(FLOW.format(line=line), encoding="utf-8")
+    return path
+
+
+def test_memory_and_disk_cache(tmp_path):
+    """Source is compiled once per process and reused from disk."""
+    cache = CodeCache(tmp_path / "code")
+    code = cache.compile("x = 1", "flow.yaml")
+    assert cache.compile("x = 1", "flow.yaml") is code
+    assert cache.stats.hits == 1
+    assert len(list((tmp_path / "code").glob("*.marshal"))) == 1
+    other = CodeCache(tmp_path / "code")
+    loaded = other.compile("x = 1", "flow.yaml")
+    assert other.disk_hits == 1
+    assert loaded.co_filename == "flow.yaml"
+    namespace = {}
+    exec(loaded, namespace)  # pylint: disable=exec-used  # checking the cached code runs
+    assert namespace["x"] == 1
+
+
+def test_flows_share_compiled_validators(tmp_path):
+    """Building the same flow again does not recompile its validators."""
+    path = _write(tmp_path, "pass")
+    cache = CodeCache()
+    FormFlow.from_yaml(str(path), "/", code_cache=cache)
+    assert cache.stats.misses == 1
+    flow = FormFlow.from_yaml(str(path), "/", code_cache=cache)
+    assert cache.stats.misses == 1
+    assert cache.stats.hits == 1
+    assert flow.validate_field(0, "code", " x ", {})[0] == "x"
+
+
+def test_syntax_error_reports_file_and_line(tmp_path):
+    """Broken validator source fails at load time with its location."""
+    path = _write(tmp_path, "if value")
+    with pytest.raises(FlowConfigError) as info:
+        FormFlow.from_yaml(str(path), "/", code_cache=CodeCache())
+    assert info.value.line == 9
+    assert str(info.value).startswith(f"{path}:9: invalid validator 'code'")
+
+
+def test_yaml_error_reports_line(tmp_path):
+    """Malformed YAML is reported as a flow configuration error."""
+    path = tmp_path / "flow.yaml"
+    path.write_text("module: null\nsteps: [\n  - name\n", encoding="utf-8")
+    with pytest.raises(FlowConfigError) as info:
+        FormFlow.from_yaml(str(path), "/")
+    assert info.value.source == str(path)
+    assert info.value.line is not None
+
+
+def test_traceback_points_into_flow_file(tmp_path):
+    """Runtime errors in inline validators show the flow file line."""
+    path = _write(tmp_path, "raise RuntimeError('boom')")
+    flow = FormFlow.from_yaml(str(path), "/", code_cache=CodeCache())
+    with pytest.raises(RuntimeError) as info:
+        flow.validate_field(0, "code", "x", {})
+    frame = traceback.extract_tb(info.value.__traceback__)[-1]
+    assert frame.filename == str(path)
+    assert frame.lineno == 9
@@ -0,0 +1,43 @@
+"""Tests for ahead-of-time compiled template bundles."""
+
+from jinja2 import ModuleLoader
+
+import pyformatic
+from pyformatic.cli import main
+
+
+def _form() -> pyformatic.Form:
+    form = pyformatic.Form("f", action="/submit")
+    form.add_item(pyformatic.TextInput(name="foo", label="Foo"))
+    form.add_button(pyformatic.Button(name="submit", label="Submit"))
+    return form
+
+
+def test_compile_command_writes_bundle(tmp_path):
+    """The CLI compiles bundled templates into a zip usable by Display."""
+    bundle = tmp_path / "templates.zip"
+    assert main(["compile", str(bundle)]) == 0
+    display = pyformatic.Display(_form(), compiled_templates=str(bundle))
+    assert isinstance(display.env.loader, ModuleLoader)
+    expected = pyformatic.Display(_form()).get_html()
+    assert display.get_html() == expected
+
+
+def test_compiled_bundle_includes_template_dirs(tmp_path):
+    """User template directories override built-ins inside the bundle."""
+    ui_dir = tmp_path / "tpl" / "ui"
+    ui_dir.mkdir(parents=True)
+    (ui_dir / "input_text.html").write_text("<div>COMPILED {{ item_name }}</div>")
+    bundle = tmp_path / "modules"
+    main(["compile", str(bundle), "-t", str(tmp_path / "tpl"), "--format", "modules"])
+    (ui_dir / "input_text.html").unlink()
+
+    step = pyformatic.formflow.Step(
+        {"name": "step", "fields": [{"name": "foo", "label": "Foo"}]},
+        None,
+        action="/",
+    )
+    flow = pyformatic.FormFlow([step], compiled_templates=str(bundle))
+    html = flow.render(0)
+    assert "COMPILED foo" in html
+    assert "pyformatic.js" in html
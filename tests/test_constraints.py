@@ -0,0 +1,80 @@
+"""Tests for declarative field constraints."""
+
+import pytest
+
+from pyformatic.constraints import compile_constraints
+from pyformatic.exceptions import ValidationError
+from pyformatic.step import Step
+
+
+def _error(check, value):
+    with pytest.raises(ValidationError) as info:
+        check(value)
+    return info.value.message
+
+
+def test_no_constraints():
+    """Fields without constraints get no checker."""
+    assert compile_constraints({"name": "a", "label": "A"}) is None
+    assert compile_constraints({"name": "a", "required": False}) is None
+
+
+def test_text_constraints():
+    """Length, pattern, email and choices are checked in order."""
+    check = compile_constraints(
+        {"name": "code", "label": "Code", "required": True, "min_length": 2,
+         "max_length": 4, "pattern": r"[A-Z]+"}
+    )
+    assert _error(check, "  ") == "Code required"
+    assert _error(check, "A") == "Must be at least 2 characters"
+    assert _error(check, "ABCDE") == "Must be at most 4 characters"
+    assert _error(check, "ab") == "Invalid format"
+    assert check("ABC") == "ABC"
+    email = compile_constraints({"name": "e", "email": True})
+    assert email("") == ""
+    assert _error(email, "nope") == "Invalid email address"
+    assert email("a@b.io") == "a@b.io"
+    choice = compile_constraints({"name": "c", "choices": ["red", 1]})
+    assert choice("1") == "1"
+    assert _error(choice, "blue") == "Invalid choice"
+
+
+def test_numeric_ranges_and_messages():
+    """Ranges parse numbers; messages can be replaced per constraint."""
+    check = compile_constraints(
+        {"name": "age", "min": 18, "max": 120, "messages": {"min": "Too young"}}
+    )
+    assert _error(check, "x") == "Must be a number"
+    assert _error(check, "17") == "Too young"
+    assert _error(check, "121") == "Must be at most 120"
+    assert check("42") == "42"
+
+
+def test_zero_limits_are_constraints():
+    """Limits of zero are compiled like any other limit."""
+    qty = compile_constraints({"name": "qty", "min": 0})
+    assert _error(qty, "-5") == "Must be at least 0"
+    assert _error(qty, "abc") == "Must be a number"
+    assert qty("0") == "0"
+    assert _error(compile_constraints({"name": "n", "max": 0}), "5") == "Must be at most 0"
+    assert compile_constraints({"name": "t", "min_length": 0})("") == ""
+    assert compile_constraints({"name": "t", "min_length": 0})("x") == "x"
+
+
+def test_constraints_compose_with_custom_validators():
+    """Constraints run first, then the field's own validator."""
+    cfg = {
+        "name": "s",
+        "fields": [
+            {"name": "user", "label": "User", "required": True, "max_length": 5,
+             "validator": "return value.lower()"},
+            {"name": "age", "min": 1},
+        ],
+    }
+    step = Step(cfg, None, action="/")
+    assert step.validate_field("user", "", {})[1:] == ("error", "User required")
+    assert step.validate_field("user", "toolong", {})[2] == "Must be at most 5 characters"
+    assert step.validate_field("user", "BOB", {}) == ("bob", "ok", "")
+    messages, has_error = step.validate({"user": "Ann", "age": "0"}, {})
+    assert has_error is True
+    assert messages["age"]["message"] == "Must be at least 1"
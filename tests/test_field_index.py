@@ -0,0 +1,77 @@
+"""Tests for the precomputed field name index."""
+
+from types import SimpleNamespace
+
+from pyformatic.formflow import FormFlow, Step
+
+
+def _config(num_steps: int, num_fields: int) -> dict:
+    return {
+        "module": None,
+        "steps": [
+            {
+                "name": f"step{s}",
+                "fields": [
+                    {
+                        "name": f"s{s}_f{f}",
+                        "label": f"Field {f}",
+                        "validator": "if not value:\n    raise ValidationError('Required')",
+                    }
+                    for f in range(num_fields)
+                ]
+                + [{"name": f"s{s}_raw", "type": "raw_html", "html": "<hr>"}],
+            }
+            for s in range(num_steps)
+        ],
+    }
+
+
+def test_step_index_for_field():
+    """Field names map to their step; unknown names fall back to step 0."""
+    flow = FormFlow.from_config(_config(3, 4), action="/")
+    assert flow.step_index_for_field("s2_f3") == 2
+    assert flow.step_index_for_field("s1_f0") == 1
+    assert flow.step_index_for_field("s1_raw") == 0
+    assert flow.step_index_for_field("missing") == 0
+    assert flow.steps[1].field_names == ("s1_f0", "s1_f1", "s1_f2", "s1_f3")
+
+
+def test_field_refs_and_arity():
+    """Validators are resolved once with their call signature."""
+    cfg = {
+        "name": "step",
+        "fields": [{"name": "a"}, {"name": "b"}, {"name": "c"}],
+        "validators": {"a": lambda value: value.upper(), "b": lambda value, data: data["x"]},
+    }
+    step = Step(cfg, None, action="/")
+    assert step.fields["a"].arity == 1
+    assert step.fields["b"].arity == 2
+    assert step.fields["c"].validator is None
+    assert step.fields["a"].item is step.form.items[0]
+    assert step.validate_field("a", "hi", {})[0] == "HI"
+    assert step.validate_field("b", "hi", {"x": "data"})[0] == "data"
+
+
+def test_validators_added_after_indexing_are_used():
+    """Validators assigned after the first lookup are picked up."""
+    flow = FormFlow([Step({"name": "s", "fields": [{"name": "a"}]}, None, action="/")])
+    step = flow.steps[0]
+    assert flow.validate_field(0, "a", "x", {})[0] == "x"
+    step.validator.a = lambda value: value + "!"
+    assert flow.validate_field(0, "a", "x", {})[0] == "x!"
+    step.validator = SimpleNamespace(a=lambda value: value + "?")
+    assert flow.validate_field(0, "a", "x", {})[0] == "x?"
+    step.validator.a = lambda value: value + "#"
+    assert flow.validate_field(0, "a", "x", {})[0] == "x#"
+    del step.validator.a
+    assert flow.validate_field(0, "a", "x", {})[0] == "x"
+
+
+def test_current_step_uses_index():
+    """``current_step`` walks steps using the indexed field names."""
+    flow = FormFlow.from_config(_config(3, 2), action="/")
+    data = {"s0_f0": "a", "s0_f1": "b", "s1_f0": "", "s1_f1": "c"}
+    index, messages, has_error = flow.current_step(data)
+    assert (index, has_error) == (1, True)
+    assert messages["s1_f0"] == {"level": "error", "message": "Required", "value": ""}
+    assert "Required" in flow.render(index, messages, data)
@@ -0,0 +1,87 @@
+"""Tests for precompiled flow bundles."""
+
+import traceback
+
+import pytest
+
+from pyformatic import FlowConfigError, FormFlow
+from pyformatic.bundle import build_bundle, load_bundle
+from pyformatic.cli import main
+from pyformatic.codecache import CodeCache
+
+FLOW = """\
+module: null
+show_progress: true
+steps:
+  - name: one
+    fields:
+      - name: code
+        label: Code
+        required: true
+        validator: |
+          if value == "boom":
+              raise RuntimeError(value)
+          return value.upper()
+  - name: two
+    fields:
+      - name: note
+"""
+
+
+def _flow(tmp_path):
+    path = tmp_path / "flow.yaml"
+    path.write_text(FLOW, encoding="utf-8")
+    return path
+
+
+def test_bundle_contents(tmp_path):
+    """A bundle carries the config and compiled validators."""
+    bundle = load_bundle(build_bundle(_flow(tmp_path)))
+    assert bundle["source"] == str(tmp_path / "flow.yaml")
+    assert bundle["config"]["steps"][0]["fields"][0]["label"] == "Code"
+    assert len(bundle["code"]) == 1
+
+
+def test_from_bundle_matches_yaml(tmp_path):
+    """Flows loaded from a bundle validate without compiling anything."""
+    path = _flow(tmp_path)
+    cache = CodeCache()
+    flow = FormFlow.from_bundle(build_bundle(path), "/", code_cache=cache)
+    assert cache.stats.misses == 0
+    assert flow.show_progress
+    assert flow.validate_field(0, "code", "ab", {})[:2] == ("AB", "ok")
+    assert flow.validate_field(0, "code", "", {})[1:] == ("error", "Code required")
+    assert flow.step_index_for_field("note") == 1
+    with pytest.raises(RuntimeError) as info:
+        flow.validate_field(0, "code", "boom", {})
+    frame = traceback.extract_tb(info.value.__traceback__)[-1]
+    assert (frame.filename, frame.lineno) == (str(path), 11)
+
+
+def test_bundle_errors(tmp_path):
+    """Broken flows fail to build; foreign files fail to load."""
+    path = tmp_path / "bad.yaml"
+    path.write_text("module: null\nsteps:\n  - name: s\n    validators:\n      x: 'if'\n",
+                    encoding="utf-8")
+    with pytest.raises(FlowConfigError, match=r"bad.yaml:5: invalid validator 'x'"):
+        build_bundle(path)
+    with pytest.raises(FlowConfigError, match="not a flow bundle"):
+        FormFlow.from_bundle(path, "/")
+    flow = _flow(tmp_path)
+    bundle = build_bundle(flow)
+    flow.write_text(FLOW.replace("Code", "Other"), encoding="utf-8")
+    with pytest.raises(FlowConfigError, match="changed since the bundle was built"):
+        FormFlow.from_bundle(bundle, "/")
+    flow.unlink()
+    assert FormFlow.from_bundle(bundle, "/").num_steps == 2
+
+
+def test_bundle_command(tmp_path, capsys):
+    """``python -m pyformatic bundle`` writes one bundle per flow."""
+    path = _flow(tmp_path)
+    assert main(["bundle", str(path), "-o", str(tmp_path / "out")]) == 0
+    assert (tmp_path / "out" / "flow.bundle").exists()
+    assert "flow.bundle" in capsys.readouterr().out
+    (tmp_path / "bad.yaml").write_text("steps: [", encoding="utf-8")
+    assert main(["bundle", str(tmp_path / "bad.yaml")]) == 1
+    assert "bad.yaml:" in capsys.readouterr().err
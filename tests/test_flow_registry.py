@@ -0,0 +1,48 @@
+"""Tests for the compiled flow registry."""
+
+import os
+
+import yaml
+
+import pyformatic
+
+
+def _write(path, label):
+    cfg = {
+        "module": None,
+        "steps": [{"name": "step", "fields": [{"name": "user", "label": label}]}],
+    }
+    path.write_text(yaml.dump(cfg))
+
+
+def test_flow_loaded_once(tmp_path):
+    """Repeated lookups return the same compiled flow."""
+    yaml_file = tmp_path / "flow.yaml"
+    _write(yaml_file, "User")
+    flows = pyformatic.FlowRegistry()
+    first = flows.get(yaml_file, action="/a")
+    assert flows.get(str(yaml_file), action="/a") is first
+    assert flows.get(yaml_file, action="/b") is not first
+    metrics = flows.metrics()
+    assert metrics["loads"] == 2
+    assert metrics["hits"] == 1
+    assert metrics["load_seconds"] > 0
+
+
+def test_flow_reloaded_when_content_changes(tmp_path):
+    """Only real content changes trigger a reload."""
+    yaml_file = tmp_path / "flow.yaml"
+    _write(yaml_file, "User")
+    flows = pyformatic.FlowRegistry()
+    first = flows.get(yaml_file, action="/")
+
+    stat = yaml_file.stat()
+    os.utime(yaml_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+    assert flows.get(yaml_file, action="/") is first
+
+    _write(yaml_file, "Login")
+    os.utime(yaml_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 2 * 10**9))
+    second = flows.get(yaml_file, action="/")
+    assert second is not first
+    assert second.steps[0].form.items[0].label == "Login"
+    assert flows.metrics()["reloads"] == 1
@@ -5,32 +5,7 @@ import asyncio
 
 import pyformatic
 from tests import helpers
-
-
-class DummyRequest:
-    """Minimal async request-like object used in tests."""
-
-    def __init__(
-        self,
-        method="GET",
-        headers=None,
-        json_data=None,
-        form_data=None,
-        session=None,
-    ):  # pylint: disable=too-many-arguments,too-many-positional-arguments  # test helper
-        self.method = method
-        self.headers = headers or {}
-        self._json_data = json_data or {}
-        self._form_data = form_data or {}
-        self.session = session
-
-    async def json(self):
-        """Return stored JSON data."""
-        return self._json_data
-
-    async def form(self):
-        """Return stored form data."""
-        return self._form_data
+from tests.helpers import DummyRequest
 
 
 def test_run_form_flow_complete():
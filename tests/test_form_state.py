@@ -0,0 +1,71 @@
+"""Tests for per-request form state and concurrent use of one flow."""
+
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+import asyncio
+import copy
+
+import pyformatic
+from pyformatic.state import FormState
+from tests.helpers import DummyRequest
+
+YAML_FILE = Path(__file__).parent.parent / "demo" / "user_signup.yaml"
+
+
+def _snapshot(flow):
+    return [copy.deepcopy(step.form.items) for step in flow.steps]
+
+
+def test_flow_does_not_mutate_definitions():
+    """Validation and rendering leave the shared forms untouched."""
+    flow = pyformatic.FormFlow.from_yaml(str(YAML_FILE), action="/signup")
+    before = _snapshot(flow)
+    index, messages, has_error = flow.current_step({"username": " ", "password": "1"})
+    assert (index, has_error) == (0, True)
+    html = flow.render(index, messages, {"username": " "})
+    assert "Username required" in html
+    req = DummyRequest(
+        method="POST",
+        headers={"content-type": "application/json"},
+        json_data={"field": "username", "value": "", "fragment": True},
+    )
+    asyncio.run(pyformatic.run_form_flow(flow, req))
+    assert _snapshot(flow) == before
+    assert "Username required" not in flow.render(0)
+
+
+def test_state_overlay_rendering():
+    """State values, messages and levels override element attributes."""
+    form = pyformatic.Form("f", action="/submit")
+    item = pyformatic.TextInput(name="a", label="A", value="base")
+    item.classes_outer.append("custom")
+    form.add_item(item)
+    state = FormState()
+    state.set("a", value="mine", level="warning", message="Careful")
+    html = pyformatic.Display(form).get_html(state=state)
+    assert 'value="mine"' in html
+    assert 'class="custom warning"' in html
+    assert "Careful" in html
+    assert item.value == "base"
+    assert item.classes_outer == ["custom"]
+
+
+def test_concurrent_renders_are_isolated():
+    """One flow instance renders correct per-request output from many threads."""
+    flow = pyformatic.FormFlow.from_yaml(
+        str(YAML_FILE), action="/signup", fragment_cache_size=64, render_plan=True
+    )
+
+    def work(idx):
+        name = f"user{idx}"
+        data = {"username": name, "password": "x", "confirm_password": "y"}
+        step, messages, _ = flow.current_step(dict(data))
+        html = flow.render(step, messages, data)
+        assert f'value="{name}"' in html
+        assert "Password must be at least 6 characters" in html
+        others = {f'value="user{j}"' for j in range(200) if j != idx}
+        assert not any(other in html for other in others)
+        return idx
+
+    with ThreadPoolExecutor(max_workers=16) as pool:
+        assert sorted(pool.map(work, range(200))) == list(range(200))
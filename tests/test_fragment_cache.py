@@ -0,0 +1,82 @@
+"""Tests for the rendered item fragment cache."""
+
+import asyncio
+import os
+
+from pyformatic.cache import LRUCache
+import pyformatic
+
+
+def _form() -> pyformatic.Form:
+    form = pyformatic.Form("f", action="/submit")
+    form.add_item(pyformatic.TextInput(name="a", label="A"))
+    form.add_item(pyformatic.TextInput(name="b", label="B"))
+    return form
+
+
+def test_lru_cache_evicts_oldest():
+    """Least recently used entries are evicted first."""
+    cache = LRUCache(2)
+    cache.set("a", 1)
+    cache.set("b", 2)
+    assert cache.get("a") == 1
+    cache.set("c", 3)
+    assert cache.get("b") is None
+    assert cache.get("a") == 1
+    assert cache.stats.hits == 2
+    assert cache.stats.misses == 1
+
+
+def test_unchanged_items_served_from_cache(tmp_path):
+    """Re-rendering an unchanged form hits the cache for every item."""
+    form = _form()
+    dirs = [str(tmp_path)]
+    display = pyformatic.Display(form, template_dirs=dirs, fragment_cache_size=16)
+    first = display.get_html()
+    assert display.fragments.stats.misses == 2
+    again = pyformatic.Display(form, template_dirs=dirs, fragment_cache_size=16)
+    assert again.get_html() == first
+    assert display.fragments.stats.hits == 2
+
+    form.items[0].value = "changed"
+    html = again.get_html()
+    assert 'value="changed"' in html
+    assert display.fragments.stats.misses == 3
+
+
+def test_displays_with_other_sizes_get_their_own_cache(tmp_path):
+    """A display asking for another size does not resize a shared cache."""
+    dirs = [str(tmp_path)]
+    small = pyformatic.Display(_form(), template_dirs=dirs, fragment_cache_size=1)
+    large = pyformatic.Display(_form(), template_dirs=dirs, fragment_cache_size=16)
+    same = pyformatic.Display(_form(), template_dirs=dirs, fragment_cache_size=16)
+    assert small.fragments is not large.fragments
+    assert large.fragments is same.fragments
+    assert (small.fragments.maxsize, large.fragments.maxsize) == (1, 16)
+
+
+def test_unhashable_context_is_rendered_uncached(tmp_path):
+    """Items whose context cannot be hashed skip the caches."""
+    form = _form()
+    form.items[0].options = [("a", {"x", "y"})]
+    dirs = [str(tmp_path)]
+    for options in ({"fragment_cache_size": 16}, {"render_plan": True}):
+        display = pyformatic.Display(form, template_dirs=dirs, **options)
+        assert 'name="a"' in display.get_html()
+        assert 'name="a"' in asyncio.run(display.get_html_async())
+
+
+def test_cache_invalidated_when_template_changes(tmp_path):
+    """Edited templates produce fresh fragments."""
+    ui_dir = tmp_path / "ui"
+    ui_dir.mkdir()
+    override = ui_dir / "input_text.html"
+    override.write_text("<div>OLD {{ item_name }}</div>")
+    display = pyformatic.Display(
+        _form(), template_dirs=[str(tmp_path)], fragment_cache_size=16
+    )
+    assert "OLD a" in display.get_html()
+    override.write_text("<div>NEW {{ item_name }}</div>")
+    stat = override.stat()
+    os.utime(override, (stat.st_atime, stat.st_mtime + 5))
+    assert "NEW a" in display.get_html()
@@ -0,0 +1,76 @@
+"""Tests for lazily built steps and deferred validator imports."""
+
+import sys
+
+import pytest
+
+from pyformatic import FlowConfigError, FormFlow
+
+VALIDATOR = """\
+class Validator:
+    def {field}(self, value):
+        return value.upper()
+"""
+
+
+@pytest.fixture(name="config")
+def fixture_config(tmp_path, monkeypatch):
+    """Return a two-step flow whose validators live in a fresh package."""
+    package = tmp_path / "lazyapp"
+    (package / "validators").mkdir(parents=True)
+    (package / "__init__.py").write_text("", encoding="utf-8")
+    (package / "validators" / "__init__.py").write_text("", encoding="utf-8")
+    for step, field in (("one", "a"), ("two", "b")):
+        (package / "validators" / f"{step}.py").write_text(
+            VALIDATOR.format(field=field), encoding="utf-8"
+        )
+    monkeypatch.syspath_prepend(str(tmp_path))
+    for name in [m for m in sys.modules if m.startswith("lazyapp")]:
+        monkeypatch.delitem(sys.modules, name)
+    yield {
+        "module": "lazyapp",
+        "steps": [
+            {"name": "one", "fields": [{"name": "a"}]},
+            {"name": "two", "fields": [{"name": "b"}]},
+        ],
+    }
+    for name in [m for m in sys.modules if m.startswith("lazyapp")]:
+        del sys.modules[name]
+
+
+def test_steps_built_on_demand(config):
+    """Rendering builds one step; validating imports only its module."""
+    flow = FormFlow.from_config(config, "/")
+    assert not flow.steps.is_loaded(0)
+    assert flow.step_index_for_field("b") == 1
+    assert flow.form_ids() == ("one", "two")
+    assert 'id="one"' in flow.render(0)
+    assert flow.steps.is_loaded(0) and not flow.steps[0].loaded
+    assert "lazyapp.validators.one" not in sys.modules
+    assert flow.current_step({"a": "x"}) == (1, None, False)
+    assert "lazyapp.validators.one" in sys.modules
+    assert "lazyapp.validators.two" not in sys.modules
+    assert not flow.steps.is_loaded(1)
+    assert flow.validate_field(1, "b", "y", {})[0] == "Y"
+    assert flow.steps[1].pool is flow.offload_pool
+
+
+def test_explicit_warmup(config):
+    """``warmup`` builds every step and imports every validator module."""
+    config["warmup"] = True
+    flow = FormFlow.from_config(config, "/")
+    assert all(step.loaded for step in flow.steps)
+    assert "lazyapp.validators.two" in sys.modules
+
+
+def test_syntax_errors_still_reported_at_load():
+    """Inline validators of unbuilt steps are compiled when loading."""
+    cfg = {
+        "module": None,
+        "steps": [
+            {"name": "one", "fields": [{"name": "a"}]},
+            {"name": "two", "fields": [{"name": "b", "validator": "return ("}]},
+        ],
+    }
+    with pytest.raises(FlowConfigError, match="invalid validator 'b'"):
+        FormFlow.from_config(cfg, "/")
@@ -0,0 +1,202 @@
+"""Tests for running sync validators in a worker pool."""
+
+import asyncio
+import functools
+import os
+import sys
+import threading
+import time
+
+import pytest
+
+from pyformatic.exceptions import ValidationError
+from pyformatic.formflow import FormFlow, Step
+from pyformatic.memo import uncached
+from pyformatic.offload import ValidatorPool, offload
+
+
+def check_strength(value):
+    """Module-level validator usable from a process pool."""
+    if len(value) < 8:
+        raise ValidationError("Too weak", value.strip())
+    return value.upper()
+
+
+def _flow(validators, fields, **options):
+    cfg = {"name": "step", "fields": fields, "validators": validators}
+    return FormFlow([Step(cfg, None, action="/", is_last=True)], **options)
+
+
+def test_marked_validator_runs_off_the_event_loop():
+    """A slow sync validator does not block other coroutines."""
+    threads = []
+
+    def slow(value):
+        threads.append(threading.current_thread().name)
+        time.sleep(0.2)
+        return value
+
+    flow = _flow({"pw": slow}, [{"name": "pw", "offload": True}])
+    ticks = []
+
+    async def ticker():
+        for _ in range(5):
+            ticks.append(time.perf_counter())
+            await asyncio.sleep(0.02)
+
+    async def main():
+        await asyncio.gather(flow.validate_field_async(0, "pw", "x", {}), ticker())
+
+    asyncio.run(main())
+    assert threads[0].startswith("pyformatic-validator")
+    assert len(ticks) == 5 and ticks[-1] - ticks[0] < 0.19
+    metrics = flow.offload_pool.metrics()
+    assert metrics["completed"] == 1 and metrics["queue_depth"] == 0
+    assert metrics["exec_seconds"] >= 0.2
+    flow.offload_pool.shutdown()
+
+
+def test_unmarked_validators_stay_inline():
+    """Only marked fields are offloaded unless the whole flow opts in."""
+    seen = {}
+
+    def record(name):
+        def check(value):
+            seen[name] = threading.current_thread() is threading.main_thread()
+            return value
+        return check
+
+    flow = _flow(
+        {"a": record("a"), "b": record("b")},
+        [{"name": "a", "offload": True}, {"name": "b"}],
+    )
+    asyncio.run(flow.current_step_async({"a": "1", "b": "2"}))
+    assert seen == {"a": False, "b": True}
+    everything = _flow({"b": record("b")}, [{"name": "b"}], offload_all=True)
+    asyncio.run(everything.current_step_async({"b": "2"}))
+    assert seen["b"] is False
+    assert everything.offload_pool.metrics()["max_queue_depth"] == 1
+
+
+def test_decorator_and_yaml_config():
+    """``@offload`` marks module validators; YAML configures the pool."""
+    class Validator:  # pylint: disable=too-few-public-methods  # validator stub
+        """Validator with one offloaded method."""
+
+        @offload
+        def pw(self, value):
+            """Return the value."""
+            return value
+
+    step = Step({"name": "s", "fields": [{"name": "pw"}]}, None, action="/")
+    step.validator = Validator()
+    step.reindex()
+    assert step.fields["pw"].offload is True
+    cfg = {
+        "module": None,
+        "offload": {"kind": "process", "max_workers": 2, "all": True},
+        "steps": [{"name": "s", "fields": [{"name": "pw"}]}],
+    }
+    flow = FormFlow.from_config(cfg, "/")
+    assert (flow.offload_pool.kind, flow.offload_pool.max_workers) == ("process", 2)
+    assert flow.steps[0].offload_all is True
+    with pytest.raises(ValueError):
+        ValidatorPool("fiber")
+
+
+def strip(func):
+    """Decorator standing in for a user's own ``functools.wraps`` decorator."""
+    @functools.wraps(func)
+    def wrapper(self, value):
+        return func(self, value.strip())
+    return wrapper
+
+
+def test_decorated_methods_keep_self_and_markers():
+    """Markers are found above other decorators and ``self`` is kept."""
+    class Validator:
+        """Validator whose methods use other decorators too."""
+
+        suffix = "!"
+
+        @offload
+        @uncached
+        @strip
+        def pw(self, value):
+            """Marked above another decorator."""
+            return value + self.suffix
+
+        @strip
+        @offload
+        def code(self, value):
+            """Marked below another decorator."""
+            return value + self.suffix
+
+    step = Step({"name": "s", "fields": [{"name": "pw"}, {"name": "code"}]}, None, action="/")
+    step.validator = Validator()
+    step.reindex()
+    assert step.fields["pw"].offload and not step.fields["pw"].cacheable
+    assert step.fields["code"].offload
+    flow = FormFlow([step])
+    assert asyncio.run(flow.validate_field_async(0, "pw", " a ", {}))[0] == "a!"
+    assert asyncio.run(flow.validate_field_async(0, "code", " b ", {}))[0] == "b!"
+    assert flow.offload_pool.metrics()["completed"] == 2
+    flow.offload_pool.shutdown()
+
+
+def test_process_pool_keeps_validation_messages():
+    """Results and validation messages survive the trip from a process."""
+    flow = _flow(
+        {"pw": check_strength},
+        [{"name": "pw"}],
+        offload_pool=ValidatorPool("process", max_workers=1),
+        offload_all=True,
+    )
+    assert asyncio.run(flow.validate_field_async(0, "pw", "longenough", {}))[0] == "LONGENOUGH"
+    result = asyncio.run(flow.validate_field_async(0, "pw", " short ", {}))
+    assert result == ("short", "error", "Too weak")
+    flow.offload_pool.shutdown()
+
+
+MIXED_VALIDATOR = """\
+import os
+
+from pyformatic.offload import offload
+
+
+class Validator:
+    @offload
+    def pw(self, value):
+        return f"{value}:{os.getpid()}"
+"""
+
+
+def test_process_pool_with_mixed_step(tmp_path, monkeypatch):
+    """Module methods run in a worker next to inline validators and context."""
+    package = tmp_path / "mixedapp"
+    (package / "validators").mkdir(parents=True)
+    (package / "__init__.py").write_text("", encoding="utf-8")
+    (package / "validators" / "__init__.py").write_text("", encoding="utf-8")
+    (package / "validators" / "s.py").write_text(MIXED_VALIDATOR, encoding="utf-8")
+    monkeypatch.syspath_prepend(str(tmp_path))
+    cfg = {
+        "module": "mixedapp",
+        "offload": {"kind": "process", "max_workers": 1, "all": True},
+        "steps": [{
+            "name": "s",
+            "fields": [{"name": "pw"}, {"name": "note", "validator": "return value.upper()"}],
+        }],
+    }
+    flow = FormFlow.from_config(cfg, "/", validator_context={"lock": threading.Lock()})
+    try:
+        idx, errors, _ = asyncio.run(flow.current_step_async({"pw": "a", "note": "b"}))
+        assert (idx, errors) == (1, None)
+        assert flow.validate_field(0, "pw", "a", {})[0] == f"a:{os.getpid()}"
+        pw, _, message = asyncio.run(flow.validate_field_async(0, "pw", "a", {}))
+        assert message == "" and pw.startswith("a:") and pw != f"a:{os.getpid()}"
+        assert asyncio.run(flow.validate_field_async(0, "note", "b", {}))[0] == "B"
+        assert flow.offload_pool.metrics()["completed"] == 2
+    finally:
+        flow.offload_pool.shutdown()
+        for name in [m for m in sys.modules if m.startswith("mixedapp")]:
+            del sys.modules[name]
@@ -0,0 +1,52 @@
+"""Tests for single-field fragment rendering."""
+
+from pathlib import Path
+import asyncio
+
+import pytest
+
+import pyformatic
+from tests.helpers import DummyRequest
+
+
+def _flow() -> pyformatic.FormFlow:
+    yaml_file = Path(__file__).parent.parent / "demo" / "user_signup.yaml"
+    return pyformatic.FormFlow.from_yaml(str(yaml_file), action="/signup")
+
+
+def test_display_render_item():
+    """Only the requested field wrapper is returned."""
+    form = pyformatic.Form("f", action="/submit")
+    form.add_item(pyformatic.TextInput(name="a", label="A"))
+    form.add_item(pyformatic.TextInput(name="b", label="B", value="x"))
+    html = pyformatic.Display(form).render_item("b")
+    assert html.startswith("<div")
+    assert 'name="b"' in html
+    assert 'name="a"' not in html
+    assert "<form" not in html
+    with pytest.raises(KeyError):
+        pyformatic.Display(form).render_item("missing")
+
+
+def test_flow_render_field_applies_messages():
+    """Messages and stored values are reflected in the fragment."""
+    flow = _flow()
+    messages = {"username": {"level": "error", "message": "Taken"}}
+    html = flow.render_field(0, "username", messages, {"username": "bob"})
+    assert 'class="error"' in html
+    assert "Taken" in html
+    assert 'value="bob"' in html
+
+
+def test_ajax_validation_returns_fragment():
+    """Validation requests asking for a fragment receive the field HTML."""
+    req = DummyRequest(
+        method="POST",
+        headers={"content-type": "application/json"},
+        json_data={"field": "username", "value": "", "fragment": True},
+    )
+    state, payload = asyncio.run(pyformatic.run_form_flow(_flow(), req))
+    assert state == "validation"
+    assert payload["level"] == "error"
+    assert "Username required" in payload["html"]
+    assert 'class="error"' in payload["html"]
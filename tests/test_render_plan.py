@@ -0,0 +1,94 @@
+"""Tests for cached render plans."""
+
+from pathlib import Path
+
+import pyformatic
+from pyformatic.render_plan import build_plan
+from pyformatic.templating import PLAN_CACHE_SIZE, PLAN_MISS_LIMIT, registry
+
+
+def _elements_form() -> pyformatic.Form:
+    yaml_file = Path(__file__).parent.parent / "demo" / "elements.yaml"
+    flow = pyformatic.FormFlow.from_yaml(str(yaml_file), action="/elements")
+    return flow.steps[0].form
+
+
+def test_plan_output_matches_jinja():
+    """Planned renders produce exactly the Jinja output for all field types."""
+    form = _elements_form()
+    form.items[1].value = "<b>bold</b>"
+    form.items[1].message = "Fix 'this' & that"
+    form.items[1].classes_outer.append("error")
+    expected = pyformatic.Display(form).get_html(hidden_fields={"a": "1"})
+    for _ in range(2):
+        html = pyformatic.Display(form, render_plan=True).get_html(hidden_fields={"a": "1"})
+        assert html == expected
+
+
+def test_plan_reused_across_values():
+    """Changing dynamic values reuses the plan built for the item."""
+    form = pyformatic.Form("f", action="/submit")
+    item = pyformatic.TextInput(name="foo", label="Foo")
+    form.add_item(item)
+    pyformatic.Display(form, render_plan=True).get_html()
+    misses = registry.plan_stats.misses
+    item.value = "changed"
+    item.message = "note"
+    html = pyformatic.Display(form, render_plan=True).get_html()
+    assert registry.plan_stats.misses == misses
+    assert 'value="changed"' in html
+    assert "note" in html
+
+
+def test_value_dependent_template_is_not_planned():
+    """Templates whose structure depends on a slot are rejected."""
+    env = registry.environment()
+    tpl = env.from_string("{% if value %}yes{% endif %}{{ value }}")
+    assert build_plan(tpl.render, {"value": True}) is None
+    raw = env.from_string("<p>{{ value|safe }}</p>")
+    assert build_plan(raw.render, {"value": True}) is None
+
+
+def test_per_request_attributes_share_a_plan():
+    """Form actions and input classes are slots, not part of the key."""
+    form = pyformatic.Form("f", action="/submit?step=1")
+    item = pyformatic.TextInput(name="foo", label="Foo")
+    form.add_item(item)
+    pyformatic.Display(form, render_plan=True).get_html()
+    misses = registry.plan_stats.misses
+    form.action = "/submit?step=2"
+    item.classes_input.append("is-invalid")
+    html = pyformatic.Display(form, render_plan=True).get_html()
+    assert registry.plan_stats.misses == misses
+    assert 'action="/submit?step=2"' in html and 'class="is-invalid"' in html
+
+
+def test_unique_forms_stop_planning():
+    """Plans are bounded and a template that never hits is not planned."""
+    display = None
+    for i in range(PLAN_MISS_LIMIT + 10):
+        form = pyformatic.Form(f"dyn{i}", action="/")
+        form.add_item(pyformatic.TextInput(name=f"field{i}", label=f"Field {i}"))
+        display = pyformatic.Display(form, render_plan=True)
+        assert f'name="field{i}"' in display.get_html()
+    entry = registry._entry(display.env)  # pylint: disable=protected-access  # inspect the cache
+    assert len(entry.plans) <= PLAN_CACHE_SIZE
+    misses = registry.plan_stats.misses
+    display.get_html()
+    assert registry.plan_stats.misses == misses
+
+
+def test_large_forms_are_planned_in_one_render():
+    """A first render plans every item, even for forms rendered alternately."""
+    forms = []
+    for name in ("big_a", "big_b"):
+        form = pyformatic.Form(name, action="/")
+        for i in range(PLAN_MISS_LIMIT * 20):
+            form.add_item(pyformatic.TextInput(name=f"{name}{i}", label=f"Field {i}"))
+        forms.append(form)
+    for form in forms:
+        pyformatic.Display(form, render_plan=True).get_html()
+    misses = registry.plan_stats.misses
+    for form in forms * 2:
+        pyformatic.Display(form, render_plan=True).get_html()
+    assert registry.plan_stats.misses == misses
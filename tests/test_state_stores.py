@@ -0,0 +1,149 @@
+"""Tests for server-side flow state stores."""
+
+from pathlib import Path
+import asyncio
+import sqlite3
+import time
+
+import pyformatic
+from pyformatic.stores import MemoryStateStore, SQLiteStateStore
+from tests import helpers
+from tests.helpers import DummyRequest
+
+YAML_FILE = Path(__file__).parent.parent / "demo" / "user_signup.yaml"
+
+
+class FakeClock:  # pylint: disable=too-few-public-methods  # callable test clock
+    """Manually advanced clock."""
+
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+
+def test_memory_store_ttl_and_lru():
+    """Entries expire after the TTL and the oldest are evicted first."""
+    clock = FakeClock()
+    store = MemoryStateStore(2, ttl=10, clock=clock)
+    store.save("a", {"x": "1"})
+    loaded = store.load("a")
+    loaded["x"] = "changed"
+    assert store.load("a") == {"x": "1"}
+    store.save("b", {})
+    store.save("c", {})
+    assert store.load("a") is None
+    clock.now += 11
+    assert store.load("b") is None
+    assert len(store) == 1
+    store.delete("c")
+    assert len(store) == 0
+
+
+def test_sqlite_store_batches_writes(tmp_path):
+    """Writes are buffered until the batch is full but are readable at once."""
+    path = str(tmp_path / "state.db")
+    clock = FakeClock()
+    store = SQLiteStateStore(path, batch_size=3, flush_interval=60, clock=clock)
+
+    def rows():
+        with sqlite3.connect(path) as conn:
+            return conn.execute("SELECT COUNT(*) FROM flow_state").fetchone()[0]
+
+    store.save("a", {"x": "1"})
+    store.save("b", {"x": "2"})
+    assert rows() == 0
+    assert store.load("a") == {"x": "1"}
+    store.delete("b")
+    assert store.load("b") is None
+    assert rows() == 0
+    store.save("c", {})
+    assert rows() == 2
+    store.close()
+    reopened = SQLiteStateStore(path, clock=clock)
+    assert reopened.load("a") == {"x": "1"}
+    reopened.close()
+
+
+def test_sqlite_store_writes_through_by_default(tmp_path):
+    """Default stores commit at once; batched ones flush on a timer."""
+    path = str(tmp_path / "state.db")
+    store = SQLiteStateStore(path)
+    other = SQLiteStateStore(path)
+    asyncio.run(store.save_async("a", {"x": "1"}))
+    assert asyncio.run(other.load_async("a")) == {"x": "1"}
+    batched = SQLiteStateStore(path, batch_size=10, flush_interval=0.05)
+    batched.save("b", {"x": "2"})
+    assert other.load("b") is None
+    deadline = time.monotonic() + 5
+    while other.load("b") is None and time.monotonic() < deadline:
+        time.sleep(0.01)
+    assert other.load("b") == {"x": "2"}
+    for each in (store, other, batched):
+        each.close()
+    batched.close()
+
+
+def test_sqlite_store_evicts_expired_rows(tmp_path):
+    """Expired rows are hidden immediately and deleted on a later flush."""
+    clock = FakeClock()
+    store = SQLiteStateStore(
+        str(tmp_path / "state.db"), ttl=5, batch_size=1, evict_interval=30, clock=clock
+    )
+    store.save("old", {"x": "1"})
+    clock.now += 10
+    assert store.load("old") is None
+    clock.now += 30
+    store.save("new", {"x": "2"})
+    count = store._conn.execute(  # pylint: disable=protected-access  # inspect table
+        "SELECT COUNT(*) FROM flow_state"
+    ).fetchone()[0]
+    assert count == 1
+    store.close()
+
+
+def _run(flow, store, session, method="GET", data=None):
+    req = DummyRequest(
+        method=method,
+        headers={"content-type": "application/x-www-form-urlencoded"},
+        form_data={**(data or {}), "csrf_token": session.get("_pyformatic_csrf_token", "")},
+        session=session,
+    )
+    return asyncio.run(pyformatic.run_form_flow(flow, req, state_store=store))
+
+
+def test_run_form_flow_keeps_state_on_server():
+    """Only the state id travels with the session; GET shows the saved step."""
+    flow = pyformatic.FormFlow.from_yaml(str(YAML_FILE), action="/signup")
+    store = MemoryStateStore()
+    session = {}
+    _run(flow, store, session)
+    kind, html = _run(flow, store, session, "POST", helpers.step_one_data())
+    assert kind == "form" and "step_two" in html
+    assert 'type="hidden" name="username"' not in html
+    assert len(store) == 1
+
+    kind, html = _run(flow, store, session)
+    assert "step_two" in html
+
+    kind, html = _run(flow, store, session, "POST", {"email": "not-an-email", "phone": "1"})
+    assert "Invalid email" in html
+    calls = []
+    validator = flow.steps[1].validator
+    original = validator.email
+    validator.email = lambda *args: calls.append(args) or original(*args)
+    flow.steps[1].reindex()
+    kind, html = _run(flow, store, session)
+    assert not calls
+    validator.email = original
+    flow.steps[1].reindex()
+    assert 'value="not-an-email"' in html and "Invalid email" in html
+
+    kind, html = _run(flow, store, session, "POST", {"email": "john@example.com", "phone": "1"})
+    assert "step_three" in html
+    kind, data = _run(flow, store, session, "POST", {"terms": "on", "submit": "Submit"})
+    assert kind == "complete"
+    assert data["username"] == "john" and data["email"] == "john@example.com"
+    assert len(store) == 0
+    assert not [key for key in session if key.startswith("_pyformatic_flow_")]
@@ -0,0 +1,88 @@
+"""Tests for carrying flow data in a signed state token."""
+
+from pathlib import Path
+import asyncio
+import re
+
+import pytest
+
+import pyformatic
+from pyformatic.signing import STATE_FIELD, BadSignature, Signer
+from tests import helpers
+from tests.helpers import DummyRequest
+
+YAML_FILE = Path(__file__).parent.parent / "demo" / "user_signup.yaml"
+
+
+def _flow(**options):
+    return pyformatic.FormFlow.from_yaml(
+        str(YAML_FILE), action="/signup", secret_key="s3cret", state_token=True, **options
+    )
+
+
+def _post(flow, data):
+    req = DummyRequest(
+        method="POST",
+        headers={"content-type": "application/x-www-form-urlencoded"},
+        form_data=data,
+    )
+    return asyncio.run(pyformatic.run_form_flow(flow, req))
+
+
+def _token(html):
+    return re.search(rf'name="{STATE_FIELD}" value="([^"]+)"', html).group(1)
+
+
+def test_signer_round_trip_and_tampering():
+    """Tokens decode with the same key only."""
+    signer = Signer("key")
+    token = signer.dumps({"a": "1", "b": ["x"]})
+    assert signer.loads(token) == {"a": "1", "b": ["x"]}
+    with pytest.raises(BadSignature):
+        Signer("other").loads(token)
+    with pytest.raises(BadSignature):
+        signer.loads("A" + token)
+    with pytest.raises(BadSignature):
+        signer.loads("!!!.sig")
+
+
+def test_state_token_requires_secret_key():
+    """The mode is rejected without a key to sign with."""
+    with pytest.raises(ValueError):
+        pyformatic.FormFlow([], state_token=True)
+
+
+def test_flow_carries_data_in_one_field():
+    """Earlier answers travel in the token instead of hidden inputs."""
+    flow = _flow()
+    kind, html = _post(flow, helpers.step_one_data())
+    assert kind == "form" and "step_two" in html
+    assert 'type="hidden" name="username"' not in html
+    assert html.count('type="hidden"') == 1
+    carried = flow.decode_state(_token(html))
+    assert carried["username"] == "john"
+
+    kind, html = _post(flow, {STATE_FIELD: _token(html), "email": "john@example.com", "phone": "1"})
+    assert kind == "form" and "step_three" in html
+    assert "email" in flow.decode_state(_token(html))
+
+    kind, data = _post(flow, {STATE_FIELD: _token(html), "terms": "on", "submit": "Submit"})
+    assert kind == "complete"
+    assert data["username"] == "john" and data["email"] == "john@example.com"
+    assert STATE_FIELD not in data
+
+
+def test_visible_fields_are_left_out_of_the_token():
+    """Fields shown on the rendered step are posted by their own inputs."""
+    flow = _flow()
+    html = flow.render(1, data_store={"username": "john", "email": "x@example.com"})
+    assert flow.decode_state(_token(html)) == {"username": "john"}
+
+
+def test_tampered_token_is_ignored():
+    """An altered token does not contribute data."""
+    flow = _flow()
+    _, html = _post(flow, helpers.step_one_data())
+    token = _token(html).replace("A", "B", 1)
+    kind, html = _post(flow, {STATE_FIELD: token, "email": "john@example.com", "phone": "1"})
+    assert kind == "form" and "step_one" in html
@@ -0,0 +1,102 @@
+"""Tests for signed per-step completion digests."""
+
+from collections import Counter
+
+from pyformatic.formflow import FormFlow, Step
+from pyformatic.signing import DIGEST_FIELD, Signer
+
+
+def _flow(calls: Counter, secret_key="s3cret") -> FormFlow:
+    def make(name):
+        def check(value):
+            calls[name] += 1
+            return value.strip()
+        return check
+
+    steps = [
+        Step(
+            {
+                "name": f"step{idx}",
+                "fields": [{"name": f"f{idx}"}],
+                "validators": {f"f{idx}": make(f"f{idx}")},
+            },
+            None,
+            action="/",
+            is_last=idx == 2,
+        )
+        for idx in range(3)
+    ]
+    return FormFlow(steps, secret_key=secret_key)
+
+
+def _post(flow, data_store, **fields):
+    data_store.update(fields)
+    return flow.current_step(data_store)
+
+
+def test_completed_steps_are_not_revalidated():
+    """Only the newly submitted step runs its validators."""
+    calls = Counter()
+    flow = _flow(calls)
+    data = {}
+    assert _post(flow, data, f0=" a ") == (1, None, False)
+    assert data["f0"] == "a"
+    assert DIGEST_FIELD in data
+    assert _post(flow, data, f1="b") == (2, None, False)
+    assert _post(flow, data, f2="c") == (3, None, False)
+    assert calls == Counter(f0=1, f1=1, f2=1)
+    assert data == {"f0": "a", "f1": "b", "f2": "c"}
+
+
+def test_changed_or_tampered_steps_are_revalidated():
+    """A changed value or a forged digest triggers validation again."""
+    calls = Counter()
+    flow = _flow(calls)
+    data = {}
+    _post(flow, data, f0="a")
+    _post(flow, data, f1="b")
+    _post(flow, data, f0="changed")
+    assert calls == Counter(f0=2, f1=2)
+    first, second = data[DIGEST_FIELD].split(".")
+    forged = Signer("other", salt="pyformatic.steps").digest(0, "step0", "", {"f0": "changed"})
+    data[DIGEST_FIELD] = f"{forged}.{second}"
+    _post(flow, data)
+    assert calls == Counter(f0=3, f1=2)
+    assert data[DIGEST_FIELD].split(".") == [first, second]
+
+
+def test_digest_round_trips_as_hidden_field():
+    """The digest field is rendered with the other carried values."""
+    flow = _flow(Counter())
+    data = {}
+    index, messages, _ = _post(flow, data, f0="a")
+    html = flow.render(index, messages, data)
+    assert f'name="{DIGEST_FIELD}" value="{data[DIGEST_FIELD]}"' in html
+
+
+def test_without_secret_key_everything_is_revalidated():
+    """Digests are opt-in."""
+    calls = Counter()
+    flow = _flow(calls, secret_key=None)
+    data = {}
+    _post(flow, data, f0="a")
+    _post(flow, data, f1="b")
+    assert DIGEST_FIELD not in data
+    assert calls == Counter(f0=2, f1=1)
+
+
+def test_unsubmitted_fields_stay_absent():
+    """Signed and unsigned flows complete with the same data."""
+    results = []
+    for secret_key in ("s3cret", None):
+        step = Step(
+            {"name": "only", "fields": [{"name": "email"}, {"name": "promo"}]},
+            None,
+            action="/",
+            is_last=True,
+        )
+        data = {}
+        assert _post(FormFlow([step], secret_key=secret_key), data, email="a@b.io")[0] == 1
+        data.pop(DIGEST_FIELD, None)
+        results.append(data)
+    assert results[0] == results[1] == {"email": "a@b.io"}
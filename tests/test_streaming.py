@@ -0,0 +1,32 @@
+"""Tests for generator based HTML rendering."""
+
+from pathlib import Path
+import types
+
+import pyformatic
+
+
+def test_display_iter_html_matches_get_html():
+    """Joined chunks equal the non-streaming output."""
+    form = pyformatic.Form("f", action="/submit")
+    form.add_item(pyformatic.TextInput(name="foo", label="Foo", value="<x>"))
+    form.add_item(pyformatic.RawElement(name="raw", label="", html="<hr>"))
+    form.add_button(pyformatic.Button(name="submit", label="Submit"))
+    display = pyformatic.Display(form)
+    hidden = {"token": "a&b"}
+    chunks = display.iter_html(hidden_fields=hidden)
+    assert isinstance(chunks, types.GeneratorType)
+    chunks = list(chunks)
+    assert len(chunks) > 3
+    assert "".join(chunks) == display.get_html(hidden_fields=hidden)
+
+
+def test_render_iter_matches_render():
+    """Flow pages stream the same HTML as ``render``."""
+    yaml_file = Path(__file__).parent.parent / "demo" / "user_signup.yaml"
+    flow = pyformatic.FormFlow.from_yaml(str(yaml_file), action="/signup")
+    messages = {"username": {"level": "error", "message": "Taken", "value": "bob"}}
+    data = {"username": "bob"}
+    streamed = "".join(flow.render_iter(0, messages, data, csrf_token="tok"))
+    assert streamed == flow.render(0, messages, data, csrf_token="tok")
+    assert "error-banner" in streamed
@@ -0,0 +1,40 @@
+"""Tests for the shared template registry."""
+
+import pyformatic
+from pyformatic.templating import TemplateRegistry, registry
+
+
+def test_display_instances_share_environment():
+    """Displays with the same search path reuse one environment."""
+    form = pyformatic.Form("f", action="/submit")
+    first = pyformatic.Display(form)
+    second = pyformatic.Display(form)
+    assert first.env is second.env
+    flow_env = pyformatic.FormFlow([]).env
+    assert flow_env is first.env
+
+
+def test_input_template_fallback_is_cached():
+    """Missing per-type templates resolve to the default once."""
+    reg = TemplateRegistry()
+    env = reg.environment()
+    tpl = reg.input_template(env, "email")
+    assert tpl.name == "ui/input.html"
+    assert reg.input_template(env, "email") is tpl
+    assert reg.template_stats.hits == 1
+    assert reg.template_stats.misses == 1
+
+
+def test_stats_report_hits_and_misses(tmp_path):
+    """Repeated renders are served from the cache."""
+    form = pyformatic.Form("f", action="/submit")
+    form.add_item(pyformatic.TextInput(name="foo", label="Foo"))
+    form.add_button(pyformatic.Button(name="submit", label="Submit"))
+    dirs = [str(tmp_path)]
+    pyformatic.Display(form, template_dirs=dirs).get_html()
+    before = registry.stats()
+    pyformatic.Display(form, template_dirs=dirs).get_html()
+    after = registry.stats()
+    assert after["environments"]["hits"] == before["environments"]["hits"] + 1
+    assert after["templates"]["misses"] == before["templates"]["misses"]
+    assert after["templates"]["hits"] > before["templates"]["hits"]
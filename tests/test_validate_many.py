@@ -0,0 +1,103 @@
+"""Tests for column-at-a-time validation."""
+
+import asyncio
+
+import pytest
+
+from pyformatic import ValidationError
+from pyformatic.bulk import validate_records
+from pyformatic.formflow import FormFlow
+from pyformatic.step import Step
+
+
+class Validator:
+    """Validator with a batch form for ``code`` only."""
+
+    def __init__(self):
+        self.batches = []
+
+    def code(self, value):
+        """Per-value form, not used when the batch form exists."""
+        raise AssertionError("batch form expected")
+
+    def validate_many_code(self, values, data_columns):
+        """Upper-case codes and reject those matching ``other``."""
+        self.batches.append(list(values))
+        levels = ["error" if v == o else "ok" for v, o in zip(values, data_columns["other"])]
+        messages = ["Same as other" if level == "error" else "" for level in levels]
+        return [v.upper() for v in values], levels, messages
+
+    def other(self, value, data_store):
+        """Per-value validator that sees the row's data."""
+        if value == "bad":
+            raise ValidationError("Bad other", data_store["code"] + "!")
+        return value
+
+
+def _step():
+    step = Step(
+        {"name": "s", "fields": [{"name": "code", "max_length": 3}, {"name": "other"}]},
+        None,
+        action="/",
+    )
+    step.validator = Validator()
+    step.reindex()
+    return step
+
+
+def test_batch_form_after_constraints():
+    """Constraints run per value; the batch sees only passing values."""
+    step = _step()
+    cleaned, levels, messages = step.validate_many(
+        "code", ["ab", "toolong", "x"], {"other": ["zz", "y", "x"]}
+    )
+    assert step.validator.batches == [["ab", "x"]]
+    assert cleaned == ["AB", "toolong", "X"]
+    assert levels == ["ok", "error", "error"]
+    assert messages == ["", "Must be at most 3 characters", "Same as other"]
+
+
+def test_per_value_fallback():
+    """Validators without a batch form are called once per row."""
+    step = _step()
+    cleaned, levels, messages = step.validate_many(
+        "other", ["fine", "bad"], {"code": ["a", "b"]}
+    )
+    assert cleaned == ["fine", "b!"]
+    assert levels == ["ok", "error"]
+    assert messages == ["", "Bad other"]
+    flow = FormFlow([Step({"name": "t", "fields": [{"name": "free"}]}, None, action="/")])
+    assert flow.validate_many(0, "free", ["a"]) == (["a"], [None], [""])
+
+
+def test_bulk_uses_batch_form():
+    """Bulk validation hands each chunk's column to the batch form."""
+    step = _step()
+    records = [{"code": "ab", "other": "x"}, {"code": "q", "other": "bad"}] * 3
+    results = list(validate_records(FormFlow([step]), records, chunk_size=4))
+    assert [len(batch) for batch in step.validator.batches] == [4, 2]
+    assert results[1]["values"] == {"code": "Q", "other": "Q!"}
+    assert results[1]["messages"] == {"other": {"level": "error", "message": "Bad other"}}
+
+
+def test_async_validators_use_the_async_batch_path():
+    """``validate_many_async`` awaits async validators for every value."""
+    async def check(value, data_store):
+        if value == data_store["other"]:
+            raise ValidationError("Same as other", value.upper())
+        return value.strip()
+
+    step = Step(
+        {"name": "a", "fields": [{"name": "f", "validator": check}, {"name": "other"}]},
+        None,
+        action="/",
+    )
+    with pytest.raises(TypeError, match="validate_many_async"):
+        step.validate_many("f", ["x"])
+    flow = FormFlow([step])
+    result = asyncio.run(flow.validate_many_async(0, "f", [" a ", "b"], {"other": ["z", "b"]}))
+    assert result == (["a", "B"], ["ok", "error"], ["", "Same as other"])
+    records = [{"f": " a ", "other": "z"}, {"f": "b", "other": "b"}]
+    results = list(validate_records(flow, records))
+    assert [r["values"]["f"] for r in results] == ["a", "B"]
+    assert results[1]["messages"] == {"f": {"level": "error", "message": "Same as other"}}
@@ -0,0 +1,110 @@
+"""Tests for per-session memoization of validation results."""
+
+from collections import Counter
+import asyncio
+
+import pyformatic
+from pyformatic.csrf import ensure_csrf_token
+from pyformatic.exceptions import ValidationError
+from pyformatic.formflow import FormFlow, Step
+from pyformatic.memo import uncached
+from tests.helpers import DummyRequest
+
+
+def _flow(calls: Counter) -> FormFlow:
+    def user(value):
+        calls["user"] += 1
+        if value == "taken":
+            raise ValidationError("Taken")
+        return value
+
+    def confirm(value, data):
+        calls["confirm"] += 1
+        return value if value == data["pw"] else None
+
+    @uncached
+    def volatile(value):
+        calls["volatile"] += 1
+        return value
+
+    cfg = {
+        "name": "step",
+        "fields": [
+            {"name": "user"},
+            {"name": "pw"},
+            {"name": "confirm", "include": ["pw"]},
+            {"name": "volatile"},
+            {"name": "flag", "cacheable": False},
+        ],
+        "validators": {
+            "user": user,
+            "confirm": confirm,
+            "volatile": volatile,
+            "flag": lambda value: calls.update(["flag"]),
+        },
+    }
+    return FormFlow([Step(cfg, None, action="/", is_last=True)], validation_memo=32)
+
+
+def _blur(flow, session, field, value, **fields):
+    req = DummyRequest(
+        method="POST",
+        headers={"content-type": "application/json"},
+        json_data={"field": field, "value": value, "fields": fields},
+        session=session,
+    )
+    return asyncio.run(pyformatic.run_form_flow(flow, req))[1]
+
+
+def test_repeated_blurs_hit_the_memo():
+    """Unchanged values are validated once, including their error message."""
+    calls = Counter()
+    flow = _flow(calls)
+    session = {}
+    assert _blur(flow, session, "user", "taken")["message"] == "Taken"
+    assert _blur(flow, session, "user", "taken")["message"] == "Taken"
+    assert _blur(flow, session, "user", "free")["level"] == "ok"
+    assert calls["user"] == 2
+    _blur(flow, session, "confirm", "a", pw="a")
+    _blur(flow, session, "confirm", "a", pw="a")
+    _blur(flow, session, "confirm", "a", pw="b")
+    assert calls["confirm"] == 2
+
+
+def test_opt_out_and_session_isolation():
+    """Non-cacheable validators always run; sessions do not share results."""
+    calls = Counter()
+    flow = _flow(calls)
+    session = {}
+    for _ in range(2):
+        _blur(flow, session, "volatile", "x")
+        _blur(flow, session, "flag", "x")
+    _blur(flow, session, "user", "bob")
+    _blur(flow, {}, "user", "bob")
+    assert calls == Counter(volatile=2, flag=2, user=2)
+
+
+def test_step_submit_reuses_blur_results():
+    """The full-step pass on submit consults the same memo."""
+    calls = Counter()
+    flow = _flow(calls)
+    session = {}
+    _blur(flow, session, "user", "bob")
+    _blur(flow, session, "confirm", "pw", pw="pw")
+    req = DummyRequest(
+        method="POST",
+        headers={"content-type": "application/x-www-form-urlencoded"},
+        form_data={
+            "user": "bob",
+            "pw": "pw",
+            "confirm": "pw",
+            "volatile": "v",
+            "flag": "f",
+            "csrf_token": ensure_csrf_token(session),
+        },
+        session=session,
+    )
+    kind, _ = asyncio.run(pyformatic.run_form_flow(flow, req))
+    assert kind == "complete"
+    assert calls == Counter(user=1, confirm=1, volatile=1, flag=1)
+    assert len(flow.memo) == 1